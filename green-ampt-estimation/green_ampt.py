@@ -62,9 +62,9 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     )
     
     parser.add_argument("--mupolygon", default=None, help="Path to local SSURGO mupolygon shapefile")
-    parser.add_argument("--mapunit", default=None, help="Path to local SSURGO mapunit.txt file")
-    parser.add_argument("--component", default=None, help="Path to local SSURGO component.txt file")
-    parser.add_argument("--chorizon", default=None, help="Path to local SSURGO chorizon.txt file")
+    parser.add_argument("--mapunit", default=None, help="Path to local SSURGO mapunit table (.txt or .parquet)")
+    parser.add_argument("--component", default=None, help="Path to local SSURGO component table (.txt or .parquet)")
+    parser.add_argument("--chorizon", default=None, help="Path to local SSURGO chorizon table (.txt or .parquet)")
     
     # Surface window: 0-10 cm by default for infiltration-excess modeling
     parser.add_argument(
@@ -75,6 +75,24 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     )
     
     parser.add_argument("--pysda-timeout", type=int, default=300, help="Timeout (seconds) for PySDA requests")
+    parser.add_argument(
+        "--pysda-chunk-size",
+        type=int,
+        default=None,
+        help="Send the SDA spatial query this many AOI features at a time (default: whole AOI in one request)",
+    )
+    parser.add_argument(
+        "--pysda-max-workers",
+        type=int,
+        default=None,
+        help="Number of SDA requests to run concurrently (default: 1)",
+    )
+    parser.add_argument(
+        "--pysda-simplify-tolerance",
+        type=float,
+        default=None,
+        help="Simplify the AOI sent to SDA by this many metres; clipping still uses the exact AOI (default: off)",
+    )
     
     # Persist raw fetches for QA/repro by default
     export_group = parser.add_mutually_exclusive_group()
@@ -91,6 +109,12 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         help="Do not persist the fetched SSURGO datasets",
     )
     parser.set_defaults(export_raw_data=True)
+    parser.add_argument(
+        "--raw-data-format",
+        choices=["csv", "parquet"],
+        default="csv",
+        help="Format for raw SSURGO exports: shapefile + pipe-delimited text, or (Geo)Parquet (requires pyarrow)",
+    )
     
     parser.add_argument(
         "--raw-data-dir",
@@ -98,6 +122,19 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         help="Directory to store raw SSURGO datasets; defaults to <output-dir>/raw_data",
     )
     
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Directory for cached PySDA downloads and aggregated soil tables reused across runs (requires pyarrow)",
+    )
+
+    parser.add_argument(
+        "--no-overviews",
+        dest="build_overviews",
+        action="store_false",
+        help="Do not build internal overviews in the output GeoTIFFs",
+    )
+
     parser.add_argument(
         "--log-level",
         choices=["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"],
@@ -190,10 +227,22 @@ def build_config(args: argparse.Namespace) -> PipelineConfig:
             config.depth_limit_cm = args.depth_limit_cm
         if hasattr(args, 'pysda_timeout') and args.pysda_timeout is not None:
             config.pysda_timeout = args.pysda_timeout
+        if getattr(args, 'pysda_chunk_size', None):
+            config.pysda_chunk_size = args.pysda_chunk_size
+        if getattr(args, 'pysda_max_workers', None):
+            config.pysda_max_workers = args.pysda_max_workers
+        if getattr(args, 'pysda_simplify_tolerance', None):
+            config.pysda_simplify_tolerance = args.pysda_simplify_tolerance
         if hasattr(args, 'export_raw_data'):
             config.export_raw_data = args.export_raw_data
         if hasattr(args, 'raw_data_dir') and args.raw_data_dir:
             config.raw_data_dir = Path(args.raw_data_dir)
+        if getattr(args, 'raw_data_format', 'csv') != 'csv':
+            config.raw_data_format = args.raw_data_format
+        if getattr(args, 'cache_dir', None):
+            config.cache_dir = Path(args.cache_dir)
+        if not getattr(args, 'build_overviews', True):
+            config.build_overviews = False
         if hasattr(args, 'param_method') and args.param_method:
             config.use_lookup_table = args.param_method == "lookup"
             config.use_hsg_lookup = args.param_method == "hsg"
@@ -233,11 +282,17 @@ def build_config(args: argparse.Namespace) -> PipelineConfig:
         data_source=args.data_source,
         local_ssurgo=local_paths,
         pysda_timeout=args.pysda_timeout,
+        pysda_chunk_size=args.pysda_chunk_size,
+        pysda_max_workers=args.pysda_max_workers or 1,
+        pysda_simplify_tolerance=args.pysda_simplify_tolerance,
         depth_limit_cm=args.depth_limit_cm,
         export_raw_data=args.export_raw_data,
         raw_data_dir=Path(args.raw_data_dir) if args.raw_data_dir else None,
+        raw_data_format=args.raw_data_format,
         use_lookup_table=use_lookup_table,
         use_hsg_lookup=use_hsg_lookup,
+        cache_dir=Path(args.cache_dir) if args.cache_dir else None,
+        build_overviews=args.build_overviews,
     )
 
 
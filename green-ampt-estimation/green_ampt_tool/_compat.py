@@ -1,7 +1,21 @@
 from __future__ import annotations
 
+from importlib.util import find_spec
 from typing import TYPE_CHECKING, Optional, Any
 
+try:  # pragma: no cover - numba is an optional accelerator
+    from numba import njit as _numba_njit  # type: ignore
+except ImportError:  # pragma: no cover
+    _numba_njit = None
+
+NUMBA_AVAILABLE = _numba_njit is not None
+
+# pyarrow is optional and heavy to import, so only its presence is checked here.
+PYARROW_AVAILABLE = find_spec("pyarrow") is not None
+# pyogrio (the geopandas >= 1.0 default I/O engine) can return feature IDs,
+# which masked reads need to restore layer order.
+PYOGRIO_AVAILABLE = find_spec("pyogrio") is not None
+
 if TYPE_CHECKING:  # pragma: no cover - only for type checkers
     import geopandas as gpd  # type: ignore
     import pandas as pd  # type: ignore
@@ -35,3 +49,12 @@ def require_pandas() -> Any:
     if pd is None:  # type: ignore[name-defined]
         raise ModuleNotFoundError("pandas is required for this operation") from PANDAS_IMPORT_ERROR
     return pd  # type: ignore[return-value]
+
+
+def njit(*args: Any, **kwargs: Any) -> Any:
+    """Return ``numba.njit`` when numba is installed, else a no-op decorator."""
+    if _numba_njit is not None:
+        return _numba_njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+    return lambda func: func
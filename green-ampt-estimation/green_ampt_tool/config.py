@@ -2,17 +2,26 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Callable, Literal, Optional, Union
+
+from ._compat import PYARROW_AVAILABLE
+
+
+class PipelineCancelled(RuntimeError):
+    """Raised when ``PipelineConfig.cancel_check`` asks the pipeline to stop."""
 
 
 @dataclass
 class LocalSSURGOPaths:
-    """File system locations for SSURGO datasets previously downloaded by the user."""
+    """File system locations for SSURGO datasets previously downloaded by the user.
 
-    mupolygon: Path
-    mapunit: Path
-    component: Path
-    chorizon: Path
+    Strings are accepted and become resolved ``Path`` objects in ``resolve``.
+    """
+
+    mupolygon: Union[str, Path]
+    mapunit: Union[str, Path]
+    component: Union[str, Path]
+    chorizon: Union[str, Path]
 
     def resolve(self) -> "LocalSSURGOPaths":
         self.mupolygon = self._ensure_path(self.mupolygon)
@@ -22,7 +31,7 @@ class LocalSSURGOPaths:
         return self
 
     @staticmethod
-    def _ensure_path(value: Path) -> Path:
+    def _ensure_path(value: Union[str, Path]) -> Path:
         path = Path(value).expanduser().resolve()
         if not path.exists():
             raise FileNotFoundError(f"SSURGO file not found: {path}")
@@ -31,22 +40,35 @@ class LocalSSURGOPaths:
 
 @dataclass
 class PipelineConfig:
-    """Runtime configuration for the Green-Ampt pipeline."""
+    """Runtime configuration for the Green-Ampt pipeline.
+
+    Path fields accept strings; ``__post_init__`` turns them into resolved ``Path`` objects.
+    """
 
-    aoi_path: Path
-    output_dir: Path
+    aoi_path: Union[str, Path]
+    output_dir: Union[str, Path]
     output_resolution: float = 10.0
     output_crs: Optional[str] = None
     output_prefix: str = ""
     data_source: Literal["local", "pysda"] = "pysda"
     local_ssurgo: Optional[LocalSSURGOPaths] = None
     pysda_timeout: int = 300
+    pysda_chunk_size: Optional[int] = None  # AOI features per SDA spatial request; None sends the whole AOI
+    pysda_max_workers: int = 1  # Concurrent SDA requests
+    pysda_simplify_tolerance: Optional[float] = None  # Metres; simplify the SDA query geometry (clipping stays exact)
     depth_limit_cm: float = 10.0
     export_raw_data: bool = True
-    raw_data_dir: Optional[Path] = None
+    raw_data_dir: Optional[Union[str, Path]] = None
+    raw_data_format: Literal["csv", "parquet"] = "csv"  # Parquet is smaller and faster but needs pyarrow
     use_lookup_table: bool = True
     use_hsg_lookup: bool = False
     aoi_layer: Optional[str] = None  # Layer name for multi-layer formats
+    cache_dir: Optional[Union[str, Path]] = None  # Reuse aggregated soil tables across runs
+    build_overviews: bool = True  # Internal overviews for fast pan/zoom in GIS viewers
+    # Polled between pipeline stages; returning True stops the run with PipelineCancelled
+    cancel_check: Optional[Callable[[], bool]] = field(default=None, repr=False, compare=False)
+    # Called as progress_cb(percent, message) after each stage and each raster written
+    progress_cb: Optional[Callable[[float, str], None]] = field(default=None, repr=False, compare=False)
     raster_dir: Path = field(init=False)
     vector_dir: Path = field(init=False)
 
@@ -69,6 +91,15 @@ class PipelineConfig:
         if self.depth_limit_cm <= 0:
             raise ValueError("depth_limit_cm must be positive")
 
+        if self.pysda_chunk_size is not None and self.pysda_chunk_size <= 0:
+            raise ValueError("pysda_chunk_size must be positive")
+
+        if self.pysda_max_workers < 1:
+            raise ValueError("pysda_max_workers must be at least 1")
+
+        if self.pysda_simplify_tolerance is not None and self.pysda_simplify_tolerance < 0:
+            raise ValueError("pysda_simplify_tolerance cannot be negative")
+
         self.output_prefix = self.output_prefix.strip()
 
         self.raster_dir = (self.output_dir / "rasters").resolve()
@@ -77,6 +108,11 @@ class PipelineConfig:
         self.vector_dir = (self.output_dir / "vectors").resolve()
         self.vector_dir.mkdir(parents=True, exist_ok=True)
 
+        if self.raw_data_format not in ("csv", "parquet"):
+            raise ValueError("raw_data_format must be 'csv' or 'parquet'")
+        if self.export_raw_data and self.raw_data_format == "parquet" and not PYARROW_AVAILABLE:
+            raise ValueError("raw_data_format='parquet' requires pyarrow; install it or use 'csv'")
+
         if self.export_raw_data:
             if self.raw_data_dir is not None:
                 self.raw_data_dir = Path(self.raw_data_dir).expanduser().resolve()
@@ -85,6 +121,10 @@ class PipelineConfig:
             self.raw_data_dir.mkdir(parents=True, exist_ok=True)
         else:
             self.raw_data_dir = None
+
+        if self.cache_dir is not None:
+            self.cache_dir = Path(self.cache_dir).expanduser().resolve()
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
         
         # Handle AOI CRS inheritance
         if self.output_crs in (None, "", "None", "AOI"):
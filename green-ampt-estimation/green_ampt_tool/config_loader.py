@@ -107,11 +107,19 @@ def build_config_from_dict(config_dict: Dict[str, Any]) -> PipelineConfig:
         data_source=config_dict.get('data_source', 'pysda'),
         local_ssurgo=local_ssurgo,
         pysda_timeout=int(config_dict.get('pysda_timeout', 300)),
+        pysda_chunk_size=int(config_dict['pysda_chunk_size']) if config_dict.get('pysda_chunk_size') else None,
+        pysda_max_workers=int(config_dict.get('pysda_max_workers', 1)),
+        pysda_simplify_tolerance=(
+            float(config_dict['pysda_simplify_tolerance']) if config_dict.get('pysda_simplify_tolerance') else None
+        ),
         depth_limit_cm=float(config_dict.get('depth_limit_cm', 10.0)),
         export_raw_data=config_dict.get('export_raw_data', True),
         raw_data_dir=Path(config_dict['raw_data_dir']) if config_dict.get('raw_data_dir') else None,
+        raw_data_format=config_dict.get('raw_data_format', 'csv'),
         use_lookup_table=config_dict.get('use_lookup_table', True),
         use_hsg_lookup=config_dict.get('use_hsg_lookup', False),
+        cache_dir=Path(config_dict['cache_dir']) if config_dict.get('cache_dir') else None,
+        build_overviews=config_dict.get('build_overviews', True),
     )
 
 
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
 import sys
-from typing import Iterable, List, Tuple
+from typing import Callable, Iterable, List, Optional, Tuple
 
-from ._compat import gpd, pd, require_geopandas, require_pandas
+from ._compat import PYARROW_AVAILABLE, PYOGRIO_AVAILABLE, gpd, pd, require_geopandas, require_pandas
 
-from .config import LocalSSURGOPaths
+from .config import LocalSSURGOPaths, PipelineCancelled
 
+# Length of one degree of latitude, used to turn metric tolerances into WGS84 degrees
+_METRES_PER_DEGREE = 111_320.0
 
 @dataclass
 class SSURGOData:
@@ -107,16 +110,28 @@ def read_aoi(aoi_path: Path, layer: str = None) -> "gpd.GeoDataFrame":
     return aoi.to_crs("EPSG:4326")
 
 
-def load_ssurgo_local(paths: LocalSSURGOPaths) -> SSURGOData:
-    """Read previously downloaded SSURGO extracts from disk."""
+def load_ssurgo_local(paths: LocalSSURGOPaths, aoi: Optional["gpd.GeoDataFrame"] = None) -> SSURGOData:
+    """Read previously downloaded SSURGO extracts from disk.
+
+    When ``aoi`` is given and pyogrio is installed it is handed to the driver
+    as a spatial filter, so only map unit polygons intersecting the AOI are
+    read from the layer.
+    """
 
     geopandas = require_geopandas()
     pandas = require_pandas()
 
-    mupolygon = geopandas.read_file(paths.mupolygon)
-    mapunit = _read_pipe_delimited(paths.mapunit)
-    component = _read_pipe_delimited(paths.component)
-    chorizon = _read_pipe_delimited(paths.chorizon)
+    if aoi is not None and PYOGRIO_AVAILABLE:
+        # read_file reprojects a GeoDataFrame mask to the layer CRS itself.
+        # Filtered reads come back in spatial-index order; sorting on the
+        # feature ID restores layer order so outputs match an unfiltered read.
+        mupolygon = geopandas.read_file(paths.mupolygon, mask=aoi, engine="pyogrio", fid_as_index=True)
+        mupolygon = mupolygon.sort_index().reset_index(drop=True)
+    else:
+        mupolygon = geopandas.read_file(paths.mupolygon)
+    mapunit = _read_table(paths.mapunit)
+    component = _read_table(paths.component)
+    chorizon = _read_table(paths.chorizon)
 
     expected_columns = {
         "mapunit": {"mukey"},
@@ -141,12 +156,32 @@ def load_ssurgo_local(paths: LocalSSURGOPaths) -> SSURGOData:
     )
 
 
-def fetch_ssurgo_with_pysda(aoi: "gpd.GeoDataFrame", timeout: int = 300) -> SSURGOData:
+def fetch_ssurgo_with_pysda(
+    aoi: "gpd.GeoDataFrame",
+    timeout: int = 300,
+    chunk_size: Optional[int] = None,
+    max_workers: int = 1,
+    cancel_check: Optional[Callable[[], bool]] = None,
+    simplify_tolerance: Optional[float] = None,
+) -> SSURGOData:
     """Fetch SSURGO data from NRCS Soil Data Access using the PySDA helpers.
     
     This function uses PySDA (https://github.com/ncss-tech/pysda), a Python library
     by Charles Ferguson that provides programmatic access to USDA-NRCS Soil Data Access.
     PySDA is vendored in external/pysda/ and licensed under GPL-3.0.
+
+    With ``chunk_size`` set, the spatial query is sent ``chunk_size`` AOI
+    features at a time, which keeps each request small for AOIs made of
+    many or complex features; polygons returned by more than one chunk are
+    kept once. Up to ``max_workers`` requests run at once, spatial chunks and
+    tabular mukey batches alike, and ``cancel_check`` is polled as each one
+    finishes; a True result raises ``PipelineCancelled``.
+
+    With ``simplify_tolerance`` (metres) set, the query geometry is a
+    simplified copy of each AOI feature, grown by the same tolerance so it
+    still covers the AOI. Detailed AOIs then send far fewer vertices; the
+    extra map unit polygons this can return fall away when clipping to the
+    exact AOI.
     """
 
     geopandas = require_geopandas()
@@ -156,7 +191,9 @@ def fetch_ssurgo_with_pysda(aoi: "gpd.GeoDataFrame", timeout: int = 300) -> SSUR
 
     # Ensure AOI is in WGS84 and then get bounds, which is more reliable for PySDA
     aoi_wgs84 = aoi.to_crs("EPSG:4326")
-    soils = sdapoly.gdf(aoi_wgs84)
+    if simplify_tolerance:
+        aoi_wgs84 = _simplified_query_aoi(aoi_wgs84, simplify_tolerance)
+    soils = _fetch_spatial_records(sdapoly, aoi_wgs84, chunk_size, max_workers, cancel_check)
     if soils is None or soils.empty:
         raise RuntimeError(
             "PySDA returned no spatial records for the AOI. This can happen if:\n"
@@ -180,11 +217,11 @@ def fetch_ssurgo_with_pysda(aoi: "gpd.GeoDataFrame", timeout: int = 300) -> SSUR
     if not mukeys:
         raise RuntimeError("No mukey identifiers returned from SDA query")
 
-    component = _fetch_component_records(sdatab, mukeys)
+    component = _fetch_component_records(sdatab, mukeys, max_workers, cancel_check)
     if component.empty:
         raise RuntimeError("PySDA returned no component records for the AOI")
 
-    horizons = _fetch_chorizon_records(sdatab, mukeys)
+    horizons = _fetch_chorizon_records(sdatab, mukeys, max_workers, cancel_check)
     if horizons.empty:
         raise RuntimeError("PySDA returned no horizon records for the AOI")
 
@@ -233,9 +270,91 @@ def _import_pysda_modules():
         raise
 
 
-def _fetch_component_records(sdatab_module, mukeys: Iterable[str]) -> "pd.DataFrame":
+def _simplified_query_aoi(aoi: "gpd.GeoDataFrame", tolerance_m: float) -> "gpd.GeoDataFrame":
+    """Simplify each WGS84 AOI feature, then buffer it so it still covers the original."""
+    # A degree of latitude is ~111 km and a degree of longitude no more, so a
+    # tolerance in degrees never drifts further than ``tolerance_m`` on the ground.
+    import shapely
+
+    geopandas = require_geopandas()
+    tolerance = tolerance_m / _METRES_PER_DEGREE
+    # shapely directly: geopandas warns on buffering in a geographic CRS, which is intended here
+    simplified = shapely.simplify(aoi.geometry.values, tolerance, preserve_topology=True)
+    query = geopandas.GeoSeries(shapely.buffer(simplified, tolerance), index=aoi.index, crs=aoi.crs)
+    return aoi.set_geometry(query)
+
+
+def _run_requests(
+    request: Callable, items: Iterable, max_workers: int = 1, cancel_check: Optional[Callable[[], bool]] = None
+) -> list:
+    """Return ``[request(item) for item in items]``, on up to ``max_workers`` threads.
+
+    SDA requests are network-bound, so threads overlap their latency. Once
+    ``cancel_check`` returns True no further request starts (ones in flight
+    finish) and ``PipelineCancelled`` is raised.
+    """
+    items = list(items)
+
+    def _check() -> None:
+        if cancel_check is not None and cancel_check():
+            raise PipelineCancelled("SSURGO download cancelled by caller")
+
+    if max_workers <= 1 or len(items) <= 1:
+        results = []
+        for item in items:
+            _check()
+            results.append(request(item))
+        return results
+
+    _check()
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        futures = [pool.submit(request, item) for item in items]
+        try:
+            for future in as_completed(futures):
+                future.result()
+                _check()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+    return [future.result() for future in futures]
+
+
+def _fetch_spatial_records(
+    sdapoly_module,
+    aoi: "gpd.GeoDataFrame",
+    chunk_size: Optional[int],
+    max_workers: int = 1,
+    cancel_check: Optional[Callable[[], bool]] = None,
+):
+    """Run the SDA spatial query for the whole AOI or in chunks of features."""
+    if chunk_size is None or len(aoi) <= chunk_size:
+        return sdapoly_module.gdf(aoi)
+
+    geopandas = require_geopandas()
+    pandas = require_pandas()
+    chunks = [aoi.iloc[start : start + chunk_size] for start in range(0, len(aoi), chunk_size)]
+    results = _run_requests(sdapoly_module.gdf, chunks, max_workers, cancel_check)
+    frames = [frame for frame in results if frame is not None and not frame.empty]
+    if not frames:
+        return None
+
+    soils = geopandas.GeoDataFrame(pandas.concat(frames, ignore_index=True), crs=frames[0].crs)
+    # A map unit polygon straddling two chunks comes back from both requests.
+    duplicate = pandas.DataFrame(
+        {"mukey": soils["mukey"].astype(str), "wkb": soils.geometry.to_wkb()}
+    ).duplicated()
+    return soils.loc[~duplicate.to_numpy()].reset_index(drop=True)
+
+
+def _fetch_component_records(
+    sdatab_module,
+    mukeys: Iterable[str],
+    max_workers: int = 1,
+    cancel_check: Optional[Callable[[], bool]] = None,
+) -> "pd.DataFrame":
     pandas = require_pandas()
-    frames = []
+    queries = []
     for chunk in _chunk_sequence(list(mukeys), 100):
         keys = ",".join(f"'{key}'" for key in chunk)
         query = f"""
@@ -243,18 +362,23 @@ def _fetch_component_records(sdatab_module, mukeys: Iterable[str]) -> "pd.DataFr
         FROM component
         WHERE mukey IN ({keys})
         """
-        frame = sdatab_module.tabular(" ".join(query.split()))
-        if frame is not None and not frame.empty:
-            frames.append(frame)
+        queries.append(" ".join(query.split()))
+    results = _run_requests(sdatab_module.tabular, queries, max_workers, cancel_check)
+    frames = [frame for frame in results if frame is not None and not frame.empty]
     if not frames:
         return pandas.DataFrame(columns=["mukey", "cokey", "comppct_r", "hydgrp", "majcompflag"])
     component = pandas.concat(frames, ignore_index=True)
     return component
 
 
-def _fetch_chorizon_records(sdatab_module, mukeys: Iterable[str]) -> "pd.DataFrame":
+def _fetch_chorizon_records(
+    sdatab_module,
+    mukeys: Iterable[str],
+    max_workers: int = 1,
+    cancel_check: Optional[Callable[[], bool]] = None,
+) -> "pd.DataFrame":
     pandas = require_pandas()
-    frames = []
+    queries = []
     for chunk in _chunk_sequence(list(mukeys), 50):
         keys = ",".join(f"'{key}'" for key in chunk)
         query = f"""
@@ -264,9 +388,9 @@ def _fetch_chorizon_records(sdatab_module, mukeys: Iterable[str]) -> "pd.DataFra
         INNER JOIN chorizon AS ch ON ch.cokey = c.cokey
         WHERE c.mukey IN ({keys})
         """
-        frame = sdatab_module.tabular(" ".join(query.split()))
-        if frame is not None and not frame.empty:
-            frames.append(frame)
+        queries.append(" ".join(query.split()))
+    results = _run_requests(sdatab_module.tabular, queries, max_workers, cancel_check)
+    frames = [frame for frame in results if frame is not None and not frame.empty]
     if not frames:
         return pandas.DataFrame(
             columns=[
@@ -294,9 +418,48 @@ def _chunk_sequence(values: Iterable[str], size: int) -> Iterable[Tuple[str, ...
             batch = []
     if batch:
         yield tuple(batch)
+
+
+def _read_table(path: Path) -> "pd.DataFrame":
+    """Read a SSURGO table from Parquet (``.parquet``) or pipe-delimited text."""
+    if Path(path).suffix.lower() != ".parquet":
+        return _read_pipe_delimited(path)
+    if not PYARROW_AVAILABLE:
+        raise ModuleNotFoundError(f"pyarrow is required to read Parquet SSURGO tables: {path}")
+    # Parquet keeps the column types it was written with, so nothing is parsed.
+    return require_pandas().read_parquet(path)
+
+
+# pandas.read_csv's default NA markers, so both readers null the same cells.
+_PANDAS_NA_VALUES = (
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND",
+    "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+)
+
+
 def _read_pipe_delimited(path: Path) -> "pd.DataFrame":
     pandas = require_pandas()
-    return pandas.read_csv(path, delimiter="|", dtype=str)
+    if not PYARROW_AVAILABLE:
+        return pandas.read_csv(path, delimiter="|", dtype=str)
+
+    from pyarrow import csv  # type: ignore
+
+    # Every column is read verbatim as text, as with dtype=str above, so
+    # values such as "27.30" are not re-formatted by type inference. Column
+    # names come from pyarrow's own header parse so a BOM or quoting is
+    # handled the same way as in the table it reads.
+    parse_options = csv.ParseOptions(delimiter="|")
+    names = csv.open_csv(path, parse_options=parse_options).schema.names
+    table = csv.read_csv(
+        path,
+        parse_options=parse_options,
+        convert_options=csv.ConvertOptions(
+            column_types={name: "string" for name in names},
+            null_values=list(_PANDAS_NA_VALUES),
+            strings_can_be_null=True,
+        ),
+    )
+    return table.to_pandas()
 
 
 def _check_columns(df: "pd.DataFrame", required: set[str], path: Path) -> None:
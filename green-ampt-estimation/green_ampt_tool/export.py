@@ -7,21 +7,40 @@ from .config import PipelineConfig
 from .data_access import SSURGOData
 
 
-def export_raw_ssurgo_data(data: SSURGOData, target_dir: Path) -> None:
-    """Persist the raw SSURGO datasets for archival or inspection."""
+# Files written by export_raw_ssurgo_data for each raw data format.
+RAW_EXPORT_FILES = {
+    "csv": ("mupolygon_raw.shp", "mapunit_raw.txt", "component_raw.txt", "chorizon_raw.txt"),
+    "parquet": ("mupolygon_raw.parquet", "mapunit_raw.parquet", "component_raw.parquet", "chorizon_raw.parquet"),
+}
+
+
+def export_raw_ssurgo_data(data: SSURGOData, target_dir: Path, data_format: str = "csv") -> None:
+    """Persist the raw SSURGO datasets for archival or inspection.
+
+    ``"csv"`` writes a shapefile and pipe-delimited text; ``"parquet"`` writes
+    GeoParquet and zstd-compressed Parquet, which needs pyarrow.
+    """
 
     geopandas = require_geopandas()
     pandas = require_pandas()
 
     target_dir = Path(target_dir).expanduser().resolve()
     target_dir.mkdir(parents=True, exist_ok=True)
+    spatial_name, mapunit_name, component_name, chorizon_name = RAW_EXPORT_FILES[data_format]
+
+    if data_format == "parquet":
+        geopandas.GeoDataFrame(data.mupolygon).to_parquet(target_dir / spatial_name, compression="zstd")
+        data.mapunit.to_parquet(target_dir / mapunit_name, index=False, compression="zstd")
+        data.component.to_parquet(target_dir / component_name, index=False, compression="zstd")
+        data.chorizon.to_parquet(target_dir / chorizon_name, index=False, compression="zstd")
+        return
 
-    spatial_path = target_dir / "mupolygon_raw.shp"
+    spatial_path = target_dir / spatial_name
     geopandas.GeoDataFrame(data.mupolygon).to_file(spatial_path, driver="ESRI Shapefile")
 
-    data.mapunit.to_csv(target_dir / "mapunit_raw.txt", index=False, sep="|")
-    data.component.to_csv(target_dir / "component_raw.txt", index=False, sep="|")
-    data.chorizon.to_csv(target_dir / "chorizon_raw.txt", index=False, sep="|")
+    data.mapunit.to_csv(target_dir / mapunit_name, index=False, sep="|")
+    data.component.to_csv(target_dir / component_name, index=False, sep="|")
+    data.chorizon.to_csv(target_dir / chorizon_name, index=False, sep="|")
 
 
 def export_parameter_vectors(vector: "gpd.GeoDataFrame", config: PipelineConfig) -> Path:
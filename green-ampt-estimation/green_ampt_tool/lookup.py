@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from typing import Dict, Optional, TYPE_CHECKING
 
 import math
@@ -125,9 +126,34 @@ HSG_KSAT_TABLE: Dict[str, Dict[str, float]] = {
 }
 
 
+
+def _validate_hsg_tables(
+    ranges_table: Dict[str, Dict[str, float]],
+    ksat_table: Dict[str, Dict[str, float]],
+) -> None:
+    """Raise ``ValueError`` naming the first HSG whose table entry is malformed."""
+    for hsg, ranges in ranges_table.items():
+        missing = {"min", "max"} - ranges.keys()
+        if missing:
+            raise ValueError(f"HSG {hsg!r} Ksat range is missing {sorted(missing)}")
+    for hsg, params in ksat_table.items():
+        if not params.get("ks_inhr", 0) > 0:
+            raise ValueError(f"HSG {hsg!r} must have a positive 'ks_inhr'")
+
+
+# Schema checked once at import; the tables are treated as read-only afterwards.
+_validate_hsg_tables(HSG_KSAT_RANGES_INHR, HSG_KSAT_TABLE)
+
+
 _ALIAS = {texture.lower(): texture for texture in GA_TABLE_US}
 
 
+@lru_cache(maxsize=1)
+def _ga_table_frame() -> "pd.DataFrame":
+    """``GA_TABLE_US`` as a frame indexed by texture class, built on first use."""
+    return require_pandas().DataFrame.from_dict(GA_TABLE_US, orient="index")
+
+
 def _norm_texcl(texture: Optional[str]) -> Optional[str]:
     if texture is None:
         return None
@@ -247,7 +273,7 @@ def component_surface_params_us(
     """Aggregate horizons within a surface window for each component."""
 
     pandas = require_pandas()
-    df = pandas.DataFrame(horizons_tex).copy()
+    df = pandas.DataFrame(horizons_tex)
     if df.empty:
         return pandas.DataFrame(
             columns=[
@@ -263,17 +289,27 @@ def component_surface_params_us(
             ]
         )
 
+    # Clip to the surface window before anything else, so horizons below it
+    # (most of them on deep profiles) are never converted or grouped.
+    depths = pandas.DataFrame(
+        {
+            "hzdept_r": pandas.to_numeric(df.get("hzdept_r"), errors="coerce"),
+            "hzdepb_r": pandas.to_numeric(df.get("hzdepb_r"), errors="coerce"),
+        },
+        index=df.index,
+    )
+    depths["t_top"] = depths["hzdept_r"].clip(lower=surface_top_cm)
+    depths["t_bot"] = depths["hzdepb_r"].clip(upper=surface_bot_cm)
+    depths["thick"] = (depths["t_bot"] - depths["t_top"]).clip(lower=0)
+    in_window = (depths["thick"] > 0).to_numpy()
+    df = df[in_window].copy()
+    for column in depths.columns:
+        df[column] = depths[column].to_numpy()[in_window]
+
     for column in ("mukey", "cokey"):
         if column in df.columns:
             df[column] = df[column].astype(str)
 
-    df["hzdept_r"] = pandas.to_numeric(df.get("hzdept_r"), errors="coerce")
-    df["hzdepb_r"] = pandas.to_numeric(df.get("hzdepb_r"), errors="coerce")
-
-    df["t_top"] = df["hzdept_r"].clip(lower=surface_top_cm)
-    df["t_bot"] = df["hzdepb_r"].clip(upper=surface_bot_cm)
-    df["thick"] = (df["t_bot"] - df["t_top"]).clip(lower=0)
-    df = df[df["thick"] > 0].copy()
     if df.empty:
         return pandas.DataFrame(
             columns=[
@@ -289,7 +325,8 @@ def component_surface_params_us(
             ]
         )
 
-    df["tex_norm"] = df.get("texcl").apply(_norm_texcl)
+    # Normalise each distinct texture name once rather than once per horizon.
+    df["tex_norm"] = df["texcl"].astype(str).str.strip().str.lower().map(_ALIAS)
 
     # Fallback: derive texture from sand/clay percentages if texcl is missing
     missing_texcl = df["tex_norm"].isna()
@@ -316,8 +353,10 @@ def component_surface_params_us(
             ]
         )
 
+    # One indexed lookup into the texture table for all six parameters.
+    texture_params = _ga_table_frame().reindex(df["tex_norm"].to_numpy())
     for column in ("ks_inhr", "psi_in", "theta_s", "theta_fc", "theta_wp", "init_def"):
-        df[column] = df["tex_norm"].map(lambda name: GA_TABLE_US[name][column])
+        df[column] = texture_params[column].to_numpy()
 
     records = []
     for (mukey, cokey), group in df.groupby(["mukey", "cokey"], sort=False):
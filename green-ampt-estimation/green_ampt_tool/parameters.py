@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import math
-from typing import Callable, Dict, Iterable, Literal, Optional
+from types import MappingProxyType
+from typing import Callable, Iterable, Literal, Mapping, Optional
 
-from ._compat import gpd, require_geopandas, require_pandas
+import numpy as np
+
+from ._compat import NUMBA_AVAILABLE, gpd, njit, require_geopandas, require_pandas
 from .lookup import component_surface_params_us, mapunit_params_us, build_hsg_parameters
 from .processing import summarize_hsg
 
@@ -31,18 +34,22 @@ def enrich_with_green_ampt_parameters(
     _ensure_column(frame, "sand_pct", ["sand_avg"], default_value=0.0)
     _ensure_column(frame, "clay_pct", ["clay_avg"], default_value=0.0)
 
-    frame["theta_s"] = [
-        max(0.0, min(0.9, value if value is not None else 0.45))
-        for value in (_safe_float(v) for v in frame["theta_s"])
-    ]
-
-    frame["psi"] = frame.apply(
-        lambda row: suction_fn(
-            _clamp_percentage(row.get("sand_pct", 0.0)),
-            _clamp_percentage(row.get("clay_pct", 0.0)),
-        ),
-        axis=1,
-    )
+    # _ensure_column has already replaced missing values with the default.
+    frame["theta_s"] = np.clip(frame["theta_s"].to_numpy(dtype="float64"), 0.0, 0.9)
+
+    if suction_fn is default_wetting_front_suction:
+        frame["psi"] = _default_suction_array(
+            frame["sand_pct"].to_numpy(dtype="float64"),
+            frame["clay_pct"].to_numpy(dtype="float64"),
+        )
+    else:
+        frame["psi"] = frame.apply(
+            lambda row: suction_fn(
+                _clamp_percentage(row.get("sand_pct", 0.0)),
+                _clamp_percentage(row.get("clay_pct", 0.0)),
+            ),
+            axis=1,
+        )
     frame["theta_i"] = initial_theta
 
     return geopandas.GeoDataFrame(frame, crs=soils.crs)
@@ -125,14 +132,9 @@ def build_hsg_lookup_parameters(components_df, horizons_df, surface_top_cm: floa
     # Now, replace Ksat with HSG-based values
     from .lookup import HSG_KSAT_TABLE
 
-    def get_hsg_ksat(row):
-        hsg = row.get("hsg_dom")
-        if hsg and hsg in HSG_KSAT_TABLE:
-            return HSG_KSAT_TABLE[hsg]["ks_inhr"]
-        # Keep texture-based value if no HSG mapping
-        return row.get("Ks_inhr")
-
-    texture_params["Ks_inhr"] = texture_params.apply(get_hsg_ksat, axis=1)
+    hsg_ksat = texture_params["hsg_dom"].map({hsg: values["ks_inhr"] for hsg, values in HSG_KSAT_TABLE.items()})
+    # Keep texture-based value if no HSG mapping
+    texture_params["Ks_inhr"] = hsg_ksat.fillna(texture_params["Ks_inhr"]).astype("float64")
     
     return texture_params
 
@@ -164,8 +166,8 @@ def enrich_with_lookup_parameters(
     return apply_initial_deficit_mode(soils, mode=mode)
 
 
-def emit_units_summary() -> Dict[str, str]:
-    return {
+_UNITS_SUMMARY: Mapping[str, str] = MappingProxyType(
+    {
         "Ks_inhr": "in/hr (saturated hydraulic conductivity)",
         "psi_in": "in (wetting-front suction head)",
         "theta_s": "fraction (porosity)",
@@ -182,6 +184,12 @@ def emit_units_summary() -> Dict[str, str]:
         "hsg_comp": "JSON % by HSG (dry)",
         "texcl": "USDA texture class (top window)",
     }
+)
+
+
+def emit_units_summary() -> Mapping[str, str]:
+    """Return the read-only units description shared by every caller."""
+    return _UNITS_SUMMARY
 
 
 def _clamp_percentage(value: float) -> float:
@@ -191,6 +199,39 @@ def _clamp_percentage(value: float) -> float:
     return max(0.0, min(100.0, numeric))
 
 
+def _default_suction_array(sand: np.ndarray, clay: np.ndarray) -> np.ndarray:
+    """``default_wetting_front_suction`` over whole columns; NaN reads as 0."""
+    if NUMBA_AVAILABLE:
+        out = np.empty(len(sand), dtype=np.float64)
+        _wetting_front_suction_nb(sand, clay, out)
+        return out
+    sand = np.clip(np.nan_to_num(sand, nan=0.0), 0.0, 100.0)
+    clay = np.clip(np.nan_to_num(clay, nan=0.0), 0.0, 100.0)
+    return 20.0 * (sand / 100.0) + 10.0 * (clay / 100.0)
+
+
+# Compiled lazily on first use so importing this module never pays for numba.
+@njit(cache=True)
+def _clamp_percentage_nb(value):
+    """Compiled ``_clamp_percentage`` for plain floats; NaN maps to 0."""
+    if value != value:
+        return 0.0
+    if value < 0.0:
+        return 0.0
+    if value > 100.0:
+        return 100.0
+    return value
+
+
+@njit(cache=True)
+def _wetting_front_suction_nb(sand, clay, out):  # pragma: no cover - compiled by numba
+    """Compiled ``default_wetting_front_suction`` written element-wise into ``out``."""
+    for i in range(sand.size):
+        out[i] = 20.0 * (_clamp_percentage_nb(sand[i]) / 100.0) + 10.0 * (
+            _clamp_percentage_nb(clay[i]) / 100.0
+        )
+
+
 def _ensure_column(frame: "gpd.GeoDataFrame", target: str, fallbacks: Iterable[str], default_value: float) -> None:
     if target in frame.columns:
         series = frame[target]
@@ -200,10 +241,11 @@ def _ensure_column(frame: "gpd.GeoDataFrame", target: str, fallbacks: Iterable[s
         frame[target] = default_value
         return
 
-    frame[target] = [
-        value if value is not None else default_value
-        for value in (_safe_float(v) for v in series)
-    ]
+    # Same rule as _safe_float per value: anything that is not a finite
+    # number or numeric text becomes the default.
+    pandas = require_pandas()
+    values = pandas.to_numeric(series, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    frame[target] = np.where(np.isnan(values), default_value, values)
 
 
 def _first_available_series(frame: "gpd.GeoDataFrame", fallbacks: Iterable[str]):
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 import json
-from typing import Dict, List, Tuple
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Tuple
 
 import numpy as np
 from ._compat import gpd, pd, require_geopandas, require_pandas
 
+# Minimum boundary-crossing polygons per clip thread; smaller inputs stay serial.
+_CLIP_CHUNK_MIN = 2048
+
 
 def clip_to_aoi(mupolygon: "gpd.GeoDataFrame", aoi: "gpd.GeoDataFrame") -> "gpd.GeoDataFrame":
-    geopandas = require_geopandas()
+    require_geopandas()
+    import shapely
 
     if mupolygon.crs is None:
         raise ValueError("mupolygon dataset lacks a CRS; unable to clip")
@@ -17,11 +24,59 @@ def clip_to_aoi(mupolygon: "gpd.GeoDataFrame", aoi: "gpd.GeoDataFrame") -> "gpd.
     if mupolygon.crs != target_crs:
         mupolygon = mupolygon.to_crs(target_crs)
 
-    clipped = geopandas.clip(mupolygon, aoi)
+    aoi_geom = _union_geometry(aoi)
+    # One STRtree query against the dissolved AOI, then only polygons crossing
+    # the AOI boundary pay for an exact intersection; those fully inside are
+    # kept as-is.
+    geoms = np.asarray(mupolygon.geometry.values)
+    hits = np.sort(shapely.STRtree(geoms).query(aoi_geom, predicate="intersects"))
+    clipped = mupolygon.iloc[hits].copy()
+    if not clipped.empty:
+        geoms = geoms[hits]
+        crossing = ~shapely.contains_properly(aoi_geom, geoms)
+        if crossing.any():
+            clipped.loc[crossing, clipped.geometry.name] = _intersect_chunked(geoms[crossing], aoi_geom)
     if clipped.empty:
         raise ValueError("Clipping mupolygon to AOI produced an empty GeoDataFrame")
     return clipped
 
+def _intersect_chunked(geoms: np.ndarray, mask) -> np.ndarray:
+    """``shapely.intersection(geoms, mask)``, split across threads for large inputs.
+
+    shapely releases the GIL inside vectorised GEOS calls, so threads scale
+    without pickling geometries to worker processes.
+    """
+    import shapely
+
+    workers = min(os.cpu_count() or 1, len(geoms) // _CLIP_CHUNK_MIN)
+    if workers < 2:
+        return shapely.intersection(geoms, mask)
+    chunks = np.array_split(geoms, workers)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(lambda chunk: shapely.intersection(chunk, mask), chunks))
+    return np.concatenate(parts)
+
+
+def _union_geometry(frame: "gpd.GeoDataFrame"):
+    """Dissolve every geometry in ``frame`` into one prepared shapely geometry.
+
+    Results are memoised on the WKB of the input geometries, so repeated
+    clips against the same AOI skip the union and the preparation.
+    """
+    import shapely
+
+    return _union_from_wkb(tuple(shapely.to_wkb(np.asarray(frame.geometry.values))))
+
+
+@lru_cache(maxsize=8)
+def _union_from_wkb(wkb: Tuple[bytes, ...]):
+    import shapely
+
+    union = shapely.union_all(shapely.from_wkb(np.array(wkb, dtype=object)))
+    shapely.prepare(union)
+    return union
+
+
 def summarize_mapunit_properties(
     component: "pd.DataFrame",
     chorizon: "pd.DataFrame",
@@ -29,96 +84,91 @@ def summarize_mapunit_properties(
 ) -> "pd.DataFrame":
     pandas = require_pandas()
 
-    comp = component.copy()
-    horiz = chorizon.copy()
-
-    if "mukey" in comp.columns:
-        comp["mukey"] = comp["mukey"].astype(str)
-    if "cokey" in comp.columns:
-        comp["cokey"] = comp["cokey"].astype(str)
-    if "mukey" in horiz.columns:
-        horiz["mukey"] = horiz["mukey"].astype(str)
-    if "cokey" in horiz.columns:
-        horiz["cokey"] = horiz["cokey"].astype(str)
+    if component.empty or chorizon.empty:
+        return pandas.DataFrame(columns=["mukey", "ksat", "sand_pct", "clay_pct", "theta_s"])
 
-    if comp.empty or horiz.empty:
+    # Only the columns used below are pulled out, once; SSURGO tables carry
+    # dozens of others that never need copying.
+    comp = pandas.DataFrame(
+        {
+            "mukey": component["mukey"].astype(str),
+            "cokey": component["cokey"].astype(str),
+            "comppct_r": pandas.to_numeric(component.get("comppct_r"), errors="coerce"),
+        }
+    ).dropna(subset=["mukey", "cokey"])
+
+    # Effective thickness within [0, depth_limit_cm], worked out first so only
+    # horizons overlapping the window are converted and aggregated: a missing
+    # top is 0, a missing bottom equals the top, and empty layers are dropped.
+    upper = _float_column(chorizon, "hzdept_r")
+    upper[np.isnan(upper)] = 0.0
+    lower = _float_column(chorizon, "hzdepb_r")
+    missing_lower = np.isnan(lower)
+    lower[missing_lower] = upper[missing_lower]
+    np.clip(upper, 0.0, depth_limit_cm, out=upper)
+    np.clip(lower, 0.0, depth_limit_cm, out=lower)
+    thickness = np.subtract(lower, upper, out=lower)
+    rows = np.flatnonzero(thickness > 0)
+    if rows.size == 0:
         return pandas.DataFrame(columns=["mukey", "ksat", "sand_pct", "clay_pct", "theta_s"])
 
-    comp["comppct_r"] = pandas.to_numeric(comp.get("comppct_r"), errors="coerce")
-    comp = comp.dropna(subset=["mukey", "cokey"])
-
-    numeric_cols = [
-        "hzdept_r",
-        "hzdepb_r",
-        "ksat_r",
-        "sandtotal_r",
-        "claytotal_r",
-        "dbthirdbar_r",
-    ]
-    for column in numeric_cols:
-        horiz[column] = pandas.to_numeric(horiz.get(column), errors="coerce")
+    horiz = {"cokey": chorizon["cokey"].iloc[rows].astype(str).to_numpy()}
+    if "mukey" in chorizon.columns:
+        horiz["mukey"] = chorizon["mukey"].iloc[rows].astype(str).to_numpy()
+    horiz["thickness"] = thickness[rows]
+    for column in ("ksat_r", "sandtotal_r", "claytotal_r", "dbthirdbar_r"):
+        horiz[column] = _float_column(chorizon, column, rows)
+    horiz = pandas.DataFrame(horiz)
 
     if "mukey" not in horiz.columns:
         horiz = horiz.merge(comp[["cokey", "mukey"]].drop_duplicates(), on="cokey", how="left")
 
     horiz = horiz.dropna(subset=["cokey", "mukey"])
-
-    horiz["hzdept_r"] = horiz["hzdept_r"].fillna(0)
-    horiz["hzdepb_r"] = horiz["hzdepb_r"].fillna(horiz["hzdept_r"])
-
-    horiz["upper"] = horiz["hzdept_r"].clip(lower=0, upper=depth_limit_cm)
-    horiz["lower"] = horiz["hzdepb_r"].clip(lower=0, upper=depth_limit_cm)
-    horiz["thickness"] = (horiz["lower"] - horiz["upper"]).clip(lower=0)
-    horiz = horiz[horiz["thickness"] > 0]
-
     if horiz.empty:
         return pandas.DataFrame(columns=["mukey", "ksat", "sand_pct", "clay_pct", "theta_s"])
+    thickness = horiz["thickness"].to_numpy()
+    horizon_cokeys = horiz["cokey"].to_numpy()
+    horizon_mukeys = horiz["mukey"].to_numpy()
 
+    # theta_s = 1 - db / 2.65 written into one buffer; negative porosity is
+    # treated as missing and values above 0.9 are capped.
     particle_density = 2.65
-    horiz["theta_s_hz"] = 1 - (horiz["dbthirdbar_r"] / particle_density)
-    horiz.loc[horiz["theta_s_hz"] < 0, "theta_s_hz"] = float("nan")
-    horiz.loc[horiz["theta_s_hz"] > 0.9, "theta_s_hz"] = 0.9
-
-    component_summaries: List[Dict[str, float]] = []
-    grouped = horiz.groupby("cokey", sort=False)
-    for cokey, group in grouped:
-        weights = group["thickness"].fillna(0)
-        if weights.sum() == 0:
-            continue
-
-        summary = {
-            "cokey": cokey,
-            "mukey": group["mukey"].iloc[0],
-            "ksat": _weighted_mean(group["ksat_r"], weights),
-            "sand_pct": _weighted_mean(group["sandtotal_r"], weights),
-            "clay_pct": _weighted_mean(group["claytotal_r"], weights),
-            "theta_s": _weighted_mean(group["theta_s_hz"], weights),
-        }
-        component_summaries.append(summary)
-
-    if not component_summaries:
-        return pandas.DataFrame(columns=["mukey", "ksat", "sand_pct", "clay_pct", "theta_s"])
-
-    component_frame = pandas.DataFrame(component_summaries)
+    theta_s_hz = horiz["dbthirdbar_r"].to_numpy(copy=True)
+    np.divide(theta_s_hz, particle_density, out=theta_s_hz)
+    np.subtract(1.0, theta_s_hz, out=theta_s_hz)
+    theta_s_hz[theta_s_hz < 0] = np.nan
+    np.minimum(theta_s_hz, 0.9, out=theta_s_hz)
+
+    # Thickness-weighted horizon -> component means, one bincount per property.
+    cokey_codes, cokeys = pandas.factorize(horizon_cokeys, sort=False)
+    # Codes number cokeys in first-appearance order, as do these first indices.
+    first_rows = np.unique(cokey_codes, return_index=True)[1]
+    component_means = {
+        target: _grouped_weighted_mean(cokey_codes, len(cokeys), horiz[column].to_numpy(), thickness)
+        for target, column in (("ksat", "ksat_r"), ("sand_pct", "sandtotal_r"), ("clay_pct", "claytotal_r"))
+    }
+    component_means["theta_s"] = _grouped_weighted_mean(cokey_codes, len(cokeys), theta_s_hz, thickness)
+    component_frame = pandas.DataFrame(
+        {"cokey": np.asarray(cokeys), "mukey": horizon_mukeys[first_rows], **component_means}
+    )
+
+    # comppct-weighted component -> map unit means.
     component_frame = component_frame.merge(comp[["cokey", "comppct_r"]], on="cokey", how="left")
-    component_frame["weight"] = pandas.to_numeric(component_frame.get("comppct_r"), errors="coerce").clip(lower=0)
-
-    mapunit_records: List[Dict[str, float]] = []
-    for mukey, group in component_frame.groupby("mukey", sort=False):
-        weight = group["weight"].fillna(0)
-        record = {
-            "mukey": mukey,
-            "ksat": _weighted_mean(group["ksat"], weight, normalize=True),
-            "sand_pct": _weighted_mean(group["sand_pct"], weight, normalize=True),
-            "clay_pct": _weighted_mean(group["clay_pct"], weight, normalize=True),
-            "theta_s": _weighted_mean(group["theta_s"], weight, normalize=True),
+    weight = component_frame["comppct_r"].clip(lower=0).to_numpy(dtype=np.float64, na_value=np.nan)
+    mukey_codes, mukeys = pandas.factorize(component_frame["mukey"], sort=False)
+    # Kept in float64 for the vector outputs and the psi/theta math; the
+    # float32 cast happens only when raster lookup tables are built.
+    return pandas.DataFrame(
+        {
+            "mukey": pandas.Series(np.asarray(mukeys), dtype=str),
+            **{
+                column: _grouped_weighted_mean(
+                    mukey_codes, len(mukeys), component_frame[column].to_numpy(dtype=np.float64), weight
+                )
+                for column in ("ksat", "sand_pct", "clay_pct", "theta_s")
+            },
         }
-        mapunit_records.append(record)
-
-    result = pandas.DataFrame(mapunit_records)
-    if "mukey" in result.columns:
-        result["mukey"] = result["mukey"].astype(str)
-    return result
+    )
 
 
 def attach_properties(
@@ -126,33 +176,70 @@ def attach_properties(
     aggregated: "pd.DataFrame",
 ) -> "gpd.GeoDataFrame":
     geopandas = require_geopandas()
-    frame = mupolygon_clipped.copy()
+    pandas = require_pandas()
+    frame = mupolygon_clipped
     if "mukey" in frame.columns:
-        frame["mukey"] = frame["mukey"].astype(str)
+        # assign() shares the geometry column under copy-on-write instead of
+        # copying the whole frame up front.
+        frame = frame.assign(mukey=frame["mukey"].astype(str))
     if "mukey" in aggregated.columns:
-        aggregated = aggregated.copy()
-        aggregated["mukey"] = aggregated["mukey"].astype(str)
-    frame = frame.merge(aggregated, on="mukey", how="left")
-    return geopandas.GeoDataFrame(frame, crs=mupolygon_clipped.crs)
-
-
-def _weighted_mean(series, weights, normalize: bool = False) -> float:
+        aggregated = aggregated.assign(mukey=aggregated["mukey"].astype(str))
+    value_columns = [column for column in aggregated.columns if column != "mukey"]
+    if (
+        "mukey" not in frame.columns
+        or "mukey" not in aggregated.columns
+        or frame.columns.intersection(value_columns).size
+    ):
+        # Missing keys raise and clashing names get merge's suffixes.
+        frame = frame.merge(aggregated, on="mukey", how="left", validate="m:1", sort=False)
+    else:
+        # Same result as a left merge, but the string keys are hashed once per
+        # distinct map unit and each polygon only gathers by integer position.
+        keys = pandas.Index(aggregated["mukey"])
+        if not keys.is_unique:
+            # Aggregated tables carry one row per map unit; duplicated keys
+            # would silently multiply polygons.
+            raise pandas.errors.MergeError("Merge keys are not unique in right dataset; not a many-to-one merge")
+        codes, mukeys = pandas.factorize(frame["mukey"], sort=False)
+        rows = keys.get_indexer(mukeys)[codes]
+        rows[codes < 0] = -1
+        gathered = {}
+        for column in value_columns:
+            taken = aggregated[column].array.take(rows, allow_fill=True)
+            gathered[column] = pandas.Series(taken, index=frame.index, dtype=taken.dtype)
+        frame = frame.assign(**gathered).reset_index(drop=True)
+    if not isinstance(frame, geopandas.GeoDataFrame):  # pragma: no cover - older geopandas
+        frame = geopandas.GeoDataFrame(frame, geometry=mupolygon_clipped.geometry.name, crs=mupolygon_clipped.crs)
+    return frame
+
+
+def _float_column(frame: "pd.DataFrame", column: str, rows: Optional[np.ndarray] = None) -> np.ndarray:
+    """``frame[column]`` (optionally just ``rows``) as a writable float64 array, NaN where missing."""
     pandas = require_pandas()
-    values = pandas.to_numeric(series, errors="coerce")
-    weights = pandas.to_numeric(weights, errors="coerce").fillna(0)
-
-    if normalize and weights.sum() > 0:
-        weights = weights / weights.sum()
-
-    mask = values.notna() & weights.gt(0)
-    if mask.any():
-        return float((values[mask] * weights[mask]).sum() / weights[mask].sum())
-
-    values = values.dropna()
-    if not values.empty:
-        return float(values.mean())
-
-    return float("nan")
+    size = len(frame) if rows is None else len(rows)
+    values = frame.get(column)
+    if values is None:
+        return np.full(size, np.nan)
+    if rows is not None:
+        values = values.iloc[rows]
+    return pandas.to_numeric(values, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+
+
+def _grouped_weighted_mean(codes: np.ndarray, n_groups: int, values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Weighted mean of ``values`` per group in ``codes``, all groups at once.
+
+    NaN values and non-positive (or NaN) weights are skipped. A group with no
+    positive weight falls back to the plain mean of its values, and to NaN
+    when every value is missing.
+    """
+    present = ~np.isnan(values)
+    valid = present & (weights > 0)
+    weighted = np.bincount(codes, weights=np.where(valid, values * weights, 0.0), minlength=n_groups)
+    weight_total = np.bincount(codes, weights=np.where(valid, weights, 0.0), minlength=n_groups)
+    plain_total = np.bincount(codes, weights=np.where(present, values, 0.0), minlength=n_groups)
+    plain_count = np.bincount(codes[present], minlength=n_groups)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(weight_total > 0, weighted / weight_total, plain_total / plain_count)
 
 
 def _arith_mean(values, weights) -> float:
@@ -179,6 +266,27 @@ def _parse_dual_hsg(value: str) -> Tuple[str, str]:
     return ("U", "U")
 
 
+def _parse_dual_hsg_series(values) -> Tuple["pd.Series", "pd.Series"]:
+    """Vectorised ``_parse_dual_hsg`` returning ``(dry, drained)`` Series."""
+    pandas = require_pandas()
+    series = pandas.Series(values, dtype=object)
+    if series.empty:
+        return series.copy(), series.copy()
+
+    text = series.astype(str).str.strip().str.upper().str.replace("\\", "/", regex=False)
+    parts = text.str.split("/", n=1, expand=True)
+    dry = parts[0].str.strip()
+    if parts.shape[1] > 1:
+        drained = parts[1].str.strip().where(parts[1].notna(), dry)
+    else:
+        drained = dry.copy()
+
+    unknown = series.isna()
+    dry = dry.mask(unknown | (dry == ""), "U")
+    drained = drained.mask(unknown | (drained == ""), "U")
+    return dry, drained
+
+
 def summarize_hsg(components_df: "pd.DataFrame") -> "pd.DataFrame":
     pandas = require_pandas()
     frame = pandas.DataFrame(components_df).copy()
@@ -190,34 +298,38 @@ def summarize_hsg(components_df: "pd.DataFrame") -> "pd.DataFrame":
     frame["mukey"] = frame["mukey"].astype(str)
     frame["comppct_r"] = pandas.to_numeric(frame.get("comppct_r"), errors="coerce").fillna(0.0)
     frame["majcompflag"] = frame.get("majcompflag", "NO")
-
-    groups = []
-    for mukey, group in frame.groupby("mukey", sort=False):
-        working = group.copy()
-        working["maj_rank"] = working["majcompflag"].astype(str).str.upper() != "YES"
-        working = working.sort_values(["comppct_r", "maj_rank"], ascending=[False, True])
-        hydgrp = working["hydgrp"].iloc[0] if not working.empty else None
-        dry, drained = _parse_dual_hsg(hydgrp)
-
-        totals = float(working["comppct_r"].sum() or 0.0)
-        comp_totals: Dict[str, float] = {}
-        for _, row in working.iterrows():
-            dry_code, _ = _parse_dual_hsg(row.get("hydgrp"))
-            comp_totals[dry_code] = comp_totals.get(dry_code, 0.0) + float(row.get("comppct_r", 0.0))
-
-        if totals > 0:
-            comp_pct = {key: round(100.0 * value / totals) for key, value in comp_totals.items()}
-        else:
-            comp_pct = {}
-
-        groups.append(
-            {
-                "mukey": mukey,
-                "hsg_dom": dry,
-                "hsg_dry": dry,
-                "hsg_drained": drained,
-                "hsg_comp": json.dumps(comp_pct),
-            }
-        )
-
-    return pandas.DataFrame(groups)
+    frame["hsg_dry"], frame["hsg_drained"] = _parse_dual_hsg_series(frame["hydgrp"])
+    frame["_major"] = (frame["majcompflag"].astype(str).str.upper() == "YES").astype("int8")
+    frame["mu_order"] = pandas.factorize(frame["mukey"], sort=False)[0]
+
+    # Within each map unit: largest component first, major components break ties.
+    ordered = frame.sort_values(
+        ["mu_order", "comppct_r", "_major"], ascending=[True, False, False]
+    )
+    result = ordered.drop_duplicates("mu_order")[["mukey", "hsg_dry", "hsg_drained"]]
+    result = result.reset_index(drop=True)
+    result.insert(1, "hsg_dom", result["hsg_dry"])
+
+    # Percent by dry HSG, keyed in the order each code first appears above.
+    comp_totals = ordered.groupby(["mu_order", "hsg_dry"], sort=False)["comppct_r"].sum()
+    mu_totals = ordered.groupby("mu_order")["comppct_r"].sum()
+    mu_codes = comp_totals.index.get_level_values("mu_order")
+    totals = mu_totals.reindex(mu_codes).to_numpy()
+    keep = totals > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percents = np.rint(100.0 * comp_totals.to_numpy() / totals)
+    dry_codes = comp_totals.index.get_level_values("hsg_dry")
+    key_json = {code: json.dumps(code) for code in dry_codes.unique()}
+    entries = [f"{key_json[code]}: {int(pct)}" for code, pct in zip(dry_codes[keep], percents[keep])]
+
+    # Entries are contiguous per map unit, so each object is one slice join
+    # rather than a per-group pandas aggregation.
+    entry_mu = mu_codes.to_numpy()[keep]
+    starts = np.flatnonzero(np.diff(entry_mu, prepend=-1))
+    ends = np.r_[starts[1:], len(entries)]
+    hsg_comp = np.full(len(result), "{}", dtype=object)
+    hsg_comp[entry_mu[starts]] = [
+        "{" + ", ".join(entries[start:end]) + "}" for start, end in zip(starts.tolist(), ends.tolist())
+    ]
+    result["hsg_comp"] = hsg_comp
+    return result
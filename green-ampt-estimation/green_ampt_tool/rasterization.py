@@ -1,30 +1,52 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Optional
 
-from ._compat import gpd, require_geopandas
+import numpy as np
+
+from ._compat import NUMBA_AVAILABLE, gpd, njit, require_geopandas
 
 try:  # pragma: no cover - import guard for environments lacking rasterio
     import rasterio  # type: ignore
+    from rasterio.enums import Resampling  # type: ignore
     from rasterio.features import rasterize  # type: ignore
     from rasterio.transform import from_bounds  # type: ignore
+    from rasterio.windows import Window  # type: ignore
 except ImportError as exc:  # pragma: no cover
     rasterio = None  # type: ignore
     rasterize = None  # type: ignore
+    Resampling = None  # type: ignore
     from_bounds = None  # type: ignore
+    Window = None  # type: ignore
     _RASTERIO_IMPORT_ERROR = exc
 else:  # pragma: no cover
     _RASTERIO_IMPORT_ERROR = None
 
 from .config import PipelineConfig
 
+# Rows gathered and written per window, bounding per-thread memory on large grids.
+# A multiple of _TILE_SIZE so every window write covers whole tiles.
+_WRITE_BLOCK_ROWS = 1024
+# Square GeoTIFF tile edge; a windowed read touches only the tiles it overlaps.
+_TILE_SIZE = 512
+
 
 @dataclass
 class RasterGrid:
     transform: object
     width: int
     height: int
+    # Cached by prepare_grid / rasterize_parameters so a grid can be reused
+    # for the same vector without reprojecting or re-burning geometries.
+    crs: Optional[str] = field(default=None, compare=False)
+    geoms: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    source_key: Optional[str] = field(default=None, repr=False, compare=False)
+    feature_index: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
 
 
 def prepare_grid(vector: "gpd.GeoDataFrame", resolution: float, output_crs: str) -> RasterGrid:
@@ -38,39 +60,99 @@ def prepare_grid(vector: "gpd.GeoDataFrame", resolution: float, output_crs: str)
     width = max(1, int((xmax - xmin) / resolution))
     height = max(1, int((ymax - ymin) / resolution))
     transform = from_bounds(xmin, ymin, xmax, ymax, width, height)
-    return RasterGrid(transform=transform, width=width, height=height)
+    return RasterGrid(
+        transform=transform,
+        width=width,
+        height=height,
+        crs=output_crs,
+        geoms=np.asarray(projected.geometry.values, dtype=object),
+        source_key=_grid_key(vector, resolution, output_crs),
+    )
 
 
 def rasterize_parameters(
     vector: "gpd.GeoDataFrame",
     parameters: Iterable[str],
     config: PipelineConfig,
+    grid: Optional[RasterGrid] = None,
+    on_written: Optional[Callable[[str], None]] = None,
 ) -> None:
+    """Write one GeoTIFF per requested column of ``vector``.
+
+    ``grid`` may be a grid from an earlier call for the same vector and
+    config; it is rebuilt when the geometries, resolution or output CRS differ.
+    ``on_written`` is called with each parameter name, on the calling thread,
+    once its raster is on disk.
+    """
     require_geopandas()
 
     if rasterio is None or rasterize is None or from_bounds is None:  # pragma: no cover
         raise ModuleNotFoundError("rasterio is required for rasterisation") from _RASTERIO_IMPORT_ERROR
 
-    grid = prepare_grid(vector, config.output_resolution, config.output_crs)
-    projected = vector.to_crs(config.output_crs)
-
-    for parameter in parameters:
-        if parameter not in projected.columns:
-            continue
-
-        shapes = (
-            (geom, float(value) if value is not None else float("nan"))
-            for geom, value in zip(projected.geometry, projected[parameter])
-        )
-        array = rasterize(
-            shapes=shapes,
-            out_shape=(grid.height, grid.width),
-            transform=grid.transform,
-            fill=float("nan"),
-            dtype="float32",
-        )
-
-        output_path = config.build_raster_path(parameter)
+    requested = [parameter for parameter in parameters if parameter in vector.columns]
+    if not requested:
+        return
+
+    if (
+        grid is None
+        or grid.geoms is None
+        or grid.source_key != _grid_key(vector, config.output_resolution, config.output_crs)
+    ):
+        grid = prepare_grid(vector, config.output_resolution, config.output_crs)
+
+    # Burn each feature's row position once; every parameter is then a
+    # lookup-table gather instead of another pass over the geometries.
+    if grid.feature_index is None:
+        feature_index = _burn_feature_index(grid)
+        feature_index[feature_index < 0] = len(grid.geoms)
+        grid.feature_index = feature_index
+    feature_index = grid.feature_index
+
+    luts = {}
+    for parameter in requested:
+        lut = np.empty(len(vector) + 1, dtype=np.float32)
+        lut[:-1] = vector[parameter].to_numpy(dtype=np.float32, na_value=np.nan)
+        lut[-1] = np.nan
+        luts[parameter] = lut
+
+    # Gathers and GeoTIFF writes are independent per parameter and release
+    # the GIL, so they run on a small thread pool. The cores left over are
+    # shared out as GDAL compression threads so the total stays near cpu_count.
+    cpu_count = os.cpu_count() or 1
+    max_workers = min(len(requested), cpu_count)
+    gdal_threads = max(1, cpu_count // max_workers)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(
+                _write_parameter_raster,
+                config.build_raster_path(parameter),
+                parameter,
+                luts[parameter],
+                feature_index,
+                grid,
+                config.output_crs,
+                gdal_threads,
+                config.build_overviews,
+            )
+            for parameter in requested
+        ]
+        for parameter, future in zip(requested, futures):
+            future.result()
+            if on_written is not None:
+                on_written(parameter)
+
+
+def _write_parameter_raster(
+    output_path: Path,
+    parameter: str,
+    lut: np.ndarray,
+    feature_index: np.ndarray,
+    grid: RasterGrid,
+    crs: str,
+    gdal_threads: int = 1,
+    build_overviews: bool = False,
+) -> None:
+    with rasterio.Env(GDAL_NUM_THREADS=str(gdal_threads), GDAL_CACHEMAX=512):
         with rasterio.open(
             output_path,
             "w",
@@ -79,9 +161,93 @@ def rasterize_parameters(
             width=grid.width,
             count=1,
             dtype="float32",
-            crs=config.output_crs,
+            crs=crs,
             transform=grid.transform,
             nodata=float("nan"),
+            tiled=True,
+            blockxsize=_TILE_SIZE,
+            blockysize=_TILE_SIZE,
+            compress="deflate",
+            predictor=3,
+            BIGTIFF="IF_SAFER",
         ) as dst:
-            dst.write(array, 1)
-            dst.update_tags(parameter=parameter, source="green_ampt_tool")
\ No newline at end of file
+            buffer = np.empty((min(_WRITE_BLOCK_ROWS, grid.height), grid.width), dtype=np.float32)
+            for row in range(0, grid.height, _WRITE_BLOCK_ROWS):
+                rows = min(_WRITE_BLOCK_ROWS, grid.height - row)
+                block = buffer[:rows]
+                _gather(lut, feature_index[row : row + rows], block)
+                dst.write(block, 1, window=Window(0, row, grid.width, rows))
+            dst.update_tags(parameter=parameter, source="green_ampt_tool")
+            factors = _overview_factors(grid.width, grid.height) if build_overviews else []
+            if factors:
+                dst.build_overviews(factors, Resampling.average)
+                dst.update_tags(ns="rio_overview", resampling="average")
+
+
+def _overview_factors(width: int, height: int) -> list:
+    """Power-of-two decimations until the coarsest level fits in one tile."""
+    factors = []
+    factor = 2
+    while max(width, height) / (factor // 2) > _TILE_SIZE:
+        factors.append(factor)
+        factor *= 2
+    return factors
+
+
+def read_window(config: PipelineConfig, parameter: str, window: Optional["Window"] = None) -> np.ndarray:
+    """Read one window of a parameter raster written by ``rasterize_parameters``.
+
+    ``window`` is a ``rasterio.windows.Window`` (or anything rasterio accepts
+    as one); ``None`` reads the whole band. Only the tiles overlapping the
+    window are decoded, so large grids can be checked or post-processed tile
+    by tile with bounded memory.
+    """
+    if rasterio is None:  # pragma: no cover - runtime guard
+        raise ModuleNotFoundError("rasterio is required for rasterisation") from _RASTERIO_IMPORT_ERROR
+
+    with rasterio.open(config.build_raster_path(parameter), sharing=False) as src:
+        return src.read(1, window=window, out_dtype="float32")
+
+
+def _gather(lut: np.ndarray, index: np.ndarray, out: np.ndarray) -> None:
+    """Fill ``out`` with ``lut[index]``; both 2-D arrays are C-contiguous row strips."""
+    if NUMBA_AVAILABLE:
+        _gather_kernel(lut, index.reshape(-1), out.reshape(-1))
+    else:
+        np.take(lut, index, out=out)
+
+
+# Serial and nogil: parallelism comes from the per-parameter writer threads,
+# and a numba parallel region launched from those threads can hang at exit.
+@njit(nogil=True, cache=True)
+def _gather_kernel(lut, index, out):  # pragma: no cover - compiled by numba
+    # Indices are in range by construction: no-feature pixels point at the
+    # trailing NaN slot of every lookup table.
+    for i in range(index.size):
+        out[i] = lut[index[i]]
+
+
+def _burn_feature_index(grid: RasterGrid) -> np.ndarray:
+    """Rasterise row positions of ``grid.geoms`` onto ``grid``; -1 marks no feature.
+
+    Later features overwrite earlier ones, matching a per-value burn.
+    """
+    return rasterize(
+        shapes=zip(grid.geoms, range(len(grid.geoms))),
+        out_shape=(grid.height, grid.width),
+        transform=grid.transform,
+        fill=-1,
+        dtype="int32",
+    )
+
+
+def _grid_key(vector: "gpd.GeoDataFrame", resolution: float, output_crs: Optional[str]) -> str:
+    """Fingerprint of everything a grid depends on: geometries, their CRS, resolution and output CRS."""
+    import shapely
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{vector.crs}|{resolution!r}|{output_crs}|{len(vector)}".encode())
+    for wkb in shapely.to_wkb(np.asarray(vector.geometry.values, dtype=object)):
+        digest.update(b"" if wkb is None else wkb)
+        digest.update(b"|")
+    return digest.hexdigest()
@@ -0,0 +1,58 @@
+"""Shared fixtures for the Green-Ampt toolkit test suite."""
+
+import sys
+from pathlib import Path
+
+# Make green_ampt_tool importable once for every test module in this package.
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import numpy as np  # noqa: E402
+import pytest  # noqa: E402
+
+# Warm geopandas/pyogrio/pyproj/shapely once at collection when they are
+# installed; geopandas is optional, so config-only tests still collect without it.
+try:  # pragma: no cover - depends on the environment
+    import pandas  # noqa: E402,F401
+    import shapely  # noqa: E402,F401
+    import geopandas  # noqa: E402,F401
+except ImportError:  # pragma: no cover
+    pass
+
+
+@pytest.fixture(scope="session")
+def point_pool():
+    """Eight points built lazily so each xdist worker creates its own copy."""
+    gpd = pytest.importorskip("geopandas")
+    xy = np.arange(8, dtype="float64")
+    return gpd.points_from_xy(xy, xy)
+
+
+@pytest.fixture(scope="session")
+def wgs84():
+    """WGS84 CRS parsed once per session instead of once per GeoDataFrame."""
+    pyproj = pytest.importorskip("pyproj")
+
+    return pyproj.CRS.from_epsg(4326)
+
+
+@pytest.fixture(scope="session")
+def make_soils(wgs84, point_pool):
+    """Factory building small point GeoDataFrames in WGS84.
+
+    A ``geometry`` column is sliced from ``point_pool`` when the caller does
+    not supply one; larger frames get a fresh vectorised point array.
+    """
+    gpd = pytest.importorskip("geopandas")
+
+    def _make(columns):
+        columns = dict(columns)
+        if "geometry" not in columns:
+            n_rows = len(next(iter(columns.values())))
+            if n_rows <= len(point_pool):
+                columns["geometry"] = point_pool[:n_rows]
+            else:
+                xy = np.arange(n_rows, dtype="float64")
+                columns["geometry"] = gpd.points_from_xy(xy, xy)
+        return gpd.GeoDataFrame(columns, geometry="geometry", crs=wgs84)
+
+    return _make
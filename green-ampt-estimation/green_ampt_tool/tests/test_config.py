@@ -1,10 +1,6 @@
-import sys
-from pathlib import Path
 import tempfile
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
-
 from green_ampt_tool.config import LocalSSURGOPaths, PipelineConfig
 
 
@@ -200,6 +196,22 @@ class TestPipelineConfig:
         assert config.raw_data_dir == custom_raw_dir
         assert config.raw_data_dir.exists()
 
+    def test_cache_directory(self, tmp_path):
+        """Test that caching is off by default and a given cache directory is created."""
+        aoi_file = tmp_path / "aoi.shp"
+        aoi_file.touch()
+
+        default = PipelineConfig(aoi_path=aoi_file, output_dir=tmp_path / "output")
+        cached = PipelineConfig(
+            aoi_path=aoi_file,
+            output_dir=tmp_path / "output",
+            cache_dir=tmp_path / "cache",
+        )
+
+        assert default.cache_dir is None
+        assert cached.cache_dir == tmp_path / "cache"
+        assert cached.cache_dir.exists()
+
     def test_use_pysda_property(self, tmp_path):
         """Test use_pysda convenience property."""
         aoi_file = tmp_path / "aoi.shp"
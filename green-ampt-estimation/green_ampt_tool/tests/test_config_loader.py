@@ -1,11 +1,7 @@
 """Tests for configuration file loading."""
 import json
-import sys
-from pathlib import Path
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
-
 from green_ampt_tool.config_loader import (
     load_config_file,
     build_config_from_dict,
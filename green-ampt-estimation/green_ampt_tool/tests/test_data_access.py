@@ -1,19 +1,22 @@
-import sys
 from pathlib import Path
+import time
 import pytest
 import pandas as pd
 import geopandas as gpd
 from shapely.geometry import Point, Polygon
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
-
 from green_ampt_tool.data_access import (
     SSURGOData,
     read_aoi,
     load_ssurgo_local,
     parse_aoi_path,
+    _fetch_spatial_records,
+    _read_pipe_delimited,
+    _run_requests,
+    _simplified_query_aoi,
 )
-from green_ampt_tool.config import LocalSSURGOPaths
+from green_ampt_tool.config import LocalSSURGOPaths, PipelineCancelled
+from green_ampt_tool._compat import PYARROW_AVAILABLE, PYOGRIO_AVAILABLE
 
 
 class TestParseAOIPath:
@@ -264,3 +267,232 @@ class TestLoadSSURGOLocal:
         # chorizon should have mukey merged
         assert "mukey" in result.chorizon.columns
         assert result.chorizon.iloc[0]["mukey"] == "1"
+
+    @pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow not available")
+    def test_parquet_tables(self, tmp_path):
+        """Test that Parquet tables load like their pipe-delimited equivalents."""
+        mupolygon_path = tmp_path / "mupolygon.shp"
+        gpd.GeoDataFrame({"mukey": ["1"], "geometry": [Point(0, 0)]}, crs="EPSG:4326").to_file(mupolygon_path)
+
+        pd.DataFrame({"mukey": ["1"]}).to_parquet(tmp_path / "mapunit.parquet")
+        pd.DataFrame({"mukey": ["1"], "cokey": ["10"]}).to_parquet(tmp_path / "component.parquet")
+        pd.DataFrame(
+            {
+                "cokey": ["10"],
+                "hzdept_r": [0.0],
+                "hzdepb_r": [10.0],
+                "ksat_r": [5.0],
+                "sandtotal_r": [50.0],
+                "claytotal_r": [20.0],
+                "dbthirdbar_r": [1.5],
+            }
+        ).to_parquet(tmp_path / "chorizon.parquet")
+        paths = LocalSSURGOPaths(
+            mupolygon=mupolygon_path,
+            mapunit=tmp_path / "mapunit.parquet",
+            component=tmp_path / "component.parquet",
+            chorizon=tmp_path / "chorizon.parquet",
+        )
+
+        result = load_ssurgo_local(paths)
+
+        assert result.chorizon.iloc[0]["mukey"] == "1"
+        assert result.chorizon["ksat_r"].dtype == "float64"
+
+    @pytest.mark.skipif(not PYOGRIO_AVAILABLE, reason="pyogrio not available")
+    def test_aoi_mask_limits_polygons_read(self, tmp_path):
+        """Test that only polygons intersecting the AOI are read when one is given."""
+        mupolygon_path = tmp_path / "mupolygon.shp"
+        gdf = gpd.GeoDataFrame(
+            {
+                "mukey": ["1", "2"],
+                "geometry": [
+                    Polygon([(0, 0), (1, 0), (1, 1), (0, 1)]),
+                    Polygon([(50, 50), (51, 50), (51, 51), (50, 51)]),
+                ],
+            },
+            crs="EPSG:4326",
+        )
+        gdf.to_file(mupolygon_path)
+
+        mapunit_path = tmp_path / "mapunit.txt"
+        mapunit_path.write_text("mukey\n1\n2\n")
+        component_path = tmp_path / "component.txt"
+        component_path.write_text("mukey|cokey\n1|10\n2|20\n")
+        chorizon_path = tmp_path / "chorizon.txt"
+        chorizon_path.write_text(
+            "cokey|hzdept_r|hzdepb_r|ksat_r|sandtotal_r|claytotal_r|dbthirdbar_r\n"
+            "10|0|10|5.0|50.0|20.0|1.5\n"
+        )
+        paths = LocalSSURGOPaths(
+            mupolygon=mupolygon_path,
+            mapunit=mapunit_path,
+            component=component_path,
+            chorizon=chorizon_path,
+        )
+        # AOI in a different CRS than the layer.
+        aoi = gpd.GeoDataFrame(
+            geometry=[Polygon([(0.2, 0.2), (0.8, 0.2), (0.8, 0.8), (0.2, 0.8)])], crs="EPSG:4326"
+        ).to_crs("EPSG:3857")
+
+        result = load_ssurgo_local(paths, aoi=aoi)
+
+        assert result.mupolygon["mukey"].tolist() == ["1"]
+
+
+class TestReadPipeDelimited:
+    """Test pipe-delimited table parsing."""
+
+    def test_values_kept_verbatim_as_text(self, tmp_path):
+        """Test that numeric-looking values are not re-formatted and blanks are missing."""
+        table_path = tmp_path / "chorizon.txt"
+        table_path.write_text("cokey|sandtotal_r|texcl\n0010|27.30|\n")
+
+        result = _read_pipe_delimited(table_path)
+
+        assert result.iloc[0]["cokey"] == "0010"
+        assert result.iloc[0]["sandtotal_r"] == "27.30"
+        assert pd.isna(result.iloc[0]["texcl"])
+        assert pd.api.types.is_string_dtype(result["sandtotal_r"])
+
+    def test_byte_order_mark_and_quoted_header(self, tmp_path):
+        """Test that a BOM or quoted header yields the same frame as pandas."""
+        table_path = tmp_path / "chorizon.txt"
+        table_path.write_bytes('\ufeff"cokey"|"sandtotal_r"\n0012|27.30\n'.encode("utf-8"))
+
+        result = _read_pipe_delimited(table_path)
+        expected = pd.read_csv(table_path, delimiter="|", dtype=str)
+
+        assert list(result.columns) == ["cokey", "sandtotal_r"]
+        assert result.astype(object).equals(expected.astype(object))
+
+    def test_pandas_null_markers_are_missing(self, tmp_path):
+        """Test that markers such as "None" and "NA" are missing, as with pandas."""
+        table_path = tmp_path / "component.txt"
+        table_path.write_text("cokey|hydgrp|compkind\n1|None|NA\n")
+
+        result = _read_pipe_delimited(table_path)
+
+        assert pd.isna(result.iloc[0]["hydgrp"])
+        assert pd.isna(result.iloc[0]["compkind"])
+
+
+class _FakeSdaPoly:
+    """Stand-in for pysda.sdapoly returning the map unit squares each AOI chunk touches."""
+
+    def __init__(self, soils):
+        self.soils = soils
+        self.requests = []
+
+    def gdf(self, aoi):
+        self.requests.append(len(aoi))
+        hits = self.soils.geometry.intersects(aoi.geometry.union_all())
+        return self.soils.loc[hits.to_numpy()].reset_index(drop=True)
+
+
+class TestFetchSpatialRecords:
+    """Test chunking of the SDA spatial query."""
+
+    @pytest.fixture
+    def soils(self):
+        return gpd.GeoDataFrame(
+            {"mukey": ["1", "2", "3"]},
+            geometry=[
+                Polygon([(0, 0), (2, 0), (2, 1), (0, 1)]),
+                Polygon([(2, 0), (4, 0), (4, 1), (2, 1)]),
+                Polygon([(4, 0), (6, 0), (6, 1), (4, 1)]),
+            ],
+            crs="EPSG:4326",
+        )
+
+    @pytest.fixture
+    def aoi(self):
+        # Three features; the first two both overlap map unit "1".
+        return gpd.GeoDataFrame(
+            {"id": [1, 2, 3]},
+            geometry=[
+                Polygon([(0.2, 0.2), (0.8, 0.2), (0.8, 0.8), (0.2, 0.8)]),
+                Polygon([(1.2, 0.2), (2.5, 0.2), (2.5, 0.8), (1.2, 0.8)]),
+                Polygon([(4.2, 0.2), (4.8, 0.2), (4.8, 0.8), (4.2, 0.8)]),
+            ],
+            crs="EPSG:4326",
+        )
+
+    def test_without_chunk_size_sends_one_request(self, soils, aoi):
+        """Test that the whole AOI goes in a single request by default."""
+        sdapoly = _FakeSdaPoly(soils)
+
+        result = _fetch_spatial_records(sdapoly, aoi, None)
+
+        assert sdapoly.requests == [3]
+        assert result["mukey"].tolist() == ["1", "2", "3"]
+
+    def test_chunks_are_merged_without_duplicates(self, soils, aoi):
+        """Test that per-feature requests return each map unit polygon once."""
+        sdapoly = _FakeSdaPoly(soils)
+
+        result = _fetch_spatial_records(sdapoly, aoi, 1)
+
+        assert sdapoly.requests == [1, 1, 1]
+        assert result["mukey"].tolist() == ["1", "2", "3"]
+        assert result.crs == soils.crs
+
+    def test_parallel_chunks_match_serial(self, soils, aoi):
+        """Test that concurrent chunk requests merge to the serial result."""
+        serial = _fetch_spatial_records(_FakeSdaPoly(soils), aoi, 1)
+
+        parallel = _fetch_spatial_records(_FakeSdaPoly(soils), aoi, 1, max_workers=3)
+
+        assert parallel["mukey"].tolist() == serial["mukey"].tolist()
+
+
+class TestRunRequests:
+    """Test the concurrent SDA request runner."""
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_results_keep_input_order(self, max_workers):
+        """Test that results line up with their inputs however many threads run."""
+        assert _run_requests(lambda x: x * 2, range(10), max_workers) == [x * 2 for x in range(10)]
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_cancel_check_stops_requests(self, max_workers):
+        """Test that a True cancel_check raises before every request has run."""
+        calls = []
+
+        def request(item):
+            calls.append(item)
+            time.sleep(0.02)
+            return item
+
+        with pytest.raises(PipelineCancelled):
+            _run_requests(request, range(10), max_workers, cancel_check=lambda: len(calls) >= 1)
+        assert len(calls) < 10
+
+    def test_request_errors_propagate(self):
+        """Test that a failed request surfaces from the thread pool."""
+
+        def request(item):
+            if item == 3:
+                raise RuntimeError("SDA unavailable")
+            return item
+
+        with pytest.raises(RuntimeError, match="SDA unavailable"):
+            _run_requests(request, range(5), max_workers=2)
+
+
+class TestSimplifiedQueryAoi:
+    """Test simplification of the geometry sent to SDA."""
+
+    def test_covers_aoi_with_fewer_vertices(self):
+        """Test that the query geometry drops vertices but still contains the AOI."""
+        import shapely
+
+        circle = Point(-90.0, 40.0).buffer(0.01, quad_segs=256)
+        aoi = gpd.GeoDataFrame({"id": [1]}, geometry=[circle], crs="EPSG:4326")
+
+        query = _simplified_query_aoi(aoi, 50.0)
+
+        assert len(query) == 1
+        assert shapely.get_num_coordinates(query.geometry.iloc[0]) < shapely.get_num_coordinates(circle)
+        assert query.geometry.iloc[0].contains(circle)
+
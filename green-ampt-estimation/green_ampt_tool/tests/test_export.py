@@ -1,13 +1,10 @@
-import sys
-from pathlib import Path
 import pytest
 import pandas as pd
 import geopandas as gpd
 from shapely.geometry import Point
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
-
-from green_ampt_tool.export import export_raw_ssurgo_data, export_parameter_vectors
+from green_ampt_tool.export import RAW_EXPORT_FILES, export_raw_ssurgo_data, export_parameter_vectors
+from green_ampt_tool._compat import PYARROW_AVAILABLE
 from green_ampt_tool.data_access import SSURGOData
 from green_ampt_tool.config import PipelineConfig
 
@@ -42,6 +39,27 @@ class TestExportRawSSURGOData:
         assert (target_dir / "component_raw.txt").exists()
         assert (target_dir / "chorizon_raw.txt").exists()
 
+    @pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow not installed")
+    def test_parquet_export_round_trips(self, tmp_path):
+        """Test that the Parquet format writes (Geo)Parquet files that read back unchanged."""
+        mupolygon = gpd.GeoDataFrame(
+            {"mukey": ["1", "2"], "geometry": [Point(0, 0), Point(1, 1)]},
+            crs="EPSG:4326",
+        )
+        mapunit = pd.DataFrame({"mukey": ["1", "2"], "muname": ["Soil A", "Soil B"]})
+        component = pd.DataFrame({"mukey": ["1", "2"], "cokey": ["10", "20"], "comppct_r": [85, 15]})
+        chorizon = pd.DataFrame({"cokey": ["10", "20"], "hzdept_r": [0, 0], "hzdepb_r": [10, 10]})
+        data = SSURGOData(mupolygon=mupolygon, mapunit=mapunit, component=component, chorizon=chorizon)
+
+        target_dir = tmp_path / "raw_data"
+        export_raw_ssurgo_data(data, target_dir, "parquet")
+
+        assert sorted(path.name for path in target_dir.iterdir()) == sorted(RAW_EXPORT_FILES["parquet"])
+        restored = gpd.read_parquet(target_dir / "mupolygon_raw.parquet")
+        assert restored.crs == mupolygon.crs
+        assert restored.geometry.geom_equals(mupolygon.geometry).all()
+        pd.testing.assert_frame_equal(pd.read_parquet(target_dir / "component_raw.parquet"), component)
+
     def test_creates_directory_if_missing(self, tmp_path):
         """Test that target directory is created if it doesn't exist."""
         mupolygon = gpd.GeoDataFrame(
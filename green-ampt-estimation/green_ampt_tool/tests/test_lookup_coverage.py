@@ -4,14 +4,10 @@ Additional tests for lookup.py to improve coverage.
 These tests cover edge cases and less-traveled code paths in the lookup module.
 """
 
-import sys
-from pathlib import Path
 
 import pandas as pd
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
-
 from green_ampt_tool.lookup import (
     _norm_texcl,
     _derive_texcl_from_percentages,
@@ -11,14 +11,17 @@ The values in these tables are based on peer-reviewed literature and NRCS standa
 - Green-Ampt SWMM Parameters documentation
 """
 
-import sys
-from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from green_ampt_tool.lookup import (
+    GA_TABLE_US,
+    HSG_KSAT_RANGES_INHR,
+    HSG_KSAT_TABLE,
+    _validate_hsg_tables,
+)
 
-from green_ampt_tool.lookup import GA_TABLE_US, HSG_KSAT_RANGES_INHR, HSG_KSAT_TABLE
+pytestmark = [pytest.mark.xdist_group("lookup")]
 
 
 class TestGATableUSValidation:
@@ -143,6 +146,13 @@ class TestHSGKsatTableValidation:
         for hsg, params in HSG_KSAT_TABLE.items():
             assert "ks_inhr" in params
             assert params["ks_inhr"] > 0
+
+    def test_malformed_tables_rejected(self):
+        """The import-time schema check should name the offending HSG."""
+        with pytest.raises(ValueError, match="'B'.*max"):
+            _validate_hsg_tables({"A": {"min": 0.45, "max": 1.0}, "B": {"min": 0.15}}, {})
+        with pytest.raises(ValueError, match="'C'.*ks_inhr"):
+            _validate_hsg_tables({}, {"C": {"ks_inhr": 0.0}})
     
     def test_values_within_valid_ranges(self):
         """Representative values should fall within their respective HSG ranges."""
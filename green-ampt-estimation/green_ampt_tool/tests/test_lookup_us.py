@@ -1,16 +1,14 @@
 import json
-import sys
-from pathlib import Path
 
 import pandas as pd
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
-
 from green_ampt_tool.lookup import component_surface_params_us, mapunit_params_us
 from green_ampt_tool.parameters import build_lookup_parameters
 from green_ampt_tool.processing import summarize_hsg
 
+pytestmark = [pytest.mark.xdist_group("lookup")]
+
 
 def test_harmonic_vs_arithmetic():
     horizons = pd.DataFrame(
@@ -25,7 +23,7 @@ def test_harmonic_vs_arithmetic():
     )
 
     comp = component_surface_params_us(horizons, surface_top_cm=0.0, surface_bot_cm=10.0)
-    ks = comp.loc[(comp["mukey"] == "1") & (comp["cokey"] == "10"), "Ks_inhr"].iloc[0]
+    ks = comp.set_index(["mukey", "cokey"]).at[("1", "10"), "Ks_inhr"]
     assert ks < 0.2
 
 
@@ -100,7 +98,7 @@ def test_lookup_loam_units_and_theta_relationships():
     )
     params = build_lookup_parameters(components, horizons)
     assert len(params) == 1
-    row = params.iloc[0]
+    row = params.iloc[0].to_dict()
     assert row["Ks_inhr"] == pytest.approx(0.13, rel=1e-6)
     assert row["psi_in"] == pytest.approx(3.50, rel=1e-6)
     assert row["theta_i_cont"] == pytest.approx(row["theta_s"] - row["init_def"], rel=1e-6)
@@ -1,12 +1,11 @@
-import sys
-from pathlib import Path
+from collections.abc import Mapping
+from math import isclose
+
+import numpy as np
 import pytest
 import pandas as pd
-import geopandas as gpd
-from shapely.geometry import Point
-
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
+from green_ampt_tool import parameters as parameters_module
 from green_ampt_tool.parameters import (
     default_wetting_front_suction,
     enrich_with_green_ampt_parameters,
@@ -16,145 +15,164 @@ from green_ampt_tool.parameters import (
     enrich_with_lookup_parameters,
     emit_units_summary,
     _clamp_percentage,
+    _clamp_percentage_nb,
+    _default_suction_array,
     _safe_float,
 )
 
+pytestmark = pytest.mark.filterwarnings("ignore::DeprecationWarning:pyproj")
+
+
+def _eq(actual, expected):
+    """Scalar float assertion without building a ``pytest.approx`` object."""
+    assert isclose(actual, expected, rel_tol=1e-9, abs_tol=1e-12), (actual, expected)
+
 
 class TestDefaultWettingFrontSuction:
     """Test default_wetting_front_suction pedotransfer function."""
 
-    def test_pure_sand(self):
-        """Test suction for pure sand."""
-        result = default_wetting_front_suction(100.0, 0.0)
-        # 20 * (100/100) + 10 * (0/100) = 20
-        assert result == pytest.approx(20.0)
-
-    def test_pure_clay(self):
-        """Test suction for pure clay."""
-        result = default_wetting_front_suction(0.0, 100.0)
-        # 20 * (0/100) + 10 * (100/100) = 10
-        assert result == pytest.approx(10.0)
-
-    def test_mixed_soil(self):
-        """Test suction for mixed soil."""
-        result = default_wetting_front_suction(50.0, 20.0)
-        # 20 * (50/100) + 10 * (20/100) = 10 + 2 = 12
-        assert result == pytest.approx(12.0)
-
-    def test_out_of_bounds_values(self):
-        """Test that values are clamped to 0-100 range."""
-        result1 = default_wetting_front_suction(-10.0, 50.0)
-        result2 = default_wetting_front_suction(0.0, 50.0)
-        assert result1 == result2
-        
-        result3 = default_wetting_front_suction(50.0, 150.0)
-        result4 = default_wetting_front_suction(50.0, 100.0)
-        assert result3 == result4
+    @pytest.mark.parametrize(
+        "sand,clay,expected",
+        [
+            (100.0, 0.0, 20.0),  # pure sand: 20 * 1 + 10 * 0
+            (0.0, 100.0, 10.0),  # pure clay: 20 * 0 + 10 * 1
+            (50.0, 20.0, 12.0),  # mixed: 20 * 0.5 + 10 * 0.2
+            (-10.0, 50.0, 5.0),  # sand clamped to 0
+            (50.0, 150.0, 20.0),  # clay clamped to 100
+        ],
+    )
+    def test_suction(self, sand, clay, expected):
+        """Test suction values, including clamping to the 0-100 range."""
+        _eq(default_wetting_front_suction(sand, clay), expected)
+
+
+@pytest.fixture(scope="class")
+def base_soils(make_soils):
+    """One-row soils frame shared per class; tests take shallow copies."""
+    return make_soils({"mukey": ["1"]})
+
+
+# Explicit edge cases followed by a seeded batch straddling both bounds.
+_THETA_S_BATCH = np.concatenate(
+    [[-0.1, 0.5, 1.5], np.random.default_rng(0).uniform(-0.5, 1.5, 1021)]
+)
+
+
+@pytest.fixture(scope="class")
+def batch_soils(make_soils):
+    """Soils frame sized to ``_THETA_S_BATCH``; tests take shallow copies."""
+    return make_soils({"mukey": [str(i) for i in range(len(_THETA_S_BATCH))]})
 
 
 class TestEnrichWithGreenAmptParameters:
     """Test enrich_with_green_ampt_parameters function."""
 
-    def test_basic_enrichment(self):
+    def test_basic_enrichment(self, base_soils):
         """Test basic parameter enrichment."""
-        soils = gpd.GeoDataFrame(
-            {
-                "mukey": ["1"],
-                "ksat": [5.0],
-                "theta_s": [0.45],
-                "sand_pct": [50.0],
-                "clay_pct": [20.0],
-                "geometry": [Point(0, 0)],
-            },
-            crs="EPSG:4326",
-        )
+        soils = base_soils.copy(deep=False)
+        soils["ksat"] = [5.0]
+        soils["theta_s"] = [0.45]
+        soils["sand_pct"] = [50.0]
+        soils["clay_pct"] = [20.0]
         
         result = enrich_with_green_ampt_parameters(soils)
         
         assert "psi" in result.columns
         assert "theta_i" in result.columns
-        assert result.iloc[0]["theta_i"] == pytest.approx(0.2)
+        _eq(result.iloc[0]["theta_i"], 0.2)
+
+    def test_default_psi_matches_scalar_ptf(self, make_soils):
+        """Test the column-wise default suction equals the scalar PTF per row."""
+        sand = [50.0, -5.0, 120.0, None]
+        clay = [20.0, 30.0, 10.0, 40.0]
+        soils = make_soils({"sand_pct": sand, "clay_pct": clay})
 
-    def test_missing_columns_use_defaults(self):
-        """Test that missing columns use default values."""
-        soils = gpd.GeoDataFrame(
-            {
-                "mukey": ["1"],
-                "geometry": [Point(0, 0)],
-            },
-            crs="EPSG:4326",
-        )
-        
         result = enrich_with_green_ampt_parameters(soils)
+
+        for psi, s, c in zip(result["psi"], sand, clay):
+            _eq(psi, default_wetting_front_suction(s, c))
+
+    def test_missing_columns_use_defaults(self, base_soils):
+        """Test that missing columns use default values."""
+        result = enrich_with_green_ampt_parameters(base_soils)
         
         assert "ksat" in result.columns
         assert "theta_s" in result.columns
         assert "psi" in result.columns
-        assert result.iloc[0]["ksat"] == pytest.approx(0.0)
+        _eq(result.iloc[0]["ksat"], 0.0)
+        assert "ksat" not in base_soils.columns
 
-    def test_theta_s_bounds(self):
-        """Test that theta_s is bounded between 0 and 0.9."""
-        soils = gpd.GeoDataFrame(
-            {
-                "mukey": ["1", "2", "3"],
-                "theta_s": [-0.1, 0.5, 1.5],
-                "geometry": [Point(0, 0), Point(1, 1), Point(2, 2)],
-            },
-            crs="EPSG:4326",
-        )
+    def test_theta_s_bounds(self, batch_soils):
+        """Test that theta_s is bounded between 0 and 0.9 across a batch."""
+        soils = batch_soils.copy(deep=False)
+        soils["theta_s"] = _THETA_S_BATCH
         
         result = enrich_with_green_ampt_parameters(soils)
         
-        assert result.iloc[0]["theta_s"] == pytest.approx(0.0)
-        assert result.iloc[1]["theta_s"] == pytest.approx(0.5)
-        assert result.iloc[2]["theta_s"] == pytest.approx(0.9)
+        theta_s = result["theta_s"].to_numpy()
+        assert theta_s[:3].tolist() == [0.0, 0.5, 0.9]
+        assert np.array_equal(theta_s, np.clip(_THETA_S_BATCH, 0.0, 0.9))
 
-    def test_custom_suction_function(self):
+    def test_custom_suction_function(self, base_soils):
         """Test using custom suction function."""
         def custom_suction(sand, clay):
             return 50.0  # Constant value
         
-        soils = gpd.GeoDataFrame(
-            {
-                "mukey": ["1"],
-                "sand_pct": [50.0],
-                "clay_pct": [20.0],
-                "geometry": [Point(0, 0)],
-            },
-            crs="EPSG:4326",
-        )
+        soils = base_soils.copy(deep=False)
+        soils["sand_pct"] = [50.0]
+        soils["clay_pct"] = [20.0]
         
         result = enrich_with_green_ampt_parameters(soils, suction_fn=custom_suction)
         
-        assert result.iloc[0]["psi"] == pytest.approx(50.0)
+        _eq(result.iloc[0]["psi"], 50.0)
 
-    def test_custom_initial_theta(self):
+    def test_custom_initial_theta(self, base_soils):
         """Test using custom initial theta."""
-        soils = gpd.GeoDataFrame(
-            {
-                "mukey": ["1"],
-                "geometry": [Point(0, 0)],
-            },
-            crs="EPSG:4326",
-        )
-        
-        result = enrich_with_green_ampt_parameters(soils, initial_theta=0.35)
+        result = enrich_with_green_ampt_parameters(base_soils, initial_theta=0.35)
         
-        assert result.iloc[0]["theta_i"] == pytest.approx(0.35)
+        _eq(result.iloc[0]["theta_i"], 0.35)
 
-    def test_preserves_crs(self):
+    def test_preserves_crs(self, base_soils):
         """Test that CRS is preserved."""
-        soils = gpd.GeoDataFrame(
-            {
-                "mukey": ["1"],
-                "geometry": [Point(0, 0)],
-            },
-            crs="EPSG:4326",
-        )
+        result = enrich_with_green_ampt_parameters(base_soils)
         
-        result = enrich_with_green_ampt_parameters(soils)
-        
-        assert result.crs == soils.crs
+        assert result.crs == base_soils.crs
+
+
+_COMP_COLS = ("mukey", "cokey", "comppct_r", "hydgrp", "majcompflag")
+_HZ_COLS = ("cokey", "chkey", "texcl", "hzdept_r", "hzdepb_r")
+
+
+def _components(rows):
+    """Component table from tuples ordered as ``_COMP_COLS``."""
+    return pd.DataFrame.from_records(rows, columns=_COMP_COLS).astype({"comppct_r": "int32"})
+
+
+def _horizons(rows):
+    """Horizon table from tuples ordered as ``_HZ_COLS``."""
+    return pd.DataFrame.from_records(rows, columns=_HZ_COLS).astype(
+        {"hzdept_r": "float32", "hzdepb_r": "float32"}
+    )
+
+
+@pytest.fixture(scope="module")
+def lookup_result():
+    """Run build_lookup_parameters once for the map units the lookup tests inspect."""
+    components = _components(
+        [
+            ("1", "10", 100, "B", "Yes"),
+            ("2", "20", 100, "A", "Yes"),
+            ("3", "30", 100, "A/D", "Yes"),
+        ]
+    )
+    horizons = _horizons(
+        [
+            ("10", "100", "Loam", 0.0, 10.0),
+            ("20", "200", "Sand", 0.0, 10.0),
+            ("30", "300", "Sand", 0.0, 10.0),
+        ]
+    )
+    return build_lookup_parameters(components, horizons)
 
 
 class TestBuildLookupParameters:
@@ -171,116 +189,43 @@ class TestBuildLookupParameters:
         assert "mukey" in result.columns
         assert "Ks_inhr" in result.columns
 
-    def test_basic_lookup(self):
+    @pytest.mark.slow
+    def test_basic_lookup(self, lookup_result):
         """Test basic lookup parameter building."""
-        components = pd.DataFrame(
-            {
-                "mukey": ["1"],
-                "cokey": ["10"],
-                "comppct_r": [100],
-                "hydgrp": ["B"],
-                "majcompflag": ["Yes"],
-            }
-        )
-        
-        horizons = pd.DataFrame(
-            {
-                "cokey": ["10"],
-                "chkey": ["100"],
-                "texcl": ["Loam"],
-                "hzdept_r": [0.0],
-                "hzdepb_r": [10.0],
-            }
-        )
-        
-        result = build_lookup_parameters(components, horizons)
-        
-        assert len(result) == 1
-        assert "Ks_inhr" in result.columns
-        assert "psi_in" in result.columns
-        assert "theta_s" in result.columns
+        assert sorted(lookup_result["mukey"]) == ["1", "2", "3"]
+        assert "Ks_inhr" in lookup_result.columns
+        assert "psi_in" in lookup_result.columns
+        assert "theta_s" in lookup_result.columns
 
-    def test_initial_deficit_calculations(self):
+    @pytest.mark.slow
+    def test_initial_deficit_calculations(self, lookup_result):
         """Test that initial deficit calculations are included."""
-        components = pd.DataFrame(
-            {
-                "mukey": ["1"],
-                "cokey": ["10"],
-                "comppct_r": [100],
-                "hydgrp": ["A"],
-                "majcompflag": ["Yes"],
-            }
-        )
-        
-        horizons = pd.DataFrame(
-            {
-                "cokey": ["10"],
-                "texcl": ["Sand"],
-                "hzdept_r": [0.0],
-                "hzdepb_r": [10.0],
-            }
-        )
-        
-        result = build_lookup_parameters(components, horizons)
-        
-        assert "theta_i_design" in result.columns
-        assert "theta_i_cont" in result.columns
-        assert "dtheta_design" in result.columns
-        assert "dtheta_cont" in result.columns
+        assert "theta_i_design" in lookup_result.columns
+        assert "theta_i_cont" in lookup_result.columns
+        assert "dtheta_design" in lookup_result.columns
+        assert "dtheta_cont" in lookup_result.columns
 
-    def test_hsg_merge(self):
+    @pytest.mark.slow
+    def test_hsg_merge(self, lookup_result):
         """Test that HSG information is merged."""
-        components = pd.DataFrame(
-            {
-                "mukey": ["1"],
-                "cokey": ["10"],
-                "comppct_r": [100],
-                "hydgrp": ["A/D"],
-                "majcompflag": ["Yes"],
-            }
-        )
-        
-        horizons = pd.DataFrame(
-            {
-                "cokey": ["10"],
-                "texcl": ["Sand"],
-                "hzdept_r": [0.0],
-                "hzdepb_r": [10.0],
-            }
-        )
-        
-        result = build_lookup_parameters(components, horizons)
-        
-        assert "hsg_dom" in result.columns
-        assert "hsg_drained" in result.columns
-        assert result.iloc[0]["hsg_dom"] == "A"
-        assert result.iloc[0]["hsg_drained"] == "D"
+        row = lookup_result.set_index("mukey").loc["3"]
+
+        assert row["hsg_dom"] == "A"
+        assert row["hsg_drained"] == "D"
 
 
 class TestBuildHSGLookupParameters:
     """Test build_hsg_lookup_parameters function."""
 
+    @pytest.mark.slow
     def test_basic_hsg_lookup(self):
         """Test basic HSG-based parameter lookup."""
-        components = pd.DataFrame(
-            {
-                "mukey": ["1", "2"],
-                "cokey": ["10", "20"],
-                "comppct_r": [100, 100],
-                "hydgrp": ["A", "D"],
-                "majcompflag": ["Yes", "Yes"],
-            }
+        components = _components(
+            [("1", "10", 100, "A", "Yes"), ("2", "20", 100, "D", "Yes")]
         )
-        
         # Create minimal horizons data for the components
-        horizons = pd.DataFrame(
-            {
-                "cokey": ["10", "20"],
-                "chkey": ["100", "200"],
-                "texcl": ["Sand", "Clay"],
-                "hzdept_r": [0, 0],
-                "hzdepb_r": [10, 10],
-            }
+        horizons = _horizons(
+            [("10", "100", "Sand", 0.0, 10.0), ("20", "200", "Clay", 0.0, 10.0)]
         )
         
         result = build_hsg_lookup_parameters(components, horizons)
@@ -307,54 +252,48 @@ class TestBuildHSGLookupParameters:
 class TestApplyInitialDeficitMode:
     """Test apply_initial_deficit_mode function."""
 
-    def test_design_mode(self):
+    def test_design_mode(self, make_soils):
         """Test design mode application."""
-        soils = gpd.GeoDataFrame(
+        soils = make_soils(
             {
                 "mukey": ["1"],
                 "theta_i_design": [0.3],
                 "theta_i_cont": [0.4],
                 "dtheta_design": [0.2],
                 "dtheta_cont": [0.1],
-                "geometry": [Point(0, 0)],
-            },
-            crs="EPSG:4326",
+            }
         )
         
         result = apply_initial_deficit_mode(soils, mode="design")
         
         assert "theta_i" in result.columns
         assert "dtheta" in result.columns
-        assert result.iloc[0]["theta_i"] == pytest.approx(0.3)
-        assert result.iloc[0]["dtheta"] == pytest.approx(0.2)
+        _eq(result.iloc[0]["theta_i"], 0.3)
+        _eq(result.iloc[0]["dtheta"], 0.2)
 
-    def test_continuous_mode(self):
+    def test_continuous_mode(self, make_soils):
         """Test continuous mode application."""
-        soils = gpd.GeoDataFrame(
+        soils = make_soils(
             {
                 "mukey": ["1"],
                 "theta_i_design": [0.3],
                 "theta_i_cont": [0.4],
                 "dtheta_design": [0.2],
                 "dtheta_cont": [0.1],
-                "geometry": [Point(0, 0)],
-            },
-            crs="EPSG:4326",
+            }
         )
         
         result = apply_initial_deficit_mode(soils, mode="continuous")
         
-        assert result.iloc[0]["theta_i"] == pytest.approx(0.4)
-        assert result.iloc[0]["dtheta"] == pytest.approx(0.1)
+        _eq(result.iloc[0]["theta_i"], 0.4)
+        _eq(result.iloc[0]["dtheta"], 0.1)
 
-    def test_missing_columns_no_error(self):
+    def test_missing_columns_no_error(self, make_soils):
         """Test that missing columns don't cause errors."""
-        soils = gpd.GeoDataFrame(
+        soils = make_soils(
             {
                 "mukey": ["1"],
-                "geometry": [Point(0, 0)],
-            },
-            crs="EPSG:4326",
+            }
         )
         
         # Should not raise error
@@ -365,35 +304,41 @@ class TestApplyInitialDeficitMode:
 class TestEnrichWithLookupParameters:
     """Test enrich_with_lookup_parameters wrapper function."""
 
-    def test_applies_design_mode_by_default(self):
+    def test_applies_design_mode_by_default(self, make_soils):
         """Test that design mode is applied by default."""
-        soils = gpd.GeoDataFrame(
+        soils = make_soils(
             {
                 "mukey": ["1"],
                 "theta_i_design": [0.3],
                 "theta_i_cont": [0.4],
-                "geometry": [Point(0, 0)],
-            },
-            crs="EPSG:4326",
+            }
         )
         
         result = enrich_with_lookup_parameters(soils)
         
-        assert result.iloc[0]["theta_i"] == pytest.approx(0.3)
+        _eq(result.iloc[0]["theta_i"], 0.3)
 
 
 class TestEmitUnitsSummary:
     """Test emit_units_summary function."""
 
-    def test_returns_dict(self):
-        """Test that function returns dictionary."""
+    def test_returns_mapping(self):
+        """Test that function returns a mapping."""
         result = emit_units_summary()
         
-        assert isinstance(result, dict)
+        assert isinstance(result, Mapping)
         assert "Ks_inhr" in result
         assert "theta_s" in result
         assert "hsg_dom" in result
 
+    def test_returns_cached_object(self):
+        """Test that repeated calls share one read-only mapping."""
+        result = emit_units_summary()
+
+        assert emit_units_summary() is result
+        with pytest.raises(TypeError):
+            result["Ks_inhr"] = "changed"
+
     def test_all_expected_keys(self):
         """Test that all expected keys are present."""
         result = emit_units_summary()
@@ -423,56 +368,67 @@ class TestEmitUnitsSummary:
 class TestClampPercentage:
     """Test _clamp_percentage utility function."""
 
-    def test_normal_value(self):
-        """Test normal percentage value."""
-        assert _clamp_percentage(50.0) == 50.0
-
-    def test_negative_value(self):
-        """Test negative value is clamped to 0."""
-        assert _clamp_percentage(-10.0) == 0.0
-
-    def test_over_100_value(self):
-        """Test value over 100 is clamped to 100."""
-        assert _clamp_percentage(150.0) == 100.0
-
-    def test_zero_value(self):
-        """Test zero value."""
-        assert _clamp_percentage(0.0) == 0.0
-
-    def test_hundred_value(self):
-        """Test 100 value."""
-        assert _clamp_percentage(100.0) == 100.0
-
-    def test_none_value(self):
-        """Test None value returns 0."""
-        assert _clamp_percentage(None) == 0.0
-
-    def test_nan_value(self):
-        """Test NaN value returns 0."""
-        assert _clamp_percentage(float("nan")) == 0.0
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (50.0, 50.0),
+            (-10.0, 0.0),
+            (150.0, 100.0),
+            (0.0, 0.0),
+            (100.0, 100.0),
+            (None, 0.0),
+            (float("nan"), 0.0),
+        ],
+    )
+    def test_clamp(self, value, expected):
+        """Test clamping to 0-100, with missing values mapped to 0."""
+        assert _clamp_percentage(value) == expected
+
+
+class TestClampPercentageNumba:
+    """Test the compiled clamp and column-wise suction mirror the Python helpers."""
+
+    @pytest.mark.parametrize(
+        "value", [50.0, -10.0, 150.0, 0.0, 100.0, float("nan")]
+    )
+    def test_matches_python(self, value):
+        """Test the compiled helper agrees with the Python helper."""
+        assert _clamp_percentage_nb(value) == _clamp_percentage(value)
+
+    @pytest.mark.parametrize(
+        "sand,clay", [(100.0, 0.0), (50.0, 20.0), (-10.0, 150.0), (float("nan"), 30.0)]
+    )
+    def test_suction_matches_python(self, sand, clay):
+        """Test the column-wise suction agrees with the default PTF."""
+        psi = _default_suction_array(np.array([sand]), np.array([clay]))
+        _eq(psi[0], default_wetting_front_suction(sand, clay))
+
+    def test_numpy_fallback_matches_compiled(self, monkeypatch):
+        """Test the numpy path used without numba gives the same suction."""
+        sand = np.array([100.0, 50.0, -10.0, np.nan, np.inf])
+        clay = np.array([0.0, 20.0, 150.0, 30.0, -np.inf])
+        expected = _default_suction_array(sand, clay)
+
+        monkeypatch.setattr(parameters_module, "NUMBA_AVAILABLE", False)
+
+        np.testing.assert_array_equal(_default_suction_array(sand, clay), expected)
 
 
 class TestSafeFloat:
     """Test _safe_float utility function."""
 
-    def test_valid_float(self):
-        """Test valid float conversion."""
-        assert _safe_float(5.0) == 5.0
-        assert _safe_float("5.0") == 5.0
-        assert _safe_float(5) == 5.0
-
-    def test_none_value(self):
-        """Test None returns None."""
-        assert _safe_float(None) is None
-
-    def test_nan_value(self):
-        """Test NaN returns None."""
-        assert _safe_float(float("nan")) is None
-
-    def test_invalid_string(self):
-        """Test invalid string returns None."""
-        assert _safe_float("not a number") is None
-
-    def test_empty_string(self):
-        """Test empty string returns None."""
-        assert _safe_float("") is None
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (5.0, 5.0),
+            ("5.0", 5.0),
+            (5, 5.0),
+            (None, None),
+            (float("nan"), None),
+            ("not a number", None),
+            ("", None),
+        ],
+    )
+    def test_safe_float(self, value, expected):
+        """Test conversion, with missing and invalid values mapped to None."""
+        assert _safe_float(value) == expected
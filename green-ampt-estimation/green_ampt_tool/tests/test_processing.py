@@ -1,20 +1,20 @@
-import sys
-from pathlib import Path
 import json
+import numpy as np
 import pytest
 import pandas as pd
 import geopandas as gpd
 from shapely.geometry import Point, Polygon
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
-
+from green_ampt_tool import processing
 from green_ampt_tool.processing import (
     clip_to_aoi,
     summarize_mapunit_properties,
     attach_properties,
     summarize_hsg,
-    _weighted_mean,
+    _grouped_weighted_mean,
     _parse_dual_hsg,
+    _parse_dual_hsg_series,
+    _union_geometry,
 )
 
 
@@ -47,6 +47,69 @@ class TestClipToAOI:
         assert len(clipped) == 1
         assert "1" in clipped["mukey"].values
 
+    def test_threaded_clip_matches_serial(self, monkeypatch):
+        """Test that splitting boundary intersections across threads changes nothing."""
+        aoi = gpd.GeoDataFrame(
+            {"geometry": [Point(5, 5).buffer(4)]},
+            crs="EPSG:4326",
+        )
+        mupolygon = gpd.GeoDataFrame(
+            {
+                "mukey": [str(i) for i in range(100)],
+                "geometry": [
+                    Polygon([(x, y), (x + 1, y), (x + 1, y + 1), (x, y + 1)])
+                    for x in range(10)
+                    for y in range(10)
+                ],
+            },
+            crs="EPSG:4326",
+        )
+        serial = clip_to_aoi(mupolygon, aoi)
+
+        monkeypatch.setattr(processing, "_CLIP_CHUNK_MIN", 1)
+        monkeypatch.setattr(processing.os, "cpu_count", lambda: 4)
+        threaded = clip_to_aoi(mupolygon, aoi)
+
+        assert threaded.index.equals(serial.index)
+        assert threaded.geometry.geom_equals_exact(serial.geometry, tolerance=0).all()
+
+    def test_interior_polygons_kept_and_edges_cut(self):
+        """Test that interior polygons keep their shape and edge polygons are cut."""
+        aoi = gpd.GeoDataFrame(
+            {"geometry": [Polygon([(0, 0), (4, 0), (4, 4), (0, 4)])]},
+            crs="EPSG:4326",
+        )
+        inner = Polygon([(1, 1), (2, 1), (2, 2), (1, 2)])
+        mupolygon = gpd.GeoDataFrame(
+            {
+                "mukey": ["1", "2"],
+                "geometry": [inner, Polygon([(3, 3), (5, 3), (5, 5), (3, 5)])],
+            },
+            crs="EPSG:4326",
+        )
+
+        clipped = clip_to_aoi(mupolygon, aoi)
+
+        assert clipped.geometry.iloc[0].equals(inner)
+        assert clipped.geometry.iloc[1].equals(Polygon([(3, 3), (4, 3), (4, 4), (3, 4)]))
+
+    def test_aoi_union_is_memoised(self):
+        """Test that the dissolved AOI is reused for an identical AOI frame."""
+        aoi = gpd.GeoDataFrame(
+            {
+                "geometry": [
+                    Polygon([(0, 0), (1, 0), (1, 1), (0, 1)]),
+                    Polygon([(1, 0), (2, 0), (2, 1), (1, 1)]),
+                ]
+            },
+            crs="EPSG:4326",
+        )
+
+        union = _union_geometry(aoi)
+
+        assert _union_geometry(aoi.copy()) is union
+        assert union.area == pytest.approx(2.0)
+
     def test_crs_mismatch_handling(self):
         """Test that CRS mismatch is handled correctly."""
         aoi = gpd.GeoDataFrame(
@@ -134,6 +197,29 @@ class TestSummarizeMapunitProperties:
         assert "sand_pct" in result.columns
         assert "clay_pct" in result.columns
         assert "theta_s" in result.columns
+        assert (result[["ksat", "sand_pct", "clay_pct", "theta_s"]].dtypes == np.float64).all()
+
+    def test_single_horizon_values_exact(self):
+        """Test that a single-horizon map unit reproduces its inputs without rounding."""
+        component = pd.DataFrame({"mukey": ["1"], "cokey": ["10"], "comppct_r": [100]})
+        chorizon = pd.DataFrame(
+            {
+                "cokey": ["10"],
+                "hzdept_r": [0],
+                "hzdepb_r": [10],
+                "ksat_r": [5.3],
+                "sandtotal_r": [27.3],
+                "claytotal_r": [18.1],
+                "dbthirdbar_r": [1.45],
+            }
+        )
+
+        result = summarize_mapunit_properties(component, chorizon)
+
+        assert result.iloc[0]["ksat"] == 5.3
+        assert result.iloc[0]["sand_pct"] == 27.3
+        assert result.iloc[0]["clay_pct"] == 18.1
+        assert result.iloc[0]["theta_s"] == pytest.approx(1 - 1.45 / 2.65, rel=1e-15)
 
     def test_depth_limiting(self):
         """Test that depth_limit_cm is respected."""
@@ -164,6 +250,26 @@ class TestSummarizeMapunitProperties:
         # Sand percentage should be closer to top horizon value
         assert result.iloc[0]["sand_pct"] == pytest.approx(50.0, abs=5.0)
 
+    def test_thickness_clipped_and_missing_depths_filled(self):
+        """Test weights use depth-clipped thickness, with a missing top read as 0."""
+        component = pd.DataFrame({"mukey": ["1"], "cokey": ["10"], "comppct_r": [100]})
+        chorizon = pd.DataFrame(
+            {
+                "cokey": ["10", "10", "10"],
+                "hzdept_r": [None, 10, 20],
+                "hzdepb_r": [10, 40, None],  # Last horizon has no thickness
+                "ksat_r": [1.0, 4.0, 100.0],
+                "sandtotal_r": [50.0, 50.0, 50.0],
+                "claytotal_r": [20.0, 20.0, 20.0],
+                "dbthirdbar_r": [1.5, 1.5, 1.5],
+            }
+        )
+
+        result = summarize_mapunit_properties(component, chorizon, depth_limit_cm=30.0)
+
+        # 10 cm at 1.0 and 20 cm (clipped from 30) at 4.0.
+        assert result.iloc[0]["ksat"] == pytest.approx(3.0)
+
     def test_empty_input_returns_empty(self):
         """Test that empty inputs return empty DataFrame."""
         component = pd.DataFrame(columns=["mukey", "cokey", "comppct_r"])
@@ -328,26 +434,91 @@ class TestAttachProperties:
         
         assert result.crs == mupolygon.crs
 
+    def test_input_unchanged_and_geometry_name_kept(self):
+        """Test that the input frame is not modified and a custom geometry column survives."""
+        mupolygon = gpd.GeoDataFrame(
+            {"mukey": [1, 2], "shape": [Point(0, 0), Point(1, 1)]},
+            geometry="shape",
+            crs="EPSG:4326",
+        )
+        aggregated = pd.DataFrame({"mukey": ["1", "2"], "ksat": [5.0, 3.0]})
+
+        result = attach_properties(mupolygon, aggregated)
+
+        assert isinstance(result, gpd.GeoDataFrame)
+        assert result.geometry.name == "shape"
+        assert result.crs == mupolygon.crs
+        assert result["ksat"].tolist() == [5.0, 3.0]
+        assert mupolygon["mukey"].tolist() == [1, 2]
+        assert "ksat" not in mupolygon.columns
+
+    def test_duplicate_aggregated_keys_raise(self):
+        """Test that duplicated map units in the aggregated table are rejected."""
+        mupolygon = gpd.GeoDataFrame(
+            {"mukey": ["1"], "geometry": [Point(0, 0)]},
+            crs="EPSG:4326",
+        )
+        aggregated = pd.DataFrame({"mukey": ["1", "1"], "ksat": [5.0, 6.0]})
+
+        with pytest.raises(pd.errors.MergeError):
+            attach_properties(mupolygon, aggregated)
+
+    def test_matches_left_merge_for_mixed_columns(self):
+        """Test that unmatched keys and mixed dtypes come out as a left merge would."""
+        mupolygon = gpd.GeoDataFrame(
+            {"mukey": ["2", "9", "1", "2"], "geometry": [Point(i, i) for i in range(4)]},
+            index=[10, 11, 12, 13],
+            crs="EPSG:4326",
+        )
+        aggregated = pd.DataFrame(
+            {"mukey": ["1", "2"], "hsg_dom": ["A", "C/D"], "n_comp": [1, 3], "ksat": [5.0, 3.0]}
+        )
+
+        result = attach_properties(mupolygon, aggregated)
+        expected = mupolygon.merge(aggregated, on="mukey", how="left")
+
+        pd.testing.assert_frame_equal(pd.DataFrame(result), pd.DataFrame(expected))
+
+    def test_clashing_column_names_keep_merge_suffixes(self):
+        """Test that a property already on the polygons gets merge's suffixes."""
+        mupolygon = gpd.GeoDataFrame(
+            {"mukey": ["1"], "ksat": [1.0], "geometry": [Point(0, 0)]},
+            crs="EPSG:4326",
+        )
+        aggregated = pd.DataFrame({"mukey": ["1"], "ksat": [5.0]})
+
+        result = attach_properties(mupolygon, aggregated)
+
+        assert result["ksat_x"].tolist() == [1.0]
+        assert result["ksat_y"].tolist() == [5.0]
+
+
+def _single_group_mean(values, weights):
+    """Weighted mean of one group through ``_grouped_weighted_mean``."""
+    values = np.asarray(values, dtype=np.float64)
+    weights = np.asarray(weights, dtype=np.float64)
+    return _grouped_weighted_mean(np.zeros(len(values), dtype=np.intp), 1, values, weights)[0]
+
 
 class TestWeightedMean:
-    """Test _weighted_mean utility function."""
+    """Test the weighted-mean rules for a single group."""
 
     def test_basic_weighted_mean(self):
         """Test basic weighted mean calculation."""
         values = pd.Series([10.0, 20.0, 30.0])
         weights = pd.Series([1.0, 2.0, 1.0])
         
-        result = _weighted_mean(values, weights)
+        result = _single_group_mean(values, weights)
         
         # (10*1 + 20*2 + 30*1) / (1+2+1) = 80/4 = 20
         assert result == pytest.approx(20.0)
 
-    def test_normalized_weights(self):
-        """Test weighted mean with normalization."""
+    def test_percentage_weights(self):
+        """Test that weights need not sum to one."""
         values = pd.Series([10.0, 20.0])
         weights = pd.Series([30.0, 70.0])
         
-        result = _weighted_mean(values, weights, normalize=True)
+        result = _single_group_mean(values, weights)
         
         # 0.3 * 10 + 0.7 * 20 = 3 + 14 = 17
         assert result == pytest.approx(17.0)
@@ -357,7 +528,7 @@ class TestWeightedMean:
         values = pd.Series([10.0, float("nan"), 30.0])
         weights = pd.Series([1.0, 1.0, 1.0])
         
-        result = _weighted_mean(values, weights)
+        result = _single_group_mean(values, weights)
         
         # Should skip NaN: (10*1 + 30*1) / (1+1) = 20
         assert result == pytest.approx(20.0)
@@ -367,7 +538,7 @@ class TestWeightedMean:
         values = pd.Series([10.0, 20.0, 30.0])
         weights = pd.Series([1.0, 0.0, 1.0])
         
-        result = _weighted_mean(values, weights)
+        result = _single_group_mean(values, weights)
         
         # Should skip zero weight: (10*1 + 30*1) / (1+1) = 20
         assert result == pytest.approx(20.0)
@@ -377,7 +548,7 @@ class TestWeightedMean:
         values = pd.Series([10.0, 20.0, 30.0])
         weights = pd.Series([0.0, 0.0, 0.0])
         
-        result = _weighted_mean(values, weights)
+        result = _single_group_mean(values, weights)
         
         # Should return simple mean: (10+20+30)/3 = 20
         assert result == pytest.approx(20.0)
@@ -387,10 +558,37 @@ class TestWeightedMean:
         values = pd.Series([float("nan"), float("nan")])
         weights = pd.Series([1.0, 1.0])
         
-        result = _weighted_mean(values, weights)
+        result = _single_group_mean(values, weights)
         
         assert pd.isna(result)
 
+    def test_accepts_arrays_with_missing_weights(self):
+        """Test plain numpy inputs, treating NaN weights as zero."""
+        values = np.array([10.0, 20.0, 30.0])
+        weights = np.array([1.0, float("nan"), 3.0])
+
+        result = _single_group_mean(values, weights)
+
+        # (10*1 + 30*3) / (1+3) = 25
+        assert result == pytest.approx(25.0)
+
+
+class TestGroupedWeightedMean:
+    """Test _grouped_weighted_mean keeps groups independent."""
+
+    def test_groups_match_single_group_means(self):
+        """Test weighted, zero-weight and all-NaN groups in one call."""
+        codes = np.array([0, 0, 1, 1, 2, 2])
+        values = np.array([10.0, 30.0, 10.0, 20.0, float("nan"), float("nan")])
+        weights = np.array([1.0, 3.0, 0.0, 0.0, 1.0, 1.0])
+
+        result = _grouped_weighted_mean(codes, 3, values, weights)
+
+        for group in range(3):
+            expected = _single_group_mean(values[codes == group], weights[codes == group])
+            np.testing.assert_equal(result[group], expected)
+        assert result.tolist()[:2] == [25.0, 15.0]
+
 
 class TestParseDualHSG:
     """Test _parse_dual_hsg utility function."""
@@ -438,6 +636,23 @@ class TestParseDualHSG:
         assert drained == "D"
 
 
+class TestParseDualHSGSeries:
+    """Test _parse_dual_hsg_series matches the scalar parser."""
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            ["A", "A/D", "C\\D", None, float("nan"), "", "b/d", "B/", " c "],
+            ["A", "B", None],  # no dual values at all
+        ],
+    )
+    def test_matches_scalar(self, values):
+        """Test element-wise agreement with _parse_dual_hsg."""
+        dry, drained = _parse_dual_hsg_series(values)
+
+        assert list(zip(dry, drained)) == [_parse_dual_hsg(value) for value in values]
+
+
 class TestSummarizeHSG:
     """Test summarize_hsg aggregation logic."""
 
@@ -497,6 +712,41 @@ class TestSummarizeHSG:
         assert comp["B"] == 30
         assert comp["C"] == 20
 
+    def test_composition_per_mapunit(self):
+        """Test grouping ignores the input index and zero totals give '{}'."""
+        components = pd.DataFrame(
+            {
+                "mukey": ["2", "1", "2", "2"],
+                "cokey": ["20", "10", "21", "22"],
+                "comppct_r": [30, 0, 60, 10],
+                "hydgrp": ["A/D", "B", "C", "A"],
+                "majcompflag": ["Yes", "No", "Yes", "No"],
+            },
+            index=[10, 5, 7, 3],
+        )
+
+        result = summarize_hsg(components)
+
+        assert result["mukey"].tolist() == ["2", "1"]
+        assert result.iloc[0]["hsg_comp"] == '{"C": 60, "A": 40}'
+        assert result.iloc[1]["hsg_comp"] == "{}"
+
+    def test_composition_empty_when_no_percentages(self):
+        """Test every map unit gets an empty composition when all percentages are zero."""
+        components = pd.DataFrame(
+            {
+                "mukey": ["1", "2"],
+                "cokey": ["10", "20"],
+                "comppct_r": [0, None],
+                "hydgrp": ["A", "B"],
+            }
+        )
+
+        result = summarize_hsg(components)
+
+        assert result["hsg_comp"].tolist() == ["{}", "{}"]
+        assert result["hsg_dom"].tolist() == ["A", "B"]
+
     def test_major_component_prioritization(self):
         """Test that major components are prioritized when percentages are equal."""
         components = pd.DataFrame(
@@ -514,6 +764,23 @@ class TestSummarizeHSG:
         # Should pick A because it's marked as major component (tiebreaker)
         assert result.iloc[0]["hsg_dom"] == "A"
 
+    def test_major_tiebreaker_independent_of_row_order(self):
+        """Test that the major flag wins a tie even when listed last, in any case."""
+        components = pd.DataFrame(
+            {
+                "mukey": ["1", "1"],
+                "cokey": ["10", "11"],
+                "comppct_r": [50, 50],
+                "hydgrp": ["B", "C"],
+                "majcompflag": ["No", "yes"],
+            }
+        )
+
+        result = summarize_hsg(components)
+
+        assert result.iloc[0]["hsg_dom"] == "C"
+        assert "_major" not in result.columns
+
     def test_empty_input(self):
         """Test empty input."""
         components = pd.DataFrame(columns=["mukey", "cokey", "comppct_r", "hydgrp", "majcompflag"])
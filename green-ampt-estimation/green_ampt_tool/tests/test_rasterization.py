@@ -1,13 +1,15 @@
+import subprocess
 import sys
+import textwrap
 from pathlib import Path
+
 import pytest
 import numpy as np
 import geopandas as gpd
 from shapely.geometry import Point, Polygon
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
-
-from green_ampt_tool.rasterization import prepare_grid, rasterize_parameters, RasterGrid
+from green_ampt_tool import rasterization
+from green_ampt_tool.rasterization import _gather, prepare_grid, rasterize_parameters, read_window, RasterGrid
 from green_ampt_tool.config import PipelineConfig
 
 try:
@@ -256,15 +258,11 @@ class TestRasterizeParameters:
         
         rasterize_parameters(vector, ["ksat"], config)
         
-        raster_path = config.build_raster_path("ksat")
-        
-        # Read and check values
-        with rasterio.open(raster_path) as src:
-            data = src.read(1)
-            # Most pixels should have the value 5.0 (or NaN outside polygon)
-            valid_pixels = data[~np.isnan(data)]
-            assert len(valid_pixels) > 0
-            assert np.all(valid_pixels == pytest.approx(5.0))
+        data = read_window(config, "ksat")
+        # Most pixels should have the value 5.0 (or NaN outside polygon)
+        valid_pixels = data[~np.isnan(data)]
+        assert len(valid_pixels) > 0
+        assert np.all(valid_pixels == pytest.approx(5.0))
 
     def test_nan_for_missing_values(self, tmp_path):
         """Test that NaN values are handled correctly."""
@@ -293,14 +291,202 @@ class TestRasterizeParameters:
         
         rasterize_parameters(vector, ["ksat"], config)
         
-        raster_path = config.build_raster_path("ksat")
-        
-        # Read and verify NaN handling
-        with rasterio.open(raster_path) as src:
-            data = src.read(1)
-            # Should have both valid and NaN values
-            assert np.any(~np.isnan(data))
-            assert np.any(np.isnan(data))
+        data = read_window(config, "ksat")
+        # Should have both valid and NaN values
+        assert np.any(~np.isnan(data))
+        assert np.any(np.isnan(data))
+
+    def test_read_window_matches_full_band(self, tmp_path):
+        """Test that a windowed read returns the matching slice of the band."""
+        aoi_file = tmp_path / "aoi.shp"
+        aoi_file.touch()
+
+        config = PipelineConfig(
+            aoi_path=aoi_file,
+            output_dir=tmp_path / "output",
+            output_resolution=1.0,
+            output_crs="EPSG:4326",
+        )
+
+        vector = gpd.GeoDataFrame(
+            {
+                "ksat": [1.0, 2.0],
+                "geometry": [
+                    Polygon([(0, 0), (5, 0), (5, 10), (0, 10)]),
+                    Polygon([(5, 0), (10, 0), (10, 10), (5, 10)]),
+                ],
+            },
+            crs="EPSG:4326",
+        )
+
+        rasterize_parameters(vector, ["ksat"], config)
+
+        full = read_window(config, "ksat")
+        window = read_window(config, "ksat", rasterio.windows.Window(3, 2, 4, 5))
+
+        assert window.dtype == np.float32
+        assert window.shape == (5, 4)
+        np.testing.assert_array_equal(window, full[2:7, 3:7])
+
+    @pytest.mark.parametrize("build_overviews, expected", [(True, [2, 4]), (False, [])])
+    def test_overviews_for_grids_larger_than_a_tile(self, tmp_path, build_overviews, expected):
+        """Test that overviews are built down to one tile, and skipped on request."""
+        aoi_file = tmp_path / "aoi.shp"
+        aoi_file.touch()
+
+        config = PipelineConfig(
+            aoi_path=aoi_file,
+            output_dir=tmp_path / "output",
+            output_resolution=1.0,
+            output_crs="EPSG:3857",
+            build_overviews=build_overviews,
+        )
+
+        vector = gpd.GeoDataFrame(
+            {"ksat": [3.0], "geometry": [Polygon([(0, 0), (1100, 0), (1100, 300), (0, 300)])]},
+            crs="EPSG:3857",
+        )
+
+        rasterize_parameters(vector, ["ksat"], config)
+
+        with rasterio.open(config.build_raster_path("ksat")) as src:
+            assert src.overviews(1) == expected
+            assert np.all(src.read(1) == 3.0)
+
+    def test_shared_burn_matches_per_parameter_values(self, tmp_path):
+        """Test that each parameter raster takes the last overlapping feature's value."""
+        aoi_file = tmp_path / "aoi.shp"
+        aoi_file.touch()
+
+        config = PipelineConfig(
+            aoi_path=aoi_file,
+            output_dir=tmp_path / "output",
+            output_resolution=1.0,
+            output_crs="EPSG:4326",
+        )
+
+        vector = gpd.GeoDataFrame(
+            {
+                "ksat": [1.0, 2.0],
+                "psi": [10.0, 20.0],
+                "geometry": [
+                    Polygon([(0, 0), (10, 0), (10, 10), (0, 10)]),
+                    Polygon([(0, 0), (5, 0), (5, 10), (0, 10)]),  # overlaps the left half
+                ],
+            },
+            crs="EPSG:4326",
+        )
+
+        rasterize_parameters(vector, ["ksat", "psi"], config)
+
+        for parameter, (first, second) in (("ksat", (1.0, 2.0)), ("psi", (10.0, 20.0))):
+            with rasterio.open(config.build_raster_path(parameter)) as src:
+                data = src.read(1)
+            assert np.all(data[:, :5] == second)
+            assert np.all(data[:, 5:] == first)
+
+    def test_reuses_supplied_grid(self, tmp_path):
+        """Test that a grid prepared for the same vector is reused without re-burning."""
+        aoi_file = tmp_path / "aoi.shp"
+        aoi_file.touch()
+
+        config = PipelineConfig(
+            aoi_path=aoi_file,
+            output_dir=tmp_path / "output",
+            output_resolution=1.0,
+            output_crs="EPSG:4326",
+        )
+
+        vector = gpd.GeoDataFrame(
+            {"ksat": [5.0], "geometry": [Polygon([(0, 0), (10, 0), (10, 10), (0, 10)])]},
+            crs="EPSG:4326",
+        )
+        grid = prepare_grid(vector, config.output_resolution, config.output_crs)
+
+        rasterize_parameters(vector, ["ksat"], config, grid=grid)
+        burned = grid.feature_index
+        rasterize_parameters(vector, ["ksat"], config, grid=grid)
+
+        assert burned is not None
+        assert grid.feature_index is burned
+
+    def test_supplied_grid_rebuilt_for_different_geometry(self, tmp_path):
+        """Test that a grid for other geometries with the same index is not reused."""
+        aoi_file = tmp_path / "aoi.shp"
+        aoi_file.touch()
+        config = PipelineConfig(
+            aoi_path=aoi_file,
+            output_dir=tmp_path / "output",
+            output_resolution=1.0,
+            output_crs="EPSG:4326",
+        )
+
+        small = gpd.GeoDataFrame(
+            {"ksat": [5.0], "geometry": [Polygon([(0, 0), (4, 0), (4, 4), (0, 4)])]},
+            crs="EPSG:4326",
+        )
+        large = gpd.GeoDataFrame(
+            {"ksat": [7.0], "geometry": [Polygon([(0, 0), (10, 0), (10, 10), (0, 10)])]},
+            crs="EPSG:4326",
+        )
+        grid = prepare_grid(small, config.output_resolution, config.output_crs)
+
+        rasterize_parameters(large, ["ksat"], config, grid=grid)
+
+        with rasterio.open(config.build_raster_path("ksat")) as src:
+            assert (src.width, src.height) == (10, 10)
+            assert np.all(src.read(1) == 7.0)
+
+    def test_supplied_grid_rebuilt_for_different_resolution(self, tmp_path):
+        """Test that a grid prepared at another resolution is not reused."""
+        aoi_file = tmp_path / "aoi.shp"
+        aoi_file.touch()
+        config = PipelineConfig(
+            aoi_path=aoi_file,
+            output_dir=tmp_path / "output",
+            output_resolution=2.0,
+            output_crs="EPSG:4326",
+        )
+
+        vector = gpd.GeoDataFrame(
+            {"ksat": [5.0], "geometry": [Polygon([(0, 0), (10, 0), (10, 10), (0, 10)])]},
+            crs="EPSG:4326",
+        )
+        grid = prepare_grid(vector, 1.0, config.output_crs)
+
+        rasterize_parameters(vector, ["ksat"], config, grid=grid)
+
+        with rasterio.open(config.build_raster_path("ksat")) as src:
+            assert (src.width, src.height) == (5, 5)
+
+    def test_gdal_threads_shared_between_writers(self, tmp_path, monkeypatch):
+        """Test that writers split the cores instead of each using all of them."""
+        aoi_file = tmp_path / "aoi.shp"
+        aoi_file.touch()
+        config = PipelineConfig(
+            aoi_path=aoi_file,
+            output_dir=tmp_path / "output",
+            output_resolution=1.0,
+            output_crs="EPSG:4326",
+        )
+        vector = gpd.GeoDataFrame(
+            {
+                "ksat": [1.0],
+                "psi": [2.0],
+                "theta_s": [0.4],
+                "geometry": [Polygon([(0, 0), (4, 0), (4, 4), (0, 4)])],
+            },
+            crs="EPSG:4326",
+        )
+        seen = []
+        monkeypatch.setattr(rasterization.os, "cpu_count", lambda: 8)
+        monkeypatch.setattr(
+            rasterization, "_write_parameter_raster", lambda *args: seen.append(args[6])
+        )
+
+        rasterize_parameters(vector, ["ksat", "psi", "theta_s"], config)
+
+        assert seen == [2, 2, 2]
 
     def test_raster_metadata(self, tmp_path):
         """Test that raster has correct metadata."""
@@ -365,3 +551,49 @@ class TestRasterizeParameters:
         raster_path = config.build_raster_path("ksat")
         assert "test_run" in raster_path.name
         assert raster_path.exists()
+
+
+class TestGather:
+    """Test the lookup-table gather used for every parameter raster."""
+
+    def test_matches_numpy_indexing(self):
+        """Test that the gather equals plain fancy indexing, NaN slot included."""
+        lut = np.array([1.5, 2.5, np.nan], dtype=np.float32)
+        index = np.array([[0, 2, 1], [1, 1, 0]], dtype=np.int32)
+        out = np.empty(index.shape, dtype=np.float32)
+
+        _gather(lut, index, out)
+
+        np.testing.assert_array_equal(out, lut[index])
+
+    @pytest.mark.skipif(not RASTERIO_AVAILABLE, reason="rasterio not available")
+    def test_threaded_writes_let_the_interpreter_exit(self, tmp_path):
+        """Test that a process running the threaded gather and writes exits promptly."""
+        script = textwrap.dedent(
+            f"""
+            import sys
+            sys.path.insert(0, {str(Path(__file__).resolve().parents[2])!r})
+            import geopandas as gpd
+            from shapely.geometry import box
+            from green_ampt_tool.config import PipelineConfig
+            from green_ampt_tool.rasterization import rasterize_parameters
+
+            aoi = {str(tmp_path / "aoi.shp")!r}
+            open(aoi, "w").close()
+            config = PipelineConfig(
+                aoi_path=aoi,
+                output_dir={str(tmp_path / "output")!r},
+                output_resolution=1.0,
+                output_crs="EPSG:4326",
+            )
+            vector = gpd.GeoDataFrame(
+                {{"ksat": [1.0], "psi": [2.0], "geometry": [box(0, 0, 10, 10)]}},
+                crs="EPSG:4326",
+            )
+            rasterize_parameters(vector, ["ksat", "psi"], config)
+            """
+        )
+
+        result = subprocess.run([sys.executable, "-c", script], timeout=120)
+
+        assert result.returncode == 0
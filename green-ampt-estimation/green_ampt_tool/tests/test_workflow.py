@@ -4,101 +4,99 @@ Tests for workflow.py module.
 These tests verify the pipeline orchestration functions work correctly.
 """
 
-import sys
 from pathlib import Path
-import tempfile
 
 import pandas as pd
 import geopandas as gpd
 import pytest
 from shapely.geometry import Polygon
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
-
+from green_ampt_tool import workflow
 from green_ampt_tool.workflow import _prepare_green_ampt_vector
+from green_ampt_tool._compat import PYARROW_AVAILABLE
 from green_ampt_tool.data_access import SSURGOData
 from green_ampt_tool.config import PipelineConfig
 
 
+@pytest.fixture(scope="module")
+def sample_aoi():
+    """Create a sample AOI GeoDataFrame."""
+    polygon = Polygon([(-120, 40), (-120, 41), (-119, 41), (-119, 40)])
+    return gpd.GeoDataFrame(
+        {"id": [1]},
+        geometry=[polygon],
+        crs="EPSG:4326"
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_ssurgo():
+    """Create sample SSURGO data."""
+    # Create mupolygon
+    mupolygon = gpd.GeoDataFrame(
+        {"mukey": ["1", "2"], "musym": ["A", "B"]},
+        geometry=[
+            Polygon([(-120, 40), (-120, 40.5), (-119.5, 40.5), (-119.5, 40)]),
+            Polygon([(-119.5, 40), (-119.5, 40.5), (-119, 40.5), (-119, 40)]),
+        ],
+        crs="EPSG:4326"
+    )
+
+    # Create component
+    component = pd.DataFrame({
+        "mukey": ["1", "2"],
+        "cokey": ["10", "20"],
+        "comppct_r": [100, 100],
+        "hydgrp": ["A", "B"],
+        "majcompflag": ["Yes", "Yes"],
+    })
+
+    # Create chorizon
+    chorizon = pd.DataFrame({
+        "cokey": ["10", "20"],
+        "chkey": ["100", "200"],
+        "texcl": ["Sand", "Loam"],
+        "hzdept_r": [0, 0],
+        "hzdepb_r": [10, 10],
+        "sandtotal_r": [90, 40],
+        "claytotal_r": [5, 20],
+    })
+
+    # Create mapunit
+    mapunit = pd.DataFrame({
+        "mukey": ["1", "2"],
+        "muname": ["Test Soil 1", "Test Soil 2"],
+    })
+
+    return SSURGOData(
+        mupolygon=mupolygon,
+        mapunit=mapunit,
+        component=component,
+        chorizon=chorizon
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_aoi_file(sample_aoi, tmp_path_factory):
+    """Write the sample AOI to a GeoPackage once for the whole module."""
+    aoi_file = tmp_path_factory.mktemp("aoi") / "test_aoi.gpkg"
+    sample_aoi.to_file(aoi_file, driver="GPKG")
+    return aoi_file
+
+
+@pytest.fixture
+def sample_config(sample_aoi_file, tmp_path):
+    """Create a sample pipeline config; tests mutate it, so it is per test."""
+    return PipelineConfig(
+        aoi_path=sample_aoi_file,
+        output_dir=tmp_path / "output",
+        data_source="pysda",  # Use pysda instead of local
+    )
+
+
 class TestPrepareGreenAmptVector:
     """Test the _prepare_green_ampt_vector function."""
     
-    @pytest.fixture
-    def sample_aoi(self):
-        """Create a sample AOI GeoDataFrame."""
-        polygon = Polygon([(-120, 40), (-120, 41), (-119, 41), (-119, 40)])
-        return gpd.GeoDataFrame(
-            {"id": [1]},
-            geometry=[polygon],
-            crs="EPSG:4326"
-        )
-    
-    @pytest.fixture
-    def sample_ssurgo(self):
-        """Create sample SSURGO data."""
-        # Create mupolygon
-        mupolygon = gpd.GeoDataFrame(
-            {"mukey": ["1", "2"], "musym": ["A", "B"]},
-            geometry=[
-                Polygon([(-120, 40), (-120, 40.5), (-119.5, 40.5), (-119.5, 40)]),
-                Polygon([(-119.5, 40), (-119.5, 40.5), (-119, 40.5), (-119, 40)]),
-            ],
-            crs="EPSG:4326"
-        )
-        
-        # Create component
-        component = pd.DataFrame({
-            "mukey": ["1", "2"],
-            "cokey": ["10", "20"],
-            "comppct_r": [100, 100],
-            "hydgrp": ["A", "B"],
-            "majcompflag": ["Yes", "Yes"],
-        })
-        
-        # Create chorizon
-        chorizon = pd.DataFrame({
-            "cokey": ["10", "20"],
-            "chkey": ["100", "200"],
-            "texcl": ["Sand", "Loam"],
-            "hzdept_r": [0, 0],
-            "hzdepb_r": [10, 10],
-            "sandtotal_r": [90, 40],
-            "claytotal_r": [5, 20],
-        })
-        
-        # Create mapunit
-        mapunit = pd.DataFrame({
-            "mukey": ["1", "2"],
-            "muname": ["Test Soil 1", "Test Soil 2"],
-        })
-        
-        return SSURGOData(
-            mupolygon=mupolygon,
-            mapunit=mapunit,
-            component=component,
-            chorizon=chorizon
-        )
-    
-    @pytest.fixture
-    def sample_config(self):
-        """Create a sample pipeline config."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            aoi_file = Path(tmpdir) / "test_aoi.gpkg"
-            polygon = Polygon([(-120, 40), (-120, 41), (-119, 41), (-119, 40)])
-            aoi = gpd.GeoDataFrame(
-                {"id": [1]},
-                geometry=[polygon],
-                crs="EPSG:4326"
-            )
-            aoi.to_file(aoi_file, driver="GPKG")
-            
-            config = PipelineConfig(
-                aoi_path=aoi_file,
-                output_dir=Path(tmpdir),
-                data_source="pysda",  # Use pysda instead of local
-            )
-            yield config
-    
     def test_prepare_with_lookup_table(self, sample_aoi, sample_ssurgo, sample_config):
         """Test vector preparation with lookup table method."""
         sample_config.use_lookup_table = True
@@ -145,7 +143,71 @@ class TestPrepareGreenAmptVector:
         
         assert not result.empty
         assert isinstance(result, gpd.GeoDataFrame)
-    
+
+    @pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow not available")
+    def test_aggregation_reused_from_cache(
+        self, sample_aoi, sample_ssurgo, sample_config, tmp_path, monkeypatch
+    ):
+        """Test that a second run with the same inputs loads the cached aggregate."""
+        sample_config.use_lookup_table = False
+        sample_config.use_hsg_lookup = False
+        sample_config.cache_dir = tmp_path
+
+        first = _prepare_green_ampt_vector(sample_aoi, sample_ssurgo, sample_config)
+        assert len(list(tmp_path.glob("agg-*.parquet"))) == 1
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("aggregation should have been served from the cache")
+
+        monkeypatch.setattr(workflow, "_aggregate_soil_properties", _fail)
+        second = _prepare_green_ampt_vector(sample_aoi, sample_ssurgo, sample_config)
+
+        pd.testing.assert_frame_equal(pd.DataFrame(first), pd.DataFrame(second))
+
+    @pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow not available")
+    def test_pysda_fetch_reused_from_cache(
+        self, sample_aoi, sample_ssurgo, sample_config, tmp_path, monkeypatch
+    ):
+        """Test that a second fetch for the same AOI is served from the cache."""
+        sample_config.cache_dir = tmp_path
+        calls = []
+
+        def _fetch(aoi, timeout, **kwargs):
+            calls.append(timeout)
+            return sample_ssurgo
+
+        monkeypatch.setattr(workflow, "fetch_ssurgo_with_pysda", _fetch)
+        workflow._fetch_or_load_pysda(sample_aoi, sample_config)
+        sample_config.pysda_timeout = 30
+        cached = workflow._fetch_or_load_pysda(sample_aoi, sample_config)
+
+        assert len(calls) == 1
+        assert cached.mupolygon.crs == sample_ssurgo.mupolygon.crs
+        assert cached.mupolygon.geometry.geom_equals(sample_ssurgo.mupolygon.geometry).all()
+        pd.testing.assert_frame_equal(cached.chorizon, sample_ssurgo.chorizon)
+
+        other_aoi = sample_aoi.set_geometry(sample_aoi.geometry.translate(xoff=1.0))
+        workflow._fetch_or_load_pysda(other_aoi, sample_config)
+        assert len(calls) == 2
+
+    def test_cache_dir_without_pyarrow_warns_once(
+        self, sample_aoi, sample_ssurgo, sample_config, tmp_path, monkeypatch, caplog
+    ):
+        """Test that a cache_dir without pyarrow logs one warning and writes nothing."""
+        sample_config.use_lookup_table = False
+        sample_config.use_hsg_lookup = False
+        sample_config.cache_dir = tmp_path
+        monkeypatch.setattr(workflow, "PYARROW_AVAILABLE", False)
+        monkeypatch.setattr(workflow, "_warned_cache_without_pyarrow", False)
+
+        with caplog.at_level("WARNING", logger=workflow.logger.name):
+            _prepare_green_ampt_vector(sample_aoi, sample_ssurgo, sample_config)
+            _prepare_green_ampt_vector(sample_aoi, sample_ssurgo, sample_config)
+
+        warnings = [record for record in caplog.records if "pyarrow" in record.getMessage()]
+        assert len(warnings) == 1
+        assert not list(tmp_path.glob("agg-*.parquet"))
+
     def test_prepare_empty_aggregation_raises_error(self, sample_aoi, sample_config):
         """Test that empty aggregated data raises an error."""
         # Create SSURGO data with no overlapping components
@@ -160,3 +222,193 @@ class TestPrepareGreenAmptVector:
         
         with pytest.raises(RuntimeError, match="No soil properties could be derived"):
             _prepare_green_ampt_vector(sample_aoi, empty_ssurgo, sample_config)
+
+    def test_aoi_outside_mupolygon_fails_before_aggregation(
+        self, sample_ssurgo, sample_config, monkeypatch
+    ):
+        """Test that an AOI missing every map unit fails without aggregating."""
+        far_aoi = gpd.GeoDataFrame(
+            {"id": [1]},
+            geometry=[Polygon([(10, 10), (10, 11), (11, 11), (11, 10)])],
+            crs="EPSG:4326",
+        )
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("aggregation should not run for an empty clip")
+
+        monkeypatch.setattr(workflow, "_load_or_aggregate", _fail)
+        with pytest.raises(ValueError, match="empty GeoDataFrame"):
+            _prepare_green_ampt_vector(far_aoi, sample_ssurgo, sample_config)
+
+    def test_aggregation_limited_to_clipped_mapunits(
+        self, sample_ssurgo, sample_config, monkeypatch
+    ):
+        """Test that only components and horizons of clipped map units are aggregated."""
+        west_aoi = gpd.GeoDataFrame(
+            {"id": [1]},
+            geometry=[Polygon([(-120, 40), (-120, 40.4), (-119.6, 40.4), (-119.6, 40)])],
+            crs="EPSG:4326",
+        )
+        sample_config.use_lookup_table = True
+        seen = []
+        aggregate = workflow._aggregate_soil_properties
+
+        def _record(ssurgo, config):
+            seen.append(ssurgo)
+            return aggregate(ssurgo, config)
+
+        monkeypatch.setattr(workflow, "_aggregate_soil_properties", _record)
+        result = _prepare_green_ampt_vector(west_aoi, sample_ssurgo, sample_config)
+
+        assert result["mukey"].tolist() == ["1"]
+        assert seen[0].component["cokey"].tolist() == ["10"]
+        assert seen[0].chorizon["cokey"].tolist() == ["10"]
+        assert len(sample_ssurgo.component) == 2
+
+
+class TestExportRawIfChanged:
+    """Test the raw SSURGO export skip on unchanged inputs."""
+
+    def test_unchanged_inputs_skip_export(self, sample_ssurgo, tmp_path, monkeypatch):
+        """Test that a repeat export is skipped until the data or files change."""
+        calls = []
+        export = workflow.export_raw_ssurgo_data
+
+        def _record(data, target_dir, *args):
+            calls.append(target_dir)
+            export(data, target_dir, *args)
+
+        monkeypatch.setattr(workflow, "export_raw_ssurgo_data", _record)
+        workflow._export_raw_if_changed(sample_ssurgo, tmp_path)
+        workflow._export_raw_if_changed(sample_ssurgo, tmp_path)
+        assert len(calls) == 1
+        assert (tmp_path / ".rawcache.json").exists()
+
+        (tmp_path / "component_raw.txt").unlink()
+        workflow._export_raw_if_changed(sample_ssurgo, tmp_path)
+        assert len(calls) == 2
+
+        changed_chorizon = sample_ssurgo.chorizon.assign(sandtotal_r=[91, 40])
+        changed = SSURGOData(
+            mupolygon=sample_ssurgo.mupolygon,
+            mapunit=sample_ssurgo.mapunit,
+            component=sample_ssurgo.component,
+            chorizon=changed_chorizon,
+        )
+        workflow._export_raw_if_changed(changed, tmp_path)
+        assert len(calls) == 3
+
+    @pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow not installed")
+    def test_format_change_reexports(self, sample_ssurgo, tmp_path, monkeypatch):
+        """Test that switching raw_data_format re-exports even when the data is unchanged."""
+        calls = []
+        export = workflow.export_raw_ssurgo_data
+
+        def _record(data, target_dir, *args):
+            calls.append(args)
+            export(data, target_dir, *args)
+
+        monkeypatch.setattr(workflow, "export_raw_ssurgo_data", _record)
+        workflow._export_raw_if_changed(sample_ssurgo, tmp_path, "csv")
+        workflow._export_raw_if_changed(sample_ssurgo, tmp_path, "parquet")
+        workflow._export_raw_if_changed(sample_ssurgo, tmp_path, "parquet")
+        assert calls == [("csv",), ("parquet",)]
+        assert (tmp_path / "chorizon_raw.parquet").exists()
+
+
+class TestRunPipelineCancellation:
+    """Test that run_pipeline honours PipelineConfig.cancel_check."""
+
+    def test_cancel_check_stops_before_fetch(self, sample_config, monkeypatch):
+        """Test that a cancelled run stops at the first checkpoint without fetching."""
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("SSURGO should not be fetched after cancellation")
+
+        monkeypatch.setattr(workflow, "fetch_ssurgo_with_pysda", _fail)
+        sample_config.cancel_check = lambda: True
+
+        with pytest.raises(workflow.PipelineCancelled):
+            workflow.run_pipeline(sample_config)
+
+    def test_cancel_check_between_stages(self, sample_ssurgo, sample_config, monkeypatch):
+        """Test that cancelling after the fetch skips vector preparation."""
+        polls = []
+
+        def _prepare(*args, **kwargs):
+            raise AssertionError("vector preparation should not run after cancellation")
+
+        monkeypatch.setattr(workflow, "fetch_ssurgo_with_pysda", lambda aoi, timeout, **kwargs: sample_ssurgo)
+        monkeypatch.setattr(workflow, "_prepare_green_ampt_vector", _prepare)
+        sample_config.export_raw_data = False
+        sample_config.cancel_check = lambda: polls.append(None) or len(polls) >= 2
+
+        with pytest.raises(workflow.PipelineCancelled):
+            workflow.run_pipeline(sample_config)
+        assert len(polls) == 2
+
+
+class TestRunPipelineProgress:
+    """Test the progress updates sent to PipelineConfig.progress_cb."""
+
+    def test_progress_rises_to_completion(self, sample_ssurgo, sample_config, monkeypatch):
+        """Test that progress is reported per stage and per raster, ending at 100."""
+        updates = []
+        monkeypatch.setattr(workflow, "fetch_ssurgo_with_pysda", lambda aoi, timeout, **kwargs: sample_ssurgo)
+        sample_config.export_raw_data = False
+        sample_config.progress_cb = lambda percent, message: updates.append((percent, message))
+
+        workflow.run_pipeline(sample_config)
+
+        percents = [percent for percent, _ in updates]
+        assert percents == sorted(percents)
+        assert percents[-1] == 100
+        raster_messages = [message for _, message in updates if message.startswith("Raster written")]
+        assert len(raster_messages) == len(workflow.RASTER_FIELDS_LOOKUP)
+
+
+class TestRunPipelineRawExport:
+    """Test the background raw SSURGO export in run_pipeline."""
+
+    def test_export_finishes_before_return(self, sample_ssurgo, sample_config, monkeypatch):
+        """Test that the raw export runs off the caller's thread and is joined before returning."""
+        import threading
+
+        threads = []
+        export = workflow._export_raw_if_changed
+
+        def _record(ssurgo, raw_dir, *args):
+            threads.append(threading.current_thread())
+            export(ssurgo, raw_dir, *args)
+
+        monkeypatch.setattr(workflow, "fetch_ssurgo_with_pysda", lambda aoi, timeout, **kwargs: sample_ssurgo)
+        monkeypatch.setattr(workflow, "_export_raw_if_changed", _record)
+        updates = []
+        sample_config.progress_cb = lambda percent, message: updates.append(message)
+
+        workflow.run_pipeline(sample_config)
+
+        assert threads and threads[0] is not threading.current_thread()
+        assert (sample_config.raw_data_dir / "chorizon_raw.txt").exists()
+        assert updates[-1] == "Raw SSURGO datasets saved"
+
+    def test_export_joined_when_rasterising_fails(self, sample_ssurgo, sample_config, monkeypatch):
+        """Test that a failing later stage still waits for the raw export."""
+        import time
+
+        finished = []
+
+        def _slow_export(ssurgo, raw_dir, *args):
+            time.sleep(0.1)
+            finished.append(raw_dir)
+
+        def _fail(*args, **kwargs):
+            raise RuntimeError("rasterisation failed")
+
+        monkeypatch.setattr(workflow, "fetch_ssurgo_with_pysda", lambda aoi, timeout, **kwargs: sample_ssurgo)
+        monkeypatch.setattr(workflow, "_export_raw_if_changed", _slow_export)
+        monkeypatch.setattr(workflow, "rasterize_parameters", _fail)
+
+        with pytest.raises(RuntimeError, match="rasterisation failed"):
+            workflow.run_pipeline(sample_config)
+        assert finished
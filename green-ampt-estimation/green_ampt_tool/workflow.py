@@ -1,10 +1,21 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import os
+import shutil
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import replace
+from pathlib import Path
+from typing import Optional
 
-from .config import PipelineConfig
+import numpy as np
+
+from ._compat import PYARROW_AVAILABLE, require_geopandas, require_pandas
+from .config import PipelineCancelled, PipelineConfig
 from .data_access import SSURGOData, fetch_ssurgo_with_pysda, load_ssurgo_local, parse_aoi_path, read_aoi
-from .export import export_parameter_vectors, export_raw_ssurgo_data
+from .export import RAW_EXPORT_FILES, export_parameter_vectors, export_raw_ssurgo_data
 from .parameters import (
     build_lookup_parameters,
     build_hsg_lookup_parameters,
@@ -16,12 +27,27 @@ from .rasterization import rasterize_parameters
 
 logger = logging.getLogger(__name__)
 
+# Columns written as rasters by each parameter method.
+RASTER_FIELDS_LOOKUP = ("Ks_inhr", "psi_in", "theta_s", "theta_fc", "theta_wp", "theta_i")
+RASTER_FIELDS_PTF = ("ksat", "theta_s", "psi", "theta_i")
+
+# Bump when aggregation output changes so stale cached tables are ignored.
+_AGGREGATE_CACHE_VERSION = 1
+# Bump when the fetched tables change shape so stale downloads are ignored.
+_PYSDA_CACHE_VERSION = 1
+_PYSDA_CACHE_TABLES = ("mapunit", "component", "chorizon")
+# Sidecar recording which SSURGO inputs the raw export directory holds.
+_RAW_EXPORT_SIDECAR = ".rawcache.json"
+_warned_cache_without_pyarrow = False
+
 
 def run_pipeline(config: PipelineConfig):
     logger.info("Starting Green-Ampt pipeline")
 
     aoi = read_aoi(config.aoi_path, layer=config.aoi_layer)
     logger.debug("AOI loaded with %d feature(s)", len(aoi))
+    _report_progress(config, 5, f"AOI loaded with {len(aoi)} feature(s)")
+    _raise_if_cancelled(config)
     
     # Inherit AOI CRS if output_crs is None
     if config.output_crs is None:
@@ -31,55 +57,128 @@ def run_pipeline(config: PipelineConfig):
     ssurgo: SSURGOData
     if config.use_pysda:
         logger.info("Fetching SSURGO data using PySDA")
-        ssurgo = fetch_ssurgo_with_pysda(aoi, timeout=config.pysda_timeout)
+        ssurgo = _fetch_or_load_pysda(aoi, config)
     else:
         logger.info("Loading SSURGO data from local files")
         assert config.local_ssurgo is not None
-        ssurgo = load_ssurgo_local(config.local_ssurgo)
+        ssurgo = load_ssurgo_local(config.local_ssurgo, aoi=aoi)
+    _report_progress(
+        config,
+        40,
+        f"SSURGO data ready: {len(ssurgo.mupolygon)} polygons, "
+        f"{len(ssurgo.component)} components, {len(ssurgo.chorizon)} horizons",
+    )
+    _raise_if_cancelled(config)
+
+    raw_export = _start_raw_export(ssurgo, config)
+    try:
+        parameterised = _parameterise_and_rasterize(aoi, ssurgo, config)
+    finally:
+        if raw_export is not None:
+            # Joined even when a later stage fails, so no write outlives the run.
+            wait([raw_export])
+    if raw_export is not None:
+        raw_export.result()
+        _report_progress(config, 100, "Raw SSURGO datasets saved")
+    logger.info("Pipeline complete; rasters written to %s", config.raster_dir)
+    return parameterised
+
+
+def _start_raw_export(ssurgo: SSURGOData, config: PipelineConfig) -> Optional[Future]:
+    """Start the raw SSURGO export on a background thread; ``None`` when it is off.
 
-    if config.export_raw_data and config.raw_data_dir is not None:
-        logger.info("Saving raw SSURGO datasets to %s", config.raw_data_dir)
-        export_raw_ssurgo_data(ssurgo, config.raw_data_dir)
+    The export is I/O-bound and nothing downstream reads it, so it overlaps
+    clipping, parameter estimation and raster writing.
+    """
+    if not config.export_raw_data or config.raw_data_dir is None:
+        return None
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="raw-export")
+    future = pool.submit(_export_raw_if_changed, ssurgo, Path(config.raw_data_dir), config.raw_data_format)
+    # The submitted export still runs; this only releases the thread when it finishes.
+    pool.shutdown(wait=False)
+    return future
 
+
+def _parameterise_and_rasterize(aoi, ssurgo: SSURGOData, config: PipelineConfig):
+    """Derive Green-Ampt parameters for the clipped soils and write vectors and rasters."""
+    _raise_if_cancelled(config)
     final_vector = _prepare_green_ampt_vector(aoi, ssurgo, config)
+    _report_progress(config, 70, f"Soil properties derived for {len(final_vector)} polygons")
+    _raise_if_cancelled(config)
     
-    if config.use_hsg_lookup:
-        parameterised = enrich_with_lookup_parameters(final_vector)
-        raster_fields = [
-            "Ks_inhr",
-            "psi_in",
-            "theta_s",
-            "theta_fc",
-            "theta_wp",
-            "theta_i",
-        ]
-    elif config.use_lookup_table:
+    # The HSG method only changes how Ks_inhr is aggregated; both lookup
+    # methods share the enrichment step and the rasterised fields.
+    if config.use_hsg_lookup or config.use_lookup_table:
         parameterised = enrich_with_lookup_parameters(final_vector)
-        raster_fields = [
-            "Ks_inhr",
-            "psi_in",
-            "theta_s",
-            "theta_fc",
-            "theta_wp",
-            "theta_i",
-        ]
+        raster_fields = RASTER_FIELDS_LOOKUP
     else:
         parameterised = enrich_with_green_ampt_parameters(final_vector)
-        raster_fields = ["ksat", "theta_s", "psi", "theta_i"]
+        raster_fields = RASTER_FIELDS_PTF
 
     vector_path = export_parameter_vectors(parameterised, config)
     logger.info("Vector parameters saved to %s", vector_path)
+    _report_progress(config, 75, f"Vector parameters saved to {vector_path}")
 
+    _raise_if_cancelled(config)
     logger.info("Rasterising parameters")
-    rasterize_parameters(parameterised, raster_fields, config)
-    logger.info("Pipeline complete; rasters written to %s", config.raster_dir)
+    written = []
+
+    def _raster_written(parameter: str) -> None:
+        written.append(parameter)
+        percent = 75 + 25 * len(written) / len(raster_fields)
+        _report_progress(config, percent, f"Raster written: {parameter} ({len(written)}/{len(raster_fields)})")
+
+    rasterize_parameters(parameterised, raster_fields, config, on_written=_raster_written)
     return parameterised
 
 
+def _report_progress(config: PipelineConfig, percent: float, message: str) -> None:
+    """Forward a progress update to ``config.progress_cb`` when one is set."""
+    if config.progress_cb is not None:
+        config.progress_cb(percent, message)
+
+
+def _raise_if_cancelled(config: PipelineConfig) -> None:
+    """Stop between stages when the caller's ``cancel_check`` says so."""
+    if config.cancel_check is not None and config.cancel_check():
+        logger.info("Pipeline cancelled")
+        raise PipelineCancelled("Pipeline cancelled by caller")
+
+
 def _prepare_green_ampt_vector(aoi, ssurgo: SSURGOData, config: PipelineConfig):
     logger.debug("Clipping mupolygon to AOI bounds")
     clipped = clip_to_aoi(ssurgo.mupolygon, aoi)
 
+    aggregated = _load_or_aggregate(_restrict_to_mapunits(ssurgo, clipped), config)
+
+    if aggregated.empty:
+        raise RuntimeError("No soil properties could be derived for the provided AOI")
+
+    logger.debug("Attaching aggregated properties to spatial data")
+    final_vector = attach_properties(clipped, aggregated)
+    return final_vector
+
+
+def _restrict_to_mapunits(ssurgo: SSURGOData, clipped) -> SSURGOData:
+    """Keep only the components and horizons of map units present in ``clipped``.
+
+    Aggregation is per map unit, so dropping the rest of the loaded extent
+    changes no result while shrinking every later step.
+    """
+    component = ssurgo.component
+    if "mukey" not in clipped.columns or "mukey" not in component.columns or "cokey" not in component.columns:
+        return ssurgo
+    pandas = require_pandas()
+    mukeys = pandas.Index(clipped["mukey"].astype(str).unique())
+    component = component[component["mukey"].astype(str).isin(mukeys).to_numpy()]
+    chorizon = ssurgo.chorizon
+    if "cokey" in chorizon.columns:
+        cokeys = pandas.Index(component["cokey"].astype(str).unique())
+        chorizon = chorizon[chorizon["cokey"].astype(str).isin(cokeys).to_numpy()]
+    return replace(ssurgo, component=component, chorizon=chorizon)
+
+
+def _aggregate_soil_properties(ssurgo: SSURGOData, config: PipelineConfig):
     logger.debug("Summarising soil properties (depth_limit_cm=%.1f)", config.depth_limit_cm)
     if config.use_hsg_lookup:
         aggregated = build_hsg_lookup_parameters(
@@ -99,10 +198,164 @@ def _prepare_green_ampt_vector(aoi, ssurgo: SSURGOData, config: PipelineConfig):
         aggregated = summarize_mapunit_properties(
             ssurgo.component, ssurgo.chorizon, depth_limit_cm=config.depth_limit_cm
         )
+    return aggregated
 
-    if aggregated.empty:
-        raise RuntimeError("No soil properties could be derived for the provided AOI")
 
-    logger.debug("Attaching aggregated properties to spatial data")
-    final_vector = attach_properties(clipped, aggregated)
-    return final_vector
+def _fetch_or_load_pysda(aoi, config: PipelineConfig) -> SSURGOData:
+    """Fetch SSURGO for ``aoi`` via PySDA, reusing a Parquet copy from ``config.cache_dir``."""
+    cache_dir = _pysda_cache_dir(aoi, config)
+    if cache_dir is not None and cache_dir.is_dir():
+        geopandas = require_geopandas()
+        pandas = require_pandas()
+        try:
+            tables = {name: pandas.read_parquet(cache_dir / f"{name}.parquet") for name in _PYSDA_CACHE_TABLES}
+            ssurgo = SSURGOData(mupolygon=geopandas.read_parquet(cache_dir / "mupolygon.parquet"), **tables)
+        except Exception as exc:  # pragma: no cover - corrupt or foreign cache entry
+            logger.warning("Ignoring unreadable SSURGO cache %s: %s", cache_dir, exc)
+        else:
+            logger.info("Loaded SSURGO data for this AOI from %s", cache_dir)
+            return ssurgo
+
+    ssurgo = fetch_ssurgo_with_pysda(
+        aoi,
+        timeout=config.pysda_timeout,
+        chunk_size=config.pysda_chunk_size,
+        max_workers=config.pysda_max_workers,
+        cancel_check=config.cancel_check,
+        simplify_tolerance=config.pysda_simplify_tolerance,
+    )
+    if cache_dir is not None:
+        # Written to a sibling directory and renamed, so a reader never sees
+        # a half-written entry.
+        partial = cache_dir.with_suffix(".partial")
+        shutil.rmtree(partial, ignore_errors=True)
+        partial.mkdir(parents=True)
+        try:
+            ssurgo.mupolygon.to_parquet(partial / "mupolygon.parquet", compression="zstd")
+            for name in _PYSDA_CACHE_TABLES:
+                getattr(ssurgo, name).to_parquet(partial / f"{name}.parquet", compression="zstd")
+            os.replace(partial, cache_dir)
+        except Exception as exc:  # pragma: no cover - unserialisable columns or a concurrent writer
+            logger.warning("Could not cache SSURGO data to %s: %s", cache_dir, exc)
+            shutil.rmtree(partial, ignore_errors=True)
+        else:
+            logger.debug("Cached SSURGO data to %s", cache_dir)
+    return ssurgo
+
+
+def _export_raw_if_changed(ssurgo: SSURGOData, raw_dir: Path, data_format: str = "csv") -> None:
+    """Export the raw SSURGO tables unless ``raw_dir`` already holds these inputs in ``data_format``."""
+    sidecar = raw_dir / _RAW_EXPORT_SIDECAR
+    digest = _ssurgo_digest(ssurgo)
+    try:
+        recorded = json.loads(sidecar.read_text())
+        # Sidecars from before the format option describe a CSV export.
+        recorded = (recorded.get("digest"), recorded.get("format", "csv"))
+    except (OSError, ValueError, AttributeError):
+        recorded = None
+    files = RAW_EXPORT_FILES[data_format]
+    if recorded == (digest, data_format) and all((raw_dir / name).exists() for name in files):
+        logger.info("Raw SSURGO datasets in %s are up to date; skipping export", raw_dir)
+        return
+
+    logger.info("Saving raw SSURGO datasets to %s", raw_dir)
+    export_raw_ssurgo_data(ssurgo, raw_dir, data_format)
+    partial = sidecar.with_suffix(".partial")
+    partial.write_text(json.dumps({"digest": digest, "format": data_format}))
+    os.replace(partial, sidecar)
+
+
+def _ssurgo_digest(ssurgo: SSURGOData) -> str:
+    """Content hash of all four SSURGO tables, geometries included."""
+    import shapely
+
+    pandas = require_pandas()
+    mupolygon = ssurgo.mupolygon
+    geometry = np.asarray(mupolygon.geometry.values, dtype=object)
+    attributes = pandas.DataFrame(mupolygon.drop(columns=mupolygon.geometry.name))
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(mupolygon.crs).encode())
+    for wkb in shapely.to_wkb(geometry):
+        digest.update(b"" if wkb is None else wkb)
+        digest.update(b"|")
+    for table in (attributes, ssurgo.mapunit, ssurgo.component, ssurgo.chorizon):
+        digest.update("|".join(map(str, table.columns)).encode())
+        digest.update(pandas.util.hash_pandas_object(table, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _pysda_cache_dir(aoi, config: PipelineConfig) -> Optional[Path]:
+    """Cache directory for the AOI's SSURGO tables, or ``None`` when caching is off.
+
+    The key covers the AOI geometries and CRS, plus the query simplification
+    tolerance when one is set; the request timeout does not change what Soil
+    Data Access returns.
+    """
+    if not _parquet_cache_enabled(config):
+        return None
+
+    import shapely
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{_PYSDA_CACHE_VERSION}|{aoi.crs}".encode())
+    for wkb in shapely.to_wkb(np.asarray(aoi.geometry.values, dtype=object)):
+        digest.update(b"" if wkb is None else wkb)
+        digest.update(b"|")
+    if config.pysda_simplify_tolerance:
+        digest.update(f"simplify={config.pysda_simplify_tolerance!r}".encode())
+    return Path(config.cache_dir) / f"ssurgo-{digest.hexdigest()}"
+
+
+def _load_or_aggregate(ssurgo: SSURGOData, config: PipelineConfig):
+    """Aggregate soil properties, reusing a Parquet copy from ``config.cache_dir``."""
+    cache_path = _aggregate_cache_path(ssurgo, config)
+    if cache_path is not None and cache_path.exists():
+        pandas = require_pandas()
+        try:
+            aggregated = pandas.read_parquet(cache_path)
+        except Exception as exc:  # pragma: no cover - corrupt or foreign cache file
+            logger.warning("Ignoring unreadable aggregate cache %s: %s", cache_path, exc)
+        else:
+            logger.debug("Loaded aggregated soil properties from %s", cache_path)
+            return aggregated
+
+    aggregated = _aggregate_soil_properties(ssurgo, config)
+    if cache_path is not None and not aggregated.empty:
+        partial = cache_path.with_suffix(".partial")
+        aggregated.to_parquet(partial, compression="zstd")
+        os.replace(partial, cache_path)
+        logger.debug("Cached aggregated soil properties to %s", cache_path)
+    return aggregated
+
+
+def _parquet_cache_enabled(config: PipelineConfig) -> bool:
+    """Whether ``config.cache_dir`` is set and pyarrow is there to write Parquet."""
+    global _warned_cache_without_pyarrow
+    if config.cache_dir is None:
+        return False
+    if not PYARROW_AVAILABLE:
+        if not _warned_cache_without_pyarrow:
+            logger.warning("cache_dir is set but pyarrow is not installed; caching is disabled")
+            _warned_cache_without_pyarrow = True
+        return False
+    return True
+
+
+def _aggregate_cache_path(ssurgo: SSURGOData, config: PipelineConfig) -> Optional[Path]:
+    """Cache file for the aggregation inputs, or ``None`` when caching is off."""
+    if not _parquet_cache_enabled(config):
+        return None
+
+    pandas = require_pandas()
+    if config.use_hsg_lookup:
+        method = "hsg"
+    elif config.use_lookup_table:
+        method = "lookup"
+    else:
+        method = "pedotransfer"
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{_AGGREGATE_CACHE_VERSION}|{method}|{config.depth_limit_cm!r}".encode())
+    for table in (ssurgo.component, ssurgo.chorizon):
+        digest.update("|".join(map(str, table.columns)).encode())
+        digest.update(pandas.util.hash_pandas_object(table, index=False).to_numpy().tobytes())
+    return Path(config.cache_dir) / f"agg-{digest.hexdigest()}.parquet"
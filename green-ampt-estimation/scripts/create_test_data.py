@@ -9,8 +9,24 @@ import pandas as pd
 from pathlib import Path
 from shapely.geometry import box
 
-def create_synthetic_ssurgo_data(output_dir: Path):
-    """Create synthetic SSURGO data for testing"""
+def _write_table(frame: pd.DataFrame, output_dir: Path, name: str, table_format: str) -> Path:
+    """Write one tabular SSURGO table as pipe-delimited text or Parquet."""
+    if table_format == 'parquet':
+        path = output_dir / f'{name}.parquet'
+        frame.to_parquet(path, index=False, compression='zstd')
+    else:
+        path = output_dir / f'{name}.txt'
+        frame.to_csv(path, index=False, sep='|')
+    print(f"✓ Created {path}")
+    return path
+
+
+def create_synthetic_ssurgo_data(output_dir: Path, table_format: str = 'txt'):
+    """Create synthetic SSURGO data for testing.
+
+    ``table_format`` is ``'txt'`` (pipe-delimited, as SSURGO ships) or
+    ``'parquet'`` (needs pyarrow; loads faster and keeps column types).
+    """
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     
@@ -45,8 +61,7 @@ def create_synthetic_ssurgo_data(output_dir: Path):
         'muname': ['Test Map Unit 1', 'Test Map Unit 2'],
     }
     mapunit = pd.DataFrame(mapunit_data)
-    mapunit.to_csv(output_dir / 'mapunit_raw.txt', index=False, sep='|')
-    print(f"✓ Created {output_dir / 'mapunit_raw.txt'}")
+    _write_table(mapunit, output_dir, 'mapunit_raw', table_format)
     
     # Create synthetic component (soil components)
     # Each map unit has 1-2 components
@@ -59,8 +74,7 @@ def create_synthetic_ssurgo_data(output_dir: Path):
         'texcl': ['Sandy Loam', 'Clay Loam', 'Silt Loam'],  # Texture class (full names for lookup)
     }
     component = pd.DataFrame(component_data)
-    component.to_csv(output_dir / 'component_raw.txt', index=False, sep='|')
-    print(f"✓ Created {output_dir / 'component_raw.txt'}")
+    _write_table(component, output_dir, 'component_raw', table_format)
     
     # Create synthetic chorizon (soil horizons with properties)
     # Each component has 2-3 horizons
@@ -80,8 +94,7 @@ def create_synthetic_ssurgo_data(output_dir: Path):
         'wfifteenbar_r': [0.08, 0.10, 0.18, 0.22, 0.12, 0.15],  # Water content at 1500 kPa
     }
     chorizon = pd.DataFrame(chorizon_data)
-    chorizon.to_csv(output_dir / 'chorizon_raw.txt', index=False, sep='|')
-    print(f"✓ Created {output_dir / 'chorizon_raw.txt'}")
+    _write_table(chorizon, output_dir, 'chorizon_raw', table_format)
     
     print(f"\n✓ Synthetic SSURGO test data created in {output_dir}")
     return output_dir
@@ -90,4 +103,5 @@ def create_synthetic_ssurgo_data(output_dir: Path):
 if __name__ == '__main__':
     import sys
     output_dir = sys.argv[1] if len(sys.argv) > 1 else 'outputs/test_ssurgo_data'
-    create_synthetic_ssurgo_data(output_dir)
+    table_format = sys.argv[2] if len(sys.argv) > 2 else 'txt'
+    create_synthetic_ssurgo_data(output_dir, table_format)
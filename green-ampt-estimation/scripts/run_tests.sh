@@ -12,6 +12,8 @@
 #   --log-file FILE    Write test results to specified log file
 #   --verbose          Show detailed test output
 #   --coverage         Generate coverage report (requires pytest-cov)
+#   --fast             Skip tests marked slow (full lookup pipeline runs)
+#   --serial           Do not run tests in parallel even if pytest-xdist is installed
 #   --help             Display this help message
 #
 
@@ -21,6 +23,8 @@ set -e
 LOG_FILE=""
 VERBOSE=""
 COVERAGE=""
+SERIAL=""
+FAST=""
 
 # Parse command-line arguments
 while [[ $# -gt 0 ]]; do
@@ -37,6 +41,14 @@ while [[ $# -gt 0 ]]; do
             COVERAGE="--cov=green_ampt_tool --cov-report=term --cov-report=html"
             shift
             ;;
+        --fast)
+            FAST="1"
+            shift
+            ;;
+        --serial)
+            SERIAL="1"
+            shift
+            ;;
         --help)
             grep '^#' "$0" | grep -v '#!/bin/bash' | sed 's/^# //'
             exit 0
@@ -80,6 +92,13 @@ fi
 if [ -n "$COVERAGE" ]; then
     PYTEST_ARGS+=(--cov=green_ampt_tool --cov-report=term --cov-report=html)
 fi
+if [ -n "$FAST" ]; then
+    PYTEST_ARGS+=(-m "not slow")
+fi
+# Spread tests across all cores when pytest-xdist is available
+if [ -z "$SERIAL" ] && python -c "import xdist" >/dev/null 2>&1; then
+    PYTEST_ARGS+=(-n auto --dist loadgroup)
+fi
 
 # Run tests
 echo "Running tests..."
@@ -24,16 +24,24 @@
 # Note: VS Code linting may show import errors for QGIS modules because it doesn't
 # have access to the QGIS Python environment. These imports are correct for QGIS runtime.
 
-import inspect
+import contextlib
+import functools
+import hashlib
+import importlib.util
+import json
+import math
 import os
+import shutil
 import sys
 import tempfile
+import time
+from collections import namedtuple
 from pathlib import Path
 
+# Only what initAlgorithm needs is imported here, so registering the provider
+# at QGIS startup stays cheap; the rest is imported where it is used.
 from qgis.core import (
     QgsProcessing,
-    QgsProcessingException,
-    QgsProcessingMultiStepFeedback,
     QgsProcessingParameterBoolean,
     QgsProcessingParameterEnum,
     QgsProcessingParameterFile,
@@ -41,14 +49,9 @@ from qgis.core import (
     QgsProcessingParameterNumber,
     QgsProcessingParameterString,
     QgsProcessingParameterVectorLayer,
-    QgsVectorFileWriter,
-    QgsVectorLayer,
-    QgsRasterLayer,
-    QgsProject,
 )
-from qgis.PyQt.QtGui import QIcon
 
-from green_ampt_plugin.green_ampt_processing.green_ampt_algorithm import GreenAmptAlgorithm
+from green_ampt_plugin.green_ampt_processing.green_ampt_algorithm import _PLUGIN_ROOT, GreenAmptAlgorithm
 
 __author__ = "Damien Di Vittorio"
 __date__ = "2025-10-26"
@@ -58,6 +61,194 @@ __copyright__ = "(C) 2025 by Damien Di Vittorio"
 
 __revision__ = "$Format:%H$"
 
+# What _import_green_ampt_modules hands back from green_ampt_tool.
+_GreenAmptModules = namedtuple(
+    "_GreenAmptModules", "LocalSSURGOPaths PipelineConfig run_pipeline emit_units_summary"
+)
+
+# Output subfolders that make up one cached pipeline result.
+_CACHED_OUTPUT_DIRS = ("rasters", "vectors", "raw_data")
+_CACHE_MANIFEST = "manifest.json"
+
+
+def _pipeline_cache_root():
+    """User-level folder holding cached pipeline outputs."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "green_ampt"
+
+
+def _pipeline_cache_key(aoi_layer, settings, local_files):
+    """Hash the AOI geometries and CRS, the run settings and the local input files."""
+    digest = hashlib.sha256()
+    digest.update(aoi_layer.crs().toWkt().encode())
+    for wkb in sorted(bytes(feature.geometry().asWkb()) for feature in aoi_layer.getFeatures()):
+        digest.update(wkb)
+        digest.update(b"|")
+    digest.update(json.dumps(settings, sort_keys=True).encode())
+    for path in local_files:
+        # Shapefile attributes live in the .dbf, so stamp the sidecars too.
+        stem, ext = os.path.splitext(path)
+        candidates = [path] + ([stem + ".dbf", stem + ".shx"] if ext.lower() == ".shp" else [])
+        for candidate in candidates:
+            if os.path.exists(candidate):
+                stat = os.stat(candidate)
+                digest.update(f"{candidate}|{stat.st_mtime_ns}|{stat.st_size}".encode())
+    return digest.hexdigest()
+
+
+# Above this many pixels per raster the run is refused unless ALLOW_HUGE is set;
+# one float32 band of this size is 2 GB before the feature index is counted.
+_MAX_RASTER_PIXELS = 5e8
+
+
+def _estimated_pixel_count(aoi_layer, output_crs, resolution, context):
+    """Pixels in the AOI extent on the output grid, or ``None`` if the CRS is unusable.
+
+    The pipeline grid covers the clipped soil polygons, which lie inside the
+    AOI, so this is an upper bound. ``resolution`` is in output CRS units, so
+    no metric reprojection is needed.
+    """
+    from qgis.core import QgsCoordinateReferenceSystem, QgsCoordinateTransform, QgsCsException
+
+    extent = aoi_layer.extent()
+    if output_crs:
+        target = QgsCoordinateReferenceSystem(output_crs)
+        if not target.isValid():
+            return None
+        source = aoi_layer.crs()
+        if target != source:
+            transform = QgsCoordinateTransform(source, target, context.transformContext())
+            try:
+                extent = transform.transformBoundingBox(extent)
+            except QgsCsException:
+                return None
+    return math.ceil(extent.width() / resolution) * math.ceil(extent.height() / resolution)
+
+
+def _default_simplify_tolerance(output_crs, resolution):
+    """A quarter of an output pixel, in metres, for simplifying the SDA query.
+
+    Detail finer than that is lost in rasterisation anyway. The pipeline grid
+    is in WGS84 degrees when no output CRS is given.
+    """
+    from qgis.core import QgsCoordinateReferenceSystem, QgsUnitTypes
+
+    crs = QgsCoordinateReferenceSystem(output_crs or "EPSG:4326")
+    to_metres = QgsUnitTypes.fromUnitToUnitFactor(crs.mapUnits(), QgsUnitTypes.DistanceMeters)
+    return resolution / 4.0 * to_metres
+
+
+# Raster outputs loaded into the map, in load order, with their layer names.
+_RASTER_DISPLAY_NAMES = {
+    "Ks_inhr": "Hydraulic Conductivity (Ks)",
+    "psi_in": "Suction Head (ψ)",
+    "theta_s": "Porosity (θs)",
+    "theta_i": "Initial Moisture (θi)",
+    "theta_fc": "Field Capacity (θfc)",
+    "theta_wp": "Wilting Point (θwp)",
+}
+
+# Formats run_pipeline reads as-is when the AOI layer already lives in one.
+_DIRECT_AOI_SUFFIXES = (".shp", ".gpkg", ".geojson", ".json")
+
+
+def _aoi_file_source(aoi_layer):
+    """Return ``(path, layer_name)`` when run_pipeline can read the AOI layer's own file.
+
+    Only unfiltered OGR layers backed by a single shapefile, GeoPackage or
+    GeoJSON qualify; anything else (memory or virtual layers, subset
+    filters, unsaved edits, layers addressed by id) returns ``None`` and
+    is exported.
+    """
+    if aoi_layer.dataProvider().name() != "ogr" or aoi_layer.subsetString() or aoi_layer.isModified():
+        return None
+    path, *options = aoi_layer.source().split("|")
+    if not path.lower().endswith(_DIRECT_AOI_SUFFIXES) or not os.path.isfile(path):
+        return None
+    layer_name = None
+    for option in options:
+        key, _, value = option.partition("=")
+        if key == "layername":
+            layer_name = value
+        elif key == "layerid" and value != "0":
+            return None
+    return path, layer_name
+
+
+# The exported AOI is a throwaway file in a temporary folder, so SQLite need
+# not fsync it or keep a rollback journal on disk.
+_TEMP_GPKG_GDAL_OPTIONS = {"OGR_SQLITE_SYNCHRONOUS": "OFF", "OGR_SQLITE_JOURNAL": "MEMORY"}
+
+
+@contextlib.contextmanager
+def _gdal_thread_config(options):
+    """Set GDAL config options on the current thread only, restoring them afterwards."""
+    from osgeo import gdal
+
+    previous = {key: gdal.GetThreadLocalConfigOption(key, None) for key in options}
+    for key, value in options.items():
+        gdal.SetThreadLocalConfigOption(key, value)
+    try:
+        yield
+    finally:
+        for key, value in previous.items():
+            gdal.SetThreadLocalConfigOption(key, value)
+
+
+def _progress_reporter(feedback, interval=1.0):
+    """Build a pipeline ``progress_cb`` that drives ``feedback``.
+
+    The percentage always goes through, and the multi-step feedback scales it
+    into the current step. Messages are logged at most once per ``interval``
+    seconds, plus the final one, so a fast run does not flood the log.
+    """
+    last_message = [float("-inf")]
+
+    def report(percent, message):
+        feedback.setProgress(percent)
+        now = time.monotonic()
+        if percent >= 100 or now - last_message[0] >= interval:
+            last_message[0] = now
+            feedback.pushInfo(f"  {message}")
+
+    return report
+
+
+def _scan_files(folder):
+    """Map file name to path for the regular files in ``folder`` (empty if missing)."""
+    try:
+        with os.scandir(folder) as entries:
+            return {entry.name: entry.path for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return {}
+
+
+def _restore_cached_outputs(entry, output_dir):
+    """Copy a cached result into ``output_dir``."""
+    for name in _CACHED_OUTPUT_DIRS:
+        source = entry / name
+        if source.is_dir():
+            shutil.copytree(source, Path(output_dir) / name, dirs_exist_ok=True)
+
+
+def _store_outputs_in_cache(entry, output_dir):
+    """Copy the outputs of a finished run into the cache, publishing it atomically."""
+    partial = entry.with_name(entry.name + ".partial")
+    shutil.rmtree(partial, ignore_errors=True)
+    partial.mkdir(parents=True)
+    manifest = {}
+    for name in _CACHED_OUTPUT_DIRS:
+        source = Path(output_dir) / name
+        if source.is_dir():
+            shutil.copytree(source, partial / name)
+            manifest[name] = sorted(os.listdir(partial / name))
+    (partial / _CACHE_MANIFEST).write_text(json.dumps(manifest, indent=2))
+    try:
+        os.replace(partial, entry)
+    except OSError:
+        # Another run cached the same result first; keep theirs.
+        shutil.rmtree(partial, ignore_errors=True)
+
 
 class GreenAmptSsurgo(GreenAmptAlgorithm):
     """
@@ -74,9 +265,16 @@ class GreenAmptSsurgo(GreenAmptAlgorithm):
     PARAM_METHOD = "PARAM_METHOD"
     DEPTH_LIMIT = "DEPTH_LIMIT"
     PYSDA_TIMEOUT = "PYSDA_TIMEOUT"
+    PYSDA_CHUNK_SIZE = "PYSDA_CHUNK_SIZE"
+    MAX_WORKERS = "MAX_WORKERS"
+    SIMPLIFY_TOLERANCE = "SIMPLIFY_TOLERANCE"
     EXPORT_RAW_DATA = "EXPORT_RAW_DATA"
+    RAW_DATA_FORMAT = "RAW_DATA_FORMAT"
     LOAD_VECTOR = "LOAD_VECTOR"
     LOAD_RASTERS = "LOAD_RASTERS"
+    CLEAR_CACHE = "CLEAR_CACHE"
+    BUILD_OVERVIEWS = "BUILD_OVERVIEWS"
+    ALLOW_HUGE = "ALLOW_HUGE"
     
     # Local SSURGO parameters
     MUPOLYGON = "MUPOLYGON"
@@ -84,35 +282,49 @@ class GreenAmptSsurgo(GreenAmptAlgorithm):
     COMPONENT = "COMPONENT"
     CHORIZON = "CHORIZON"
 
-    def _import_green_ampt_modules(self):
+    # Enum index -> pipeline setting, in the order the options are listed
+    _DATA_SOURCE_TABLE = ("pysda", "local")
+    _RAW_DATA_FORMAT_TABLE = ("csv", "parquet")
+    # Enum index -> (param_method, use_lookup_table, use_hsg_lookup)
+    _PARAM_METHOD_TABLE = (
+        ("lookup", True, False),
+        ("hsg", False, True),
+        ("pedotransfer", False, False),
+    )
+
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def _import_green_ampt_modules(cls):
         """
-        Lazy import of green_ampt_tool modules to avoid import errors at plugin load time
+        Lazy import of green_ampt_tool modules to avoid import errors at plugin load time.
+        
+        The result is cached, so the path search and imports run once per QGIS session.
         """
-        # Add the green-ampt-estimation directory to the path
-        cmd_folder = os.path.split(inspect.getfile(inspect.currentframe()))[0]
-        plugin_folder = os.path.dirname(os.path.dirname(cmd_folder))
-
-        # Try embedded location first (for deployed plugin), then development location
-        green_ampt_estimation_paths = [
-            plugin_folder,  # Plugin folder itself (where symlink is)
-            os.path.join(plugin_folder, "green_ampt_estimation"),  # Embedded in plugin
-            os.path.join(os.path.dirname(os.path.dirname(plugin_folder)), "green-ampt-estimation")  # Development
-        ]
+        # Add the green-ampt-estimation directory to the path unless it is already importable
+        if importlib.util.find_spec("green_ampt_tool") is None:
+            plugin_folder = str(_PLUGIN_ROOT)
+
+            # Try embedded location first (for deployed plugin), then development location
+            green_ampt_estimation_paths = [
+                plugin_folder,  # Plugin folder itself (where symlink is)
+                os.path.join(plugin_folder, "green_ampt_estimation"),  # Embedded in plugin
+                os.path.join(os.path.dirname(os.path.dirname(plugin_folder)), "green-ampt-estimation")  # Development
+            ]
 
-        green_ampt_estimation_path = None
-        for path in green_ampt_estimation_paths:
-            if os.path.exists(os.path.join(path, "green_ampt_tool")):
-                green_ampt_estimation_path = path
-                break
+            green_ampt_estimation_path = None
+            for path in green_ampt_estimation_paths:
+                if os.path.exists(os.path.join(path, "green_ampt_tool")):
+                    green_ampt_estimation_path = path
+                    break
 
-        if green_ampt_estimation_path and green_ampt_estimation_path not in sys.path:
-            sys.path.insert(0, green_ampt_estimation_path)
+            if green_ampt_estimation_path and green_ampt_estimation_path not in sys.path:
+                sys.path.insert(0, green_ampt_estimation_path)
         
         try:
             from green_ampt_tool.config import LocalSSURGOPaths, PipelineConfig
             from green_ampt_tool.workflow import run_pipeline
             from green_ampt_tool.parameters import emit_units_summary
-            return LocalSSURGOPaths, PipelineConfig, run_pipeline, emit_units_summary
+            return _GreenAmptModules(LocalSSURGOPaths, PipelineConfig, run_pipeline, emit_units_summary)
         except ImportError as e:
             raise ImportError(f"Failed to import green_ampt_tool modules: {e}. Make sure green-ampt-estimation is available.")
 
@@ -220,6 +432,40 @@ class GreenAmptSsurgo(GreenAmptAlgorithm):
             )
         )
         
+        # Split the SDA spatial query by AOI feature (0 = whole AOI in one request)
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                self.PYSDA_CHUNK_SIZE,
+                self.tr("PySDA AOI features per request (0 = whole AOI)"),
+                type=QgsProcessingParameterNumber.Integer,
+                defaultValue=0,
+                minValue=0,
+            )
+        )
+        
+        # Concurrent SDA requests (spatial chunks and tabular batches)
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                self.MAX_WORKERS,
+                self.tr("PySDA concurrent requests"),
+                type=QgsProcessingParameterNumber.Integer,
+                defaultValue=4,
+                minValue=1,
+                maxValue=16,
+            )
+        )
+        
+        # Simplify the geometry sent to SDA (-1 = a quarter of the output resolution, 0 = off)
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                self.SIMPLIFY_TOLERANCE,
+                self.tr("PySDA query simplification in metres (-1 = resolution / 4, 0 = off)"),
+                type=QgsProcessingParameterNumber.Double,
+                defaultValue=-1,
+                minValue=-1,
+            )
+        )
+        
         # Export raw data option
         self.addParameter(
             QgsProcessingParameterBoolean(
@@ -229,6 +475,37 @@ class GreenAmptSsurgo(GreenAmptAlgorithm):
             )
         )
         
+        # Raw data format (Parquet needs pyarrow in the QGIS Python environment)
+        self.addParameter(
+            QgsProcessingParameterEnum(
+                self.RAW_DATA_FORMAT,
+                self.tr("Raw SSURGO Data Format"),
+                options=[
+                    self.tr("CSV (shapefile + text, compatible)"),
+                    self.tr("Parquet (smaller and faster, requires pyarrow)")
+                ],
+                defaultValue=0,
+            )
+        )
+        
+        # Overviews let QGIS read only the zoom level it draws
+        self.addParameter(
+            QgsProcessingParameterBoolean(
+                self.BUILD_OVERVIEWS,
+                self.tr("Build raster overviews (faster pan/zoom)"),
+                defaultValue=True,
+            )
+        )
+        
+        # Guard against AOIs whose rasters would not fit in memory
+        self.addParameter(
+            QgsProcessingParameterBoolean(
+                self.ALLOW_HUGE,
+                self.tr("Allow rasters over 500 million pixels (very large AOIs)"),
+                defaultValue=False,
+            )
+        )
+        
         # Local SSURGO file parameters (optional, shown when Local is selected)
         self.addParameter(
             QgsProcessingParameterFile(
@@ -286,11 +563,26 @@ class GreenAmptSsurgo(GreenAmptAlgorithm):
                 defaultValue=False,
             )
         )
+        
+        # Results are cached per AOI and settings; clearing forces a fresh run
+        self.addParameter(
+            QgsProcessingParameterBoolean(
+                self.CLEAR_CACHE,
+                self.tr("Clear cached results before running"),
+                defaultValue=False,
+            )
+        )
 
     def processAlgorithm(self, parameters, context, feedback):
         """
         Main algorithm processing
         """
+        from qgis.core import (
+            QgsProcessingException,
+            QgsProcessingMultiStepFeedback,
+            QgsProcessingUtils,
+            QgsVectorFileWriter,
+        )
         
         # Import green_ampt_tool modules (lazy loading)
         LocalSSURGOPaths, PipelineConfig, run_pipeline, emit_units_summary = self._import_green_ampt_modules()
@@ -310,147 +602,212 @@ class GreenAmptSsurgo(GreenAmptAlgorithm):
         param_method_idx = self.parameterAsEnum(parameters, self.PARAM_METHOD, context)
         depth_limit = self.parameterAsDouble(parameters, self.DEPTH_LIMIT, context)
         pysda_timeout = self.parameterAsInt(parameters, self.PYSDA_TIMEOUT, context)
+        pysda_chunk_size = self.parameterAsInt(parameters, self.PYSDA_CHUNK_SIZE, context)
+        max_workers = self.parameterAsInt(parameters, self.MAX_WORKERS, context)
+        simplify_tolerance = self.parameterAsDouble(parameters, self.SIMPLIFY_TOLERANCE, context)
         export_raw_data = self.parameterAsBool(parameters, self.EXPORT_RAW_DATA, context)
+        raw_data_format_idx = self.parameterAsEnum(parameters, self.RAW_DATA_FORMAT, context)
         load_vector = self.parameterAsBool(parameters, self.LOAD_VECTOR, context)
         load_rasters = self.parameterAsBool(parameters, self.LOAD_RASTERS, context)
+        clear_cache = self.parameterAsBool(parameters, self.CLEAR_CACHE, context)
+        build_overviews = self.parameterAsBool(parameters, self.BUILD_OVERVIEWS, context)
+        allow_huge = self.parameterAsBool(parameters, self.ALLOW_HUGE, context)
         
         feedback.setCurrentStep(1)
         feedback.pushInfo(f"AOI Layer: {aoi_layer.name()}")
         feedback.pushInfo(f"Output Directory: {output_dir}")
         
         # Map indices to values
-        data_source = "pysda" if data_source_idx == 0 else "local"
-        param_methods = ["lookup", "hsg", "pedotransfer"]
-        param_method = param_methods[param_method_idx]
-        
-        use_lookup_table = param_method == "lookup"
-        use_hsg_lookup = param_method == "hsg"
+        data_source = self._DATA_SOURCE_TABLE[data_source_idx]
+        raw_data_format = self._RAW_DATA_FORMAT_TABLE[raw_data_format_idx]
+        param_method, use_lookup_table, use_hsg_lookup = self._PARAM_METHOD_TABLE[param_method_idx]
         
         feedback.pushInfo(f"Data Source: {data_source}")
         feedback.pushInfo(f"Parameter Method: {param_method}")
         
-        # Export AOI to temporary shapefile
-        feedback.setCurrentStep(2)
-        feedback.pushInfo("Exporting AOI layer to temporary file...")
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            aoi_path = os.path.join(temp_dir, "aoi.shp")
+        # Handle local SSURGO files if needed
+        local_paths = None
+        if data_source == "local":
+            feedback.pushDebugInfo("Preparing local SSURGO file paths...")
             
-            feedback.pushInfo(f"Temporary directory: {temp_dir}")
-            feedback.pushInfo(f"AOI will be exported to: {aoi_path}")
-            feedback.pushInfo(f"AOI layer is valid: {aoi_layer.isValid()}")
-            feedback.pushInfo(f"AOI layer feature count: {aoi_layer.featureCount()}")
+            mupolygon = self.parameterAsFile(parameters, self.MUPOLYGON, context)
+            mapunit = self.parameterAsFile(parameters, self.MAPUNIT, context)
+            component = self.parameterAsFile(parameters, self.COMPONENT, context)
+            chorizon = self.parameterAsFile(parameters, self.CHORIZON, context)
             
-            # Configure save options for Shapefile format
-            save_options = QgsVectorFileWriter.SaveVectorOptions()
-            save_options.driverName = "ESRI Shapefile"
-            save_options.fileEncoding = "UTF-8"
+            if not all([mupolygon, mapunit, component, chorizon]):
+                raise QgsProcessingException(
+                    "When using local data source, all SSURGO files must be provided: "
+                    "mupolygon, mapunit, component, chorizon"
+                )
             
-            error = QgsVectorFileWriter.writeAsVectorFormatV3(
-                aoi_layer,
-                aoi_path,
-                context.transformContext(),
-                save_options
+            local_paths = LocalSSURGOPaths(
+                mupolygon=mupolygon,
+                mapunit=mapunit,
+                component=component,
+                chorizon=chorizon,
             )
+        
+        # Handle output CRS
+        if output_crs and output_crs.strip():
+            # User provided a CRS
+            config_crs = output_crs.strip()
+        else:
+            # Use AOI CRS
+            config_crs = None
+        
+        if simplify_tolerance < 0:
+            simplify_tolerance = _default_simplify_tolerance(config_crs, output_resolution)
+        
+        # Fail fast when the output grid would be too large to rasterise
+        pixels = _estimated_pixel_count(aoi_layer, config_crs, output_resolution, context)
+        if pixels is not None and pixels > _MAX_RASTER_PIXELS:
+            tiles = math.ceil(pixels / _MAX_RASTER_PIXELS)
+            message = (
+                f"The AOI extent at {output_resolution} CRS units per pixel gives about "
+                f"{pixels:.3g} pixels per raster; split the AOI into at least {tiles} parts "
+                f"or use a coarser resolution."
+            )
+            if not allow_huge:
+                raise QgsProcessingException(message + " Tick 'Allow rasters over 500 million pixels' to run anyway.")
+            feedback.reportError(message, fatalError=False)
+        
+        # Every setting that changes the outputs; the timeout, request chunking
+        # and output folder do not, so they are left out of the cache key.
+        settings = {
+            "output_resolution": output_resolution,
+            "output_crs": config_crs,
+            "output_prefix": output_prefix,
+            "data_source": data_source,
+            "param_method": param_method,
+            "depth_limit_cm": depth_limit,
+            "export_raw_data": export_raw_data,
+            "raw_data_format": raw_data_format if export_raw_data else None,
+            "build_overviews": build_overviews,
+            "pysda_simplify_tolerance": simplify_tolerance if data_source == "pysda" else 0,
+        }
+        local_files = [mupolygon, mapunit, component, chorizon] if local_paths else []
+        
+        if clear_cache:
+            feedback.pushInfo("Clearing cached pipeline outputs...")
+            shutil.rmtree(_pipeline_cache_root(), ignore_errors=True)
+        cache_entry = _pipeline_cache_root() / _pipeline_cache_key(aoi_layer, settings, local_files)
+        
+        if (cache_entry / _CACHE_MANIFEST).exists():
+            feedback.setCurrentStep(4)
+            feedback.pushInfo(f"Reusing cached outputs from {cache_entry}")
+            _restore_cached_outputs(cache_entry, output_dir)
+        else:
+            feedback.setCurrentStep(2)
+            aoi_source = _aoi_file_source(aoi_layer)
             
-            feedback.pushInfo(f"Export error code: {error[0]}")
-            if len(error) > 1:
-                feedback.pushInfo(f"Export error message: {error[1]}")
-            
-            if error[0] != QgsVectorFileWriter.NoError:
-                raise QgsProcessingException(f"Failed to export AOI: {error[1]}")
-            
-            feedback.pushInfo(f"AOI exported to: {aoi_path}")
-            
-            # List files in temp directory
-            temp_files = os.listdir(temp_dir)
-            feedback.pushInfo(f"Files in temp directory: {temp_files}")
-            
-            # Verify the file was created and exists
-            if not os.path.exists(aoi_path):
-                raise QgsProcessingException(f"AOI file was not created: {aoi_path}")
-            
-            feedback.pushInfo(f"AOI file verified, size: {os.path.getsize(aoi_path)} bytes")
-            
-            # Handle local SSURGO files if needed
-            local_paths = None
-            if data_source == "local":
-                feedback.pushInfo("Preparing local SSURGO file paths...")
+            # The AOI copy lives only as long as run_pipeline needs it, under the
+            # Processing temporary folder (set in Processing options, else TMPDIR).
+            # File-backed layers are read in place and need no copy.
+            if aoi_source is None:
+                temp_context = tempfile.TemporaryDirectory(dir=QgsProcessingUtils.tempFolder())
+            else:
+                temp_context = contextlib.nullcontext()
+            with temp_context as temp_dir:
+                if aoi_source is not None:
+                    aoi_path, aoi_layer_name = aoi_source
+                    feedback.pushInfo(f"Reading AOI directly from: {aoi_path}")
+                else:
+                    # Export AOI to a temporary GeoPackage (one file, no field-name truncation)
+                    feedback.pushInfo("Exporting AOI layer to temporary file...")
+                    aoi_path = os.path.join(temp_dir, "aoi.gpkg")
+                    aoi_layer_name = "aoi"
+                    
+                    feedback.pushDebugInfo(f"AOI layer feature count: {aoi_layer.featureCount()}")
+                    
+                    save_options = QgsVectorFileWriter.SaveVectorOptions()
+                    save_options.driverName = "GPKG"
+                    save_options.layerName = aoi_layer_name
+                    save_options.fileEncoding = "UTF-8"
+                    save_options.layerOptions = ["SPATIAL_INDEX=YES"]
+                    # The pipeline only uses AOI geometry, so attribute values
+                    # are neither copied nor written
+                    save_options.skipAttributeCreation = True
+                    # Lets Cancel interrupt the export of a large AOI
+                    save_options.feedback = feedback
+
+                    with _gdal_thread_config(_TEMP_GPKG_GDAL_OPTIONS):
+                        error = QgsVectorFileWriter.writeAsVectorFormatV3(
+                            aoi_layer,
+                            aoi_path,
+                            context.transformContext(),
+                            save_options
+                        )
+                    
+                    if error[0] != QgsVectorFileWriter.NoError:
+                        raise QgsProcessingException(f"Failed to export AOI: {error[1]}")
+                    
+                    feedback.pushDebugInfo(f"AOI exported to: {aoi_path}")
                 
-                mupolygon = self.parameterAsFile(parameters, self.MUPOLYGON, context)
-                mapunit = self.parameterAsFile(parameters, self.MAPUNIT, context)
-                component = self.parameterAsFile(parameters, self.COMPONENT, context)
-                chorizon = self.parameterAsFile(parameters, self.CHORIZON, context)
+                # Build configuration
+                feedback.setCurrentStep(3)
+                feedback.pushDebugInfo("Building pipeline configuration...")
                 
-                if not all([mupolygon, mapunit, component, chorizon]):
-                    raise QgsProcessingException(
-                        "When using local data source, all SSURGO files must be provided: "
-                        "mupolygon, mapunit, component, chorizon"
-                    )
+                config = PipelineConfig(
+                    aoi_path=aoi_path,
+                    aoi_layer=aoi_layer_name,
+                    output_dir=output_dir,
+                    output_resolution=output_resolution,
+                    output_crs=config_crs,
+                    output_prefix=output_prefix,
+                    data_source=data_source,
+                    local_ssurgo=local_paths,
+                    pysda_timeout=pysda_timeout,
+                    pysda_chunk_size=pysda_chunk_size or None,
+                    pysda_max_workers=max_workers,
+                    pysda_simplify_tolerance=simplify_tolerance or None,
+                    depth_limit_cm=depth_limit,
+                    export_raw_data=export_raw_data,
+                    raw_data_format=raw_data_format,
+                    raw_data_dir=None,  # Will use default: output_dir/raw_data
+                    use_lookup_table=use_lookup_table,
+                    use_hsg_lookup=use_hsg_lookup,
+                    build_overviews=build_overviews,
+                    # Processing already runs this on a worker thread, so the
+                    # pipeline can poll the dialog's Cancel button directly.
+                    cancel_check=feedback.isCanceled,
+                    progress_cb=_progress_reporter(feedback),
+                )
                 
-                local_paths = LocalSSURGOPaths(
-                    mupolygon=Path(mupolygon),
-                    mapunit=Path(mapunit),
-                    component=Path(component),
-                    chorizon=Path(chorizon),
+                # Run the pipeline
+                feedback.setCurrentStep(4)
+                feedback.pushInfo(
+                    "Running Green-Ampt parameter generation pipeline...\n"
+                    "This may take several minutes depending on AOI size and data source..."
                 )
-            
-            # Build configuration
-            feedback.setCurrentStep(3)
-            feedback.pushInfo("Building pipeline configuration...")
-            
-            # Final check that AOI file still exists before creating config
-            if not os.path.exists(aoi_path):
-                raise QgsProcessingException(f"AOI file disappeared before config creation: {aoi_path}")
-            
-            # Handle output CRS
-            if output_crs and output_crs.strip():
-                # User provided a CRS
-                config_crs = output_crs.strip()
-            else:
-                # Use AOI CRS
-                config_crs = None
-            
-            config = PipelineConfig(
-                aoi_path=Path(aoi_path),
-                aoi_layer=None,
-                output_dir=Path(output_dir),
-                output_resolution=output_resolution,
-                output_crs=config_crs,
-                output_prefix=output_prefix,
-                data_source=data_source,
-                local_ssurgo=local_paths,
-                pysda_timeout=pysda_timeout,
-                depth_limit_cm=depth_limit,
-                export_raw_data=export_raw_data,
-                raw_data_dir=None,  # Will use default: output_dir/raw_data
-                use_lookup_table=use_lookup_table,
-                use_hsg_lookup=use_hsg_lookup,
-            )
-            
-            # Run the pipeline
-            feedback.setCurrentStep(4)
-            feedback.pushInfo("Running Green-Ampt parameter generation pipeline...")
-            feedback.pushInfo("This may take several minutes depending on AOI size and data source...")
+                
+                try:
+                    run_pipeline(config)
+                except Exception as e:
+                    if feedback.isCanceled():
+                        raise QgsProcessingException("Cancelled by user")
+                    raise QgsProcessingException(f"Pipeline execution failed: {str(e)}")
             
             try:
-                run_pipeline(config)
-            except Exception as e:
-                raise QgsProcessingException(f"Pipeline execution failed: {str(e)}")
-            
-            feedback.setCurrentStep(5)
-            feedback.pushInfo("Pipeline completed successfully!")
-            
-            # Report output units
-            feedback.pushInfo("\nOutput attribute units:")
-            for key, description in emit_units_summary().items():
-                feedback.pushInfo(f"  - {key}: {description}")
-            
-            feedback.pushInfo(f"\nOutputs saved to: {output_dir}")
-            feedback.pushInfo(f"  - Rasters: {output_dir}/rasters/")
-            feedback.pushInfo(f"  - Vectors: {output_dir}/vectors/")
-            if export_raw_data:
-                feedback.pushInfo(f"  - Raw SSURGO data: {output_dir}/raw_data/")
+                _store_outputs_in_cache(cache_entry, output_dir)
+            except OSError as e:
+                feedback.reportError(f"Could not cache pipeline outputs: {e}", fatalError=False)
+        
+        feedback.setCurrentStep(5)
+        feedback.pushInfo("Pipeline completed successfully!")
+        
+        # Report output units and locations in one message each
+        unit_lines = [f"  - {key}: {description}" for key, description in emit_units_summary().items()]
+        feedback.pushInfo("\n".join(["\nOutput attribute units:"] + unit_lines))
+        
+        output_lines = [
+            f"\nOutputs saved to: {output_dir}",
+            f"  - Rasters: {output_dir}/rasters/",
+            f"  - Vectors: {output_dir}/vectors/",
+        ]
+        if export_raw_data:
+            output_lines.append(f"  - Raw SSURGO data: {output_dir}/raw_data/")
+        feedback.pushInfo("\n".join(output_lines))
         
         # Load output layers in map if requested
         feedback.pushInfo("\nLoading resulting layers")
@@ -460,57 +817,64 @@ class GreenAmptSsurgo(GreenAmptAlgorithm):
     
     def _load_output_layers(self, output_dir, output_prefix, load_vector, load_rasters, feedback, context):
         """Load output layers into the QGIS map"""
-        import glob
-        from pathlib import Path
+        from qgis.core import QgsProject, QgsRasterLayer, QgsVectorLayer
         
         # Build prefix for file matching
         prefix = f"{output_prefix}_" if output_prefix else ""
         
+        # Layers are collected and registered with the project in one call,
+        # so layersAdded fires once instead of once per layer.
+        layers = []
+        failed = []
+        
         # Load vector outputs
         if load_vector:
-            vector_dir = Path(output_dir) / "vectors"
-            if vector_dir.exists():
-                # Look for Green-Ampt parameter shapefile
-                pattern = f"{prefix}green_ampt_params*.shp"
-                vector_files = list(vector_dir.glob(pattern))
+            # Look for Green-Ampt parameter shapefile
+            vector_files = _scan_files(Path(output_dir) / "vectors")
+            for name in sorted(vector_files):
+                if not (name.startswith(f"{prefix}green_ampt_params") and name.endswith(".shp")):
+                    continue
+                layer_name = f"Green-Ampt Parameters ({os.path.splitext(name)[0]})"
+                vector_layer = QgsVectorLayer(vector_files[name], layer_name, "ogr")
                 
-                for vector_file in vector_files:
-                    layer_name = f"Green-Ampt Parameters ({vector_file.stem})"
-                    vector_layer = QgsVectorLayer(str(vector_file), layer_name, "ogr")
-                    
-                    if vector_layer.isValid():
-                        QgsProject.instance().addMapLayer(vector_layer)
-                        feedback.pushInfo(f"  ✓ Loaded vector: {layer_name}")
-                    else:
-                        feedback.pushInfo(f"  ⚠ Failed to load vector: {vector_file}")
+                if vector_layer.isValid():
+                    layers.append(vector_layer)
+                else:
+                    failed.append(vector_files[name])
         
         # Load raster outputs
         if load_rasters:
-            raster_dir = Path(output_dir) / "rasters"
-            if raster_dir.exists():
-                # Define expected raster parameters (actual output names)
-                raster_params = {
-                    "Ks_inhr": "Hydraulic Conductivity (Ks)",
-                    "psi_in": "Suction Head (ψ)",
-                    "theta_s": "Porosity (θs)",
-                    "theta_i": "Initial Moisture (θi)",
-                    "theta_fc": "Field Capacity (θfc)",
-                    "theta_wp": "Wilting Point (θwp)"
-                }
+            # One directory scan, then each expected file name is a dict lookup
+            raster_files = _scan_files(Path(output_dir) / "rasters")
+            expected = {
+                f"{prefix}{param_key}_green_ampt.tif": display_name
+                for param_key, display_name in _RASTER_DISPLAY_NAMES.items()
+            }
+            for name, display_name in expected.items():
+                raster_path = raster_files.get(name)
+                if raster_path is None:
+                    continue
+                layer_name = f"{display_name} ({os.path.splitext(name)[0]})"
+                raster_layer = QgsRasterLayer(raster_path, layer_name)
                 
-                for param_key, display_name in raster_params.items():
-                    pattern = f"{prefix}{param_key}_green_ampt.tif"
-                    raster_files = list(raster_dir.glob(pattern))
-                    
-                    for raster_file in raster_files:
-                        layer_name = f"{display_name} ({raster_file.stem})"
-                        raster_layer = QgsRasterLayer(str(raster_file), layer_name)
-                        
-                        if raster_layer.isValid():
-                            QgsProject.instance().addMapLayer(raster_layer)
-                            feedback.pushInfo(f"  ✓ Loaded raster: {layer_name}")
-                        else:
-                            feedback.pushInfo(f"  ⚠ Failed to load raster: {raster_file}")
+                if raster_layer.isValid():
+                    layers.append(raster_layer)
+                else:
+                    failed.append(raster_path)
+        
+        if layers:
+            # Register without legend nodes, then place them at the top of the
+            # layer tree in load order: the vector above the rasters, Ks first.
+            QgsProject.instance().addMapLayers(layers, False)
+            root = QgsProject.instance().layerTreeRoot()
+            for position, layer in enumerate(layers):
+                root.insertLayer(position, layer)
+        
+        # One summary line; failures are listed since they need attention
+        total = len(layers) + len(failed)
+        feedback.pushInfo(f"  ✓ Loaded {len(layers)}/{total} layers ({len(failed)} failures)")
+        for path in failed:
+            feedback.pushInfo(f"  ⚠ Failed to load: {path}")
 
     def name(self):
         """
@@ -576,5 +940,6 @@ class GreenAmptSsurgo(GreenAmptAlgorithm):
             </ul>
             
             <b>Note:</b> For PySDA data source, internet access is required. Processing time varies based on AOI size.
+            Results are cached per AOI and settings under ~/.cache/green_ampt, so repeat runs copy the earlier outputs; tick "Clear cached results" to fetch fresh SSURGO data.
             """
         )
@@ -20,16 +20,18 @@
  *                                                                         *
  ***************************************************************************/
 """
-import inspect
-import os
 import sys
+from pathlib import Path
 
 from qgis.core import QgsProcessingAlgorithm
 from qgis.PyQt.QtCore import QCoreApplication
 from qgis.PyQt.QtGui import QIcon
 
-cmd_folder = os.path.split(inspect.getfile(inspect.currentframe()))[0]
-sys.path.append(cmd_folder)
+# Resolved once at import; icon() and the algorithms reuse these paths.
+_HERE = Path(__file__).resolve().parent
+_PLUGIN_ROOT = _HERE.parent
+
+sys.path.append(str(_HERE))
 
 __author__ = "Damien Di Vittorio"
 __date__ = "2025-10-26"
@@ -49,6 +51,10 @@ class GreenAmptAlgorithm(QgsProcessingAlgorithm):
     OUTPUT = "OUTPUT"
     INPUT = "INPUT"
 
+    # Shared by every algorithm instance; built on first use since decoding
+    # the pixmap reads icon.png from disk.
+    _icon = None
+
     def __init__(self):
         super().__init__()
 
@@ -62,9 +68,9 @@ class GreenAmptAlgorithm(QgsProcessingAlgorithm):
         return self.__class__()
 
     def icon(self):
-        cmd_folder = os.path.split(inspect.getfile(inspect.currentframe()))[0]
-        icon = QIcon(os.path.join(os.path.dirname(cmd_folder), "icon.png"))
-        return icon
+        if GreenAmptAlgorithm._icon is None:
+            GreenAmptAlgorithm._icon = QIcon(str(_PLUGIN_ROOT / "icon.png"))
+        return GreenAmptAlgorithm._icon
 
     def flags(self):
         return super().flags()
@@ -29,14 +29,12 @@ __copyright__ = "(C) 2025 by Damien Di Vittorio"
 
 __revision__ = "$Format:%H$"
 
-import inspect
-import os
-
 from qgis.core import QgsProcessingProvider
 from qgis.PyQt.QtGui import QIcon
 
 from green_ampt_plugin.green_ampt_processing import algorithms
 from green_ampt_plugin.green_ampt_processing.green_ampt_algorithm import (
+    _PLUGIN_ROOT,
     GreenAmptAlgorithm,
 )
 
@@ -86,9 +84,7 @@ class GreenAmptProvider(QgsProcessingProvider):
         Should return a QIcon which is used for your provider inside
         the Processing toolbox.
         """
-        cmd_folder = os.path.split(inspect.getfile(inspect.currentframe()))[0]
-        icon = QIcon(os.path.join(os.path.join(os.path.dirname(cmd_folder), "icon.png")))
-        return icon
+        return QIcon(str(_PLUGIN_ROOT / "icon.png"))
 
     def longName(self):
         """
@@ -23,12 +23,16 @@ Examples:
     
     # Run tests that don't require QGIS
     python run_tests.py --no-qgis
+    
+    # Run pytest in a separate interpreter (in-process by default)
+    python run_tests.py --subprocess
 """
 
 import sys
 import os
 import argparse
 import subprocess
+from importlib.util import find_spec
 from pathlib import Path
 
 
@@ -115,6 +119,11 @@ def main():
         action='store_true',
         help='Skip slow tests'
     )
+    parser.add_argument(
+        '--subprocess',
+        action='store_true',
+        help='Run pytest in a separate interpreter instead of in-process'
+    )
     
     args = parser.parse_args()
     
@@ -170,8 +179,12 @@ def main():
     # Run tests
     print(f"Running command: {' '.join(cmd)}")
     try:
-        result = subprocess.run(cmd, check=False)
-        return result.returncode
+        if args.subprocess:
+            result = subprocess.run(cmd, check=False)
+            return result.returncode
+        # In-process by default: no second interpreter start-up or pytest bootstrap
+        import pytest
+        return int(pytest.main(cmd[3:]))
     except KeyboardInterrupt:
         print("\\nTests interrupted by user")
         return 1
@@ -210,16 +223,13 @@ def check_dependencies():
     missing_required = []
     missing_optional = []
     
+    # find_spec only locates each package; nothing is imported or executed
     for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
+        if find_spec(package) is None:
             missing_required.append(package)
     
     for package in optional_packages:
-        try:
-            __import__(package.replace('-', '_'))
-        except ImportError:
+        if find_spec(package.replace('-', '_')) is None:
             missing_optional.append(package)
     
     if missing_required:
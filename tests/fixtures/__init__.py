@@ -3,6 +3,7 @@
 import json
 import tempfile
 from pathlib import Path
+from types import MappingProxyType
 from unittest.mock import Mock, patch
 import pytest
 
@@ -109,19 +110,40 @@ def mock_qgis_environment():
             'raster_layer': mock_raster
         }
 
+@pytest.fixture(scope="session")
+def mock_aoi_file(tmp_path_factory):
+    """Path of a mock AOI GeoJSON, written once per test session."""
+    return create_mock_aoi_file(temp_dir=tmp_path_factory.mktemp("aoi", numbered=False))
+
+@pytest.fixture(scope="session")
+def mock_ssurgo_data():
+    """Read-only mock SSURGO tables shared by the whole session.
+
+    Use ``mock_ssurgo_data_mutable`` in tests that modify the tables.
+    """
+    return MappingProxyType({
+        table: MappingProxyType({column: tuple(values) for column, values in columns.items()})
+        for table, columns in create_mock_ssurgo_data().items()
+    })
+
+@pytest.fixture
+def mock_ssurgo_data_mutable():
+    """A fresh, modifiable copy of the mock SSURGO tables for each test."""
+    return create_mock_ssurgo_data()
+
 @pytest.fixture
 def temp_output_dir():
     """Create temporary directory for test outputs."""
     with tempfile.TemporaryDirectory() as temp_dir:
         yield Path(temp_dir)
 
-@pytest.fixture  
-def mock_algorithm_parameters():
-    """Mock algorithm parameters for testing."""
-    return {
-        'AOI': create_mock_aoi_file(),
+@pytest.fixture(scope="session")
+def mock_algorithm_parameters(mock_aoi_file):
+    """Read-only mock algorithm parameters shared by the whole session."""
+    return MappingProxyType({
+        'AOI': mock_aoi_file,
         'OUTPUT_DIR': '/tmp/test_output',
         'TEXTURE_METHOD': 'lookup',
         'LOAD_VECTOR': True,
         'LOAD_RASTERS': False
-    }
\ No newline at end of file
+    })
\ No newline at end of file
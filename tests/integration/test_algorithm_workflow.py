@@ -4,9 +4,10 @@ import unittest
 from unittest.mock import Mock, patch, MagicMock
 import sys
 from pathlib import Path
-import tempfile
 import json
 
+import pytest
+
 # Add paths for testing
 plugin_path = Path(__file__).parent.parent.parent / "green_ampt_plugin"
 green_ampt_path = Path(__file__).parent.parent.parent / "green-ampt-estimation"
@@ -17,10 +18,11 @@ sys.path.insert(0, str(green_ampt_path))
 class TestAlgorithmWorkflow(unittest.TestCase):
     """Test complete algorithm execution workflow."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.output_dir = Path(self.temp_dir) / "output"
+    @pytest.fixture(autouse=True)
+    def _set_up(self, tmp_path):
+        """Set up test fixtures in pytest's tmp_path, which pytest cleans up itself."""
+        self.temp_dir = str(tmp_path)
+        self.output_dir = tmp_path / "output"
         self.output_dir.mkdir()
         
         # Create test AOI file
@@ -35,11 +37,6 @@ class TestAlgorithmWorkflow(unittest.TestCase):
             'LOAD_RASTERS': False
         }
         
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-        
     def create_test_aoi(self):
         """Create a test AOI file."""
         aoi_data = {
@@ -189,17 +186,13 @@ class TestAlgorithmWorkflow(unittest.TestCase):
 class TestOutputGeneration(unittest.TestCase):
     """Test output generation and file creation."""
     
-    def setUp(self):
-        """Set up test fixtures.""" 
-        self.temp_dir = tempfile.mkdtemp()
-        self.output_dir = Path(self.temp_dir) / "output"
+    @pytest.fixture(autouse=True)
+    def _set_up(self, tmp_path):
+        """Set up test fixtures in pytest's tmp_path, which pytest cleans up itself."""
+        self.temp_dir = str(tmp_path)
+        self.output_dir = tmp_path / "output"
         self.output_dir.mkdir()
         
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-        
     def test_vector_output_creation(self):
         """Test vector output file creation."""
         vector_file = self.output_dir / "green_ampt_parameters.shp"